@@ -3,5 +3,6 @@
 Created on 15/11/2024 at 12:18:24(+00:00).
 """
 
+from .drain_mail_outbox import DrainMailOutbox
 from .load_fixtures import LoadFixtures
 from .summarize_fixtures import SummarizeFixtures
@@ -0,0 +1,200 @@
+"""
+© Ocado Group
+Created on 19/10/2026 at 20:58:10(+01:00).
+"""
+
+import typing as t
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass
+from time import perf_counter
+
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+
+from .. import mail
+
+
+@dataclass
+class MailBenchmark:
+    """The throughput and latencies of calling a mail helper many times."""
+
+    action: str
+    wall_time: float  # The seconds all of the calls took.
+    latencies: t.List[float]  # The seconds each successful call took.
+    errors: t.Dict[str, int]  # The number of failed calls per error.
+
+    @property
+    def throughput(self):
+        """The number of calls per second."""
+        calls = len(self.latencies) + sum(self.errors.values())
+        return calls / self.wall_time if self.wall_time else 0.0
+
+    def percentile(self, percent: float):
+        """Get a percentile of the latencies of the successful calls.
+
+        Args:
+            percent: The percentile, between 0 and 100.
+
+        Returns:
+            The latency, in seconds, or None if no call succeeded.
+        """
+        if not self.latencies:
+            return None
+
+        latencies = sorted(self.latencies)
+        index = round(percent / 100 * (len(latencies) - 1))
+        return latencies[index]
+
+
+# pylint: disable-next=missing-class-docstring
+class BenchmarkMail(BaseCommand):
+    help = (
+        "Measures the throughput and tail latency of the mail helpers against"
+        " a local stand-in for Dotdigital's API."
+    )
+
+    actions: t.Dict[str, t.Callable[[int], t.Any]] = {
+        "send_mail": lambda i: mail.send_mail(
+            campaign_id=1, to_addresses=[f"benchmark{i}@codeforlife.com"]
+        ),
+        "add_contact": lambda i: mail.add_contact(
+            f"benchmark{i}@codeforlife.com"
+        ),
+    }
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--actions",
+            nargs="+",
+            choices=list(self.actions),
+            default=list(self.actions),
+            help="The mail helpers to benchmark.",
+        )
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=200,
+            help="The number of calls to make to each mail helper.",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=mail.MAX_WORKERS,
+            help="The number of calls to make at the same time.",
+        )
+        parser.add_argument(
+            "--latency",
+            type=float,
+            default=0.05,
+            help="The seconds the stand-in server waits before responding.",
+        )
+        parser.add_argument(
+            "--error-rate",
+            type=float,
+            default=0,
+            help="The probability of the stand-in server responding with an"
+            " error.",
+        )
+        parser.add_argument(
+            "--url",
+            help="The base URL of the API to benchmark instead of starting a"
+            " stand-in server.",
+        )
+
+    def benchmark(self, action: str, requests: int, concurrency: int):
+        """Call a mail helper many times at the same time.
+
+        Args:
+            action: The name of the mail helper to call.
+            requests: The number of calls to make.
+            concurrency: The number of calls to make at the same time.
+
+        Returns:
+            The benchmark of the mail helper.
+        """
+        call = self.actions[action]
+
+        def timed_call(i: int):
+            start = perf_counter()
+            try:
+                call(i)
+            # pylint: disable-next=broad-exception-caught
+            except Exception as ex:
+                return None, type(ex).__name__
+
+            return perf_counter() - start, None
+
+        start = perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(timed_call, range(requests)))
+        wall_time = perf_counter() - start
+
+        return MailBenchmark(
+            action=action,
+            wall_time=wall_time,
+            latencies=[
+                latency for latency, _ in results if latency is not None
+            ],
+            errors=dict(Counter(error for _, error in results if error)),
+        )
+
+    def write_benchmark(self, benchmark: MailBenchmark):
+        """Write the results of a benchmark."""
+
+        def ms(seconds: t.Optional[float]):
+            return "n/a" if seconds is None else f"{seconds * 1000:.1f}ms"
+
+        line = (
+            f"{benchmark.action}:"
+            f" {benchmark.throughput:.1f} requests/s,"
+            f" p50 {ms(benchmark.percentile(50))},"
+            f" p95 {ms(benchmark.percentile(95))},"
+            f" p99 {ms(benchmark.percentile(99))},"
+            f" {sum(benchmark.errors.values())} error(s)"
+        )
+        if benchmark.errors:
+            errors = ", ".join(
+                f"{error}: {count}" for error, count in benchmark.errors.items()
+            )
+            line += f" ({errors})"
+
+        self.stdout.write(line)
+
+    def handle(self, *args, **options):
+        with ExitStack() as stack:
+            url: t.Optional[str] = options["url"]
+            if url is None:
+                # Only import the test utilities when they're needed.
+                # pylint: disable-next=import-outside-toplevel
+                from ..tests.dotdigital import FakeDotdigitalServer
+
+                server = stack.enter_context(
+                    FakeDotdigitalServer(
+                        latency=options["latency"],
+                        error_rate=options["error_rate"],
+                    )
+                )
+                url = server.url
+
+            stack.enter_context(
+                override_settings(MAIL_ENABLED=True, MAIL_API_URL=url)
+            )
+
+            for action in options["actions"]:
+                # Start each benchmark with cold connections and a closed
+                # circuit.
+                mail.close_sessions()
+                mail.reset_circuit_breakers()
+
+                self.write_benchmark(
+                    self.benchmark(
+                        action,
+                        requests=options["requests"],
+                        concurrency=options["concurrency"],
+                    )
+                )
+
+            mail.close_sessions()
+            mail.reset_circuit_breakers()
@@ -0,0 +1,77 @@
+"""
+© Ocado Group
+Created on 19/10/2026 at 21:16:45(+01:00).
+"""
+
+import re
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import override_settings
+
+from .. import mail
+from ..tests import FakeDotdigitalServer, TestCase
+
+
+# pylint: disable-next=missing-class-docstring
+class TestBenchmarkMail(TestCase):
+    def setUp(self):
+        mail.close_sessions()
+        mail.reset_circuit_breakers()
+        self.addCleanup(mail.close_sessions)
+        self.addCleanup(mail.reset_circuit_breakers)
+
+    def test_fake_dotdigital_server(self):
+        """The mail helpers can be called against the stand-in server."""
+        with FakeDotdigitalServer() as server, override_settings(
+            MAIL_ENABLED=True, MAIL_API_URL=server.url
+        ):
+            mail.add_contact("John.Doe@codeforlife.com")
+            mail.send_mail(
+                campaign_id=1, to_addresses=["john.doe@codeforlife.com"]
+            )
+            results = mail.add_contacts(
+                ["jane.doe@codeforlife.com"], poll_interval=0
+            )
+            assert mail.remove_contact("john.doe@codeforlife.com")
+            assert not mail.remove_contact("john.doe@codeforlife.com")
+
+        assert list(server.contacts) == ["jane.doe@codeforlife.com"]
+        assert len(server.emails) == 1
+        assert results == [
+            mail.ContactResult(value="jane.doe@codeforlife.com", ok=True)
+        ]
+
+    def test_fake_dotdigital_server__errors(self):
+        """The stand-in server can inject errors."""
+        with FakeDotdigitalServer(error_rate=1) as server, override_settings(
+            MAIL_ENABLED=True, MAIL_API_URL=server.url
+        ), patch.object(
+            mail, "RETRY", mail.RETRY.new(backoff_factor=0)
+        ), self.assertRaises(
+            AssertionError
+        ):
+            mail.send_mail(
+                campaign_id=1, to_addresses=["john.doe@codeforlife.com"]
+            )
+
+    def test_handle(self):
+        """The throughput and tail latency of each mail helper is written."""
+        stdout = StringIO()
+        call_command(
+            "benchmark_mail",
+            "--requests=20",
+            "--concurrency=5",
+            "--latency=0",
+            stdout=stdout,
+        )
+
+        lines = stdout.getvalue().splitlines()
+        assert len(lines) == 2
+        for action, line in zip(["send_mail", "add_contact"], lines):
+            assert re.fullmatch(
+                action + r": [\d.]+ requests/s, p50 [\d.]+ms,"
+                r" p95 [\d.]+ms, p99 [\d.]+ms, 0 error\(s\)",
+                line,
+            ), line
@@ -0,0 +1,37 @@
+"""
+© Ocado Group
+Created on 19/10/2026 at 19:20:05(+01:00).
+"""
+
+from django.core.management.base import BaseCommand
+
+from ..user.models import MailOutboxMessage
+
+
+# pylint: disable-next=missing-class-docstring
+class DrainMailOutbox(BaseCommand):
+    help = (
+        "Sends the pending messages in the mail outbox which are due and purges"
+        " the processed messages which are older than their retention period."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=MailOutboxMessage.batch_size,
+            help="The max number of messages claimed at once.",
+        )
+
+    def handle(self, *args, **options):
+        result = MailOutboxMessage.objects.drain(
+            batch_size=options["batch_size"]
+        )
+
+        self.stdout.write(
+            f"Sent {result.sent}, retried {result.retried}, dead-lettered"
+            f" {result.dead} and cancelled {result.cancelled} message(s)."
+        )
+
+        purged = MailOutboxMessage.objects.purge()
+        self.stdout.write(f"Purged {purged} processed message(s).")
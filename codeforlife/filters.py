@@ -3,7 +3,12 @@
 Created on 26/07/2024 at 11:26:14(+01:00).
 """
 
+import typing as t
+
+from django.db.models import F, Lookup, Model, Q
+from django.db.models.constants import LOOKUP_SEP
 from django.db.models.query import QuerySet
+from rest_framework.serializers import ValidationError
 
 # pylint: disable-next=line-too-long
 from django_filters.rest_framework import (  # type: ignore[import-untyped] # isort: skip
@@ -11,23 +16,117 @@ from django_filters.rest_framework import (  # type: ignore[import-untyped] # is
 )
 
 
+# pylint: disable-next=abstract-method
+class NotEqualAll(Lookup):
+    """A field is not equal to all of the values in a list.
+
+    The list is passed to Postgres as one array parameter: "<> ALL(%s)".
+    Unlike "NOT IN (%s, %s, ...)", the size of the SQL doesn't grow with the
+    number of values, which keeps the query quick to parse and plan.
+    """
+
+    lookup_name = "ne_all"
+    prepare_rhs = False
+
+    def get_db_prep_lookup(self, value, connection):
+        field = self.lhs.output_field
+        return (
+            "%s",
+            [
+                [
+                    field.get_db_prep_value(v, connection, prepared=False)
+                    for v in value
+                ]
+            ],
+        )
+
+    def as_sql(self, compiler, connection):
+        lhs_sql, lhs_params = self.process_lhs(compiler, connection)
+        rhs_sql, rhs_params = self.process_rhs(compiler, connection)
+        # Cast the array so Postgres knows its type, even when it's empty.
+        db_type = self.lhs.output_field.cast_db_type(connection)
+
+        return (
+            f"{lhs_sql} <> ALL({rhs_sql}::{db_type}[])",
+            [*lhs_params, *rhs_params],
+        )
+
+
 class FilterSet(_FilterSet):
     """Base filter set all other filter sets must inherit."""
 
+    # The number of values above which they're excluded with "<> ALL(%s)"
+    # instead of "NOT IN (%s, %s, ...)".
+    exclude_field_list_array_threshold = 50
+    # The max number of values that can be excluded in one request.
+    # NOTE: Django rejects requests with more than DATA_UPLOAD_MAX_NUMBER_FIELDS
+    # (1000 by default) query parameters.
+    exclude_field_list_max_length = 500
+
+    @staticmethod
+    def _get_field_path_nullability(model_class: t.Type[Model], field: str):
+        """Get whether a field, or the field of a related model, may be null.
+
+        Args:
+            model_class: The class of the model the path starts from.
+            field: The field or the path to a related model's field, separated
+                by "__".
+
+        Returns:
+            Whether the field may be null, which is the case if it or any
+            relation on the path to it may be null. None if a relation on the
+            path is to many models.
+        """
+        null = False
+        for name in field.split(LOOKUP_SEP):
+            # pylint: disable-next=protected-access
+            meta = model_class._meta
+            model_field = meta.pk if name == "pk" else meta.get_field(name)
+            if model_field.many_to_many or model_field.one_to_many:
+                return None
+
+            null = null or bool(model_field.null)
+            if model_field.is_relation:
+                model_class = t.cast(t.Type[Model], model_field.related_model)
+
+        return null
+
     @staticmethod
     def make_exclude_field_list_method(field: str):
         """Make a class-method that excludes a list of values for a field.
 
         Args:
-            field: The field to exclude a list of values for.
+            field: The field to exclude a list of values for. This may be the
+                path to a related model's field, e.g. "teacher__school".
 
         Returns:
             A class-method.
         """
 
         def method(self: FilterSet, queryset: QuerySet, name: str, *args):
-            return queryset.exclude(
-                **{f"{field}__in": self.request.GET.getlist(name)}
-            )
+            values: t.List[str] = self.request.GET.getlist(name)
+            if len(values) > self.exclude_field_list_max_length:
+                raise ValidationError(
+                    f"Can't exclude more than"
+                    f" {self.exclude_field_list_max_length} values.",
+                    code="too_many_values",
+                )
+
+            if len(values) <= self.exclude_field_list_array_threshold:
+                return queryset.exclude(**{f"{field}__in": values})
+
+            null = FilterSet._get_field_path_nullability(queryset.model, field)
+            # A model is excluded if any of its related models has one of the
+            # values, which "<> ALL(%s)" can't express on a join.
+            if null is None:
+                return queryset.exclude(**{f"{field}__in": values})
+
+            condition = Q(NotEqualAll(F(field), values))
+            # A null is neither equal nor not equal to any value, and a model
+            # without a related model is joined to nulls.
+            if null:
+                condition |= Q(**{f"{field}__isnull": True})
+
+            return queryset.filter(condition)
 
         return method
@@ -0,0 +1,211 @@
+"""
+© Ocado Group
+Created on 19/10/2026 at 18:05:47(+01:00).
+"""
+
+import typing as t
+from unittest.mock import patch
+
+from django.db import connection
+from django.db.models.query import QuerySet
+from django.test.utils import CaptureQueriesContext
+from django_filters import (
+    rest_framework as filters,  # type: ignore[import-untyped]
+)
+from rest_framework.serializers import ValidationError
+
+from .filters import FilterSet
+from .tests import APIRequestFactory, TestCase
+from .user.filters import ClassFilterSet, UserFilterSet
+from .user.models import Class, IndependentUser, School, Student, User
+
+# pylint: disable=missing-class-docstring,too-few-public-methods
+
+
+class StudentSchoolFilterSet(FilterSet):
+    _id = filters.CharFilter(method="_id__method")
+    _id__method = FilterSet.make_exclude_field_list_method(
+        "class_field__teacher__school"
+    )
+
+    class Meta:
+        model = Student
+        fields = ["_id"]
+
+
+class SchoolClassFilterSet(FilterSet):
+    _id = filters.CharFilter(method="_id__method")
+    _id__method = FilterSet.make_exclude_field_list_method("teacher_school__id")
+
+    class Meta:
+        model = School
+        fields = ["_id"]
+
+
+# pylint: enable=missing-class-docstring,too-few-public-methods
+
+
+# pylint: disable-next=missing-class-docstring
+class TestFilterSet(TestCase):
+    fixtures = ["school_1"]
+
+    def setUp(self):
+        self.request_factory = APIRequestFactory(User)
+
+    def _exclude(
+        self,
+        filterset_class: t.Type[FilterSet],
+        queryset: QuerySet,
+        values: t.List[str],
+    ):
+        request = self.request_factory.get(data={"_id": values})
+        return filterset_class(
+            request.GET, queryset=queryset, request=request
+        ).qs
+
+    def test_make_exclude_field_list_method__not_in(self):
+        """Few values are excluded with NOT IN."""
+        users = User.objects.order_by("pk")
+        exclude_user_ids = [str(user.id) for user in users[:2]]
+
+        with CaptureQueriesContext(connection) as captured:
+            included_users = list(
+                self._exclude(UserFilterSet, users, exclude_user_ids)
+            )
+
+        assert included_users == list(users[2:])
+        assert "NOT (" in captured.captured_queries[0]["sql"]
+        assert "<> ALL(" not in captured.captured_queries[0]["sql"]
+
+    def test_make_exclude_field_list_method__array(self):
+        """Many values are excluded with one array."""
+        users = User.objects.order_by("pk")
+        exclude_user_ids = [str(user.id) for user in users[:2]]
+
+        with patch.object(
+            UserFilterSet, "exclude_field_list_array_threshold", 1
+        ), CaptureQueriesContext(connection) as captured:
+            included_users = list(
+                self._exclude(UserFilterSet, users, exclude_user_ids)
+            )
+
+        assert included_users == list(users[2:])
+        assert "<> ALL(" in captured.captured_queries[0]["sql"]
+
+    def test_make_exclude_field_list_method__array__null(self):
+        """Models with a null value aren't excluded by the array."""
+        classes = Class.objects.order_by("pk")
+        klass = t.cast(Class, classes.last())
+        klass.access_code = None
+        klass.save()
+
+        exclude_access_codes = [
+            t.cast(str, klass.access_code) for klass in classes[:2]
+        ]
+
+        with patch.object(
+            ClassFilterSet, "exclude_field_list_array_threshold", 1
+        ):
+            included_classes = list(
+                self._exclude(ClassFilterSet, classes, exclude_access_codes)
+            )
+
+        assert klass in included_classes
+        assert included_classes == list(classes[2:])
+
+    def test_make_exclude_field_list_method__array__related(self):
+        """Many values of a related model's field are excluded with one array,
+        and models without a related model aren't excluded."""
+        students = Student.objects.order_by("pk")
+        student = t.cast(Student, students.filter(class_field__isnull=False)[0])
+        school = student.class_field.teacher.school
+        IndependentUser.objects.create_user(
+            first_name="Indy",
+            last_name="Pendent",
+            email="indy.pendent@codeforlife.com",
+            password="Password1",
+        )
+        exclude_school_ids = [str(school.id), "0"]
+
+        expected_students = list(
+            students.exclude(
+                class_field__teacher__school__in=exclude_school_ids
+            )
+        )
+        assert any(student.class_field is None for student in expected_students)
+
+        with patch.object(
+            StudentSchoolFilterSet, "exclude_field_list_array_threshold", 1
+        ), CaptureQueriesContext(connection) as captured:
+            included_students = list(
+                self._exclude(
+                    StudentSchoolFilterSet, students, exclude_school_ids
+                )
+            )
+
+        assert included_students == expected_students
+        assert "<> ALL(" in captured.captured_queries[0]["sql"]
+
+    def test_make_exclude_field_list_method__array__related_many(self):
+        """Many values of a field of related models, which a model has many
+        of, are excluded as few values are."""
+        schools = School.objects.order_by("pk")
+        teacher_ids = [
+            str(teacher_id)
+            for teacher_id in schools.values_list(
+                "teacher_school__id", flat=True
+            )[:2]
+            if teacher_id is not None
+        ]
+        assert teacher_ids
+
+        with patch.object(
+            SchoolClassFilterSet, "exclude_field_list_array_threshold", 1
+        ), CaptureQueriesContext(connection) as captured:
+            included_schools = list(
+                self._exclude(SchoolClassFilterSet, schools, teacher_ids)
+            )
+
+        assert included_schools == list(
+            schools.exclude(teacher_school__id__in=teacher_ids)
+        )
+        assert "<> ALL(" not in captured.captured_queries[0]["sql"]
+
+    def test_make_exclude_field_list_method__too_many_values(self):
+        """Can't exclude more than the max number of values."""
+        with patch.object(
+            UserFilterSet, "exclude_field_list_max_length", 1
+        ), self.assertRaises(ValidationError) as context:
+            self._exclude(UserFilterSet, User.objects.all(), ["1", "2"])
+
+        assert context.exception.get_codes() == ["too_many_values"]
+
+    def test_make_exclude_field_list_method__params(self):
+        """
+        Excluding many values with one array has one parameter, whereas NOT IN
+        has a placeholder for each value.
+        """
+        exclude_user_ids = [str(user_id) for user_id in range(1, 901)]
+
+        def get_params(array_threshold: int):
+            with patch.object(
+                UserFilterSet,
+                "exclude_field_list_array_threshold",
+                array_threshold,
+            ), patch.object(
+                UserFilterSet,
+                "exclude_field_list_max_length",
+                len(exclude_user_ids),
+            ):
+                _, params = (
+                    self._exclude(
+                        UserFilterSet, User.objects.all(), exclude_user_ids
+                    )
+                    .query.get_compiler(using="default")
+                    .as_sql()
+                )
+
+            return params
+
+        assert len(get_params(len(exclude_user_ids))) == len(exclude_user_ids)
+        assert len(get_params(0)) == 1
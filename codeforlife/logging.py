@@ -3,11 +3,12 @@
 Created on 02/01/2025 at 12:11:50(+00:00).
 """
 
-import json
 from logging import Formatter
 
 from django.conf import settings
 
+from .encoders import dumps
+
 
 class JsonFormatter(Formatter):
     """Format message as a stringified JSON object."""
@@ -15,12 +16,11 @@ class JsonFormatter(Formatter):
     def format(self, record):
         message = super().format(record)
 
-        return json.dumps(
+        return dumps(
             {
                 "serviceName": settings.SERVICE_NAME,
                 "name": record.name,
                 "level": record.levelname,
                 "message": message,
-            },
-            separators=(",", ":"),
-        )
+            }
+        ).decode()
@@ -7,14 +7,393 @@ Dotdigital helpers.
 
 import json
 import logging
+import time
 import typing as t
-from dataclasses import dataclass
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from itertools import islice
+from threading import Lock
 
 import requests
 from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ConnectTimeoutError, MaxRetryError
+from urllib3.util.retry import Retry as _Retry
 
 from .types import JsonDict
 
+Timeout = t.Union[float, t.Tuple[float, float]]
+
+# The max number of kept-alive connections to each region.
+POOL_SIZE = 10
+# The default connect and read timeouts, in seconds, of each attempt of a call.
+# The read timeout is short as the helpers are called on request paths.
+TIMEOUT: Timeout = (3.05, 10)
+# The default max seconds a call may take, including all its attempts and the
+# waits between them.
+DEADLINE: float = 20
+
+
+class Retry(_Retry):
+    """Waits at most backoff_max seconds before retrying, even if a
+    rate-limited response's Retry-After asks to wait longer."""
+
+    def parse_retry_after(self, retry_after):
+        return min(super().parse_retry_after(retry_after), self.backoff_max)
+
+    def get_wait(self, retries: int, retry_after: t.Optional[str] = None):
+        """Get the seconds to wait before a retry.
+
+        Args:
+            retries: The number of retries already made.
+            retry_after: The Retry-After header of a rate-limited response.
+
+        Returns:
+            The exponential backoff or the response's Retry-After.
+        """
+        if retry_after is not None:
+            return self.parse_retry_after(retry_after)
+
+        return min(self.backoff_max, self.backoff_factor * 2**retries)
+
+
+# Retry connection errors and rate-limited or failed responses with an
+# exponential backoff, which respects the Retry-After header of rate-limited
+# responses. Read errors and other errors aren't retried, as Dotdigital may
+# have received the request and still be processing it.
+#
+# POST is retried because connection errors and 429s mean Dotdigital didn't
+# process the request, and the contact endpoints upsert by email so repeating
+# them is harmless. Only a triggered email may be sent twice, if Dotdigital
+# fails with a 5xx after sending it, which is better than not sending it.
+#
+# The attempts are made by request, not by the session's adapter, so each
+# attempt passes through the circuit breaker and all of them, including the
+# waits between them, stay within the call's deadline.
+RETRY = Retry(
+    total=3,
+    connect=3,
+    read=0,
+    other=0,
+    backoff_factor=0.5,
+    backoff_max=5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=None,  # Retry all methods, including POST.
+    raise_on_status=False,  # Return the last response if out of retries.
+)
+
+# The max number of contacts imported in one request.
+IMPORT_CHUNK_SIZE = 1000
+# The max number of requests made at the same time by the bulk helpers. This
+# doesn't exceed the pool size so no thread waits for a connection.
+MAX_WORKERS = POOL_SIZE
+
+_sessions: t.Dict[str, requests.Session] = {}
+_lock = Lock()
+
+
+def get_session(region: str = "r1"):
+    """Get the pooled HTTP session of a region. Connections are kept alive and
+    shared between requests to the same region, including across threads.
+
+    Args:
+        region: The Dotdigital region id e.g. r1, r2 or r3.
+
+    Returns:
+        The region's session.
+    """
+    session = _sessions.get(region)
+    if session is None:
+        with _lock:
+            session = _sessions.get(region)
+            if session is None:
+                session = requests.Session()
+                # Don't retry in the adapter, as request retries.
+                adapter = HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=POOL_SIZE,
+                    pool_block=True,
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _sessions[region] = session
+
+    return session
+
+
+def close_sessions():
+    """Close the pooled HTTP sessions of all regions."""
+    with _lock:
+        for session in _sessions.values():
+            session.close()
+
+        _sessions.clear()
+
+
+class CircuitOpenError(Exception):
+    """Dotdigital was not called because the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """Stops calling Dotdigital while it's failing or slow, so callers fail
+    fast instead of waiting for their timeouts.
+
+    The breaker is closed while calls are allowed. It opens if, in the window of
+    the latest calls, the rate of failed calls or the rate of slow calls
+    reaches its threshold. While open, calls raise CircuitOpenError. After
+    open_duration seconds, the breaker is half-open and allows a few probe
+    calls: if they all succeed quickly it closes, otherwise it opens again.
+    """
+
+    State = t.Literal["closed", "open", "half-open"]
+
+    # The number of latest calls to compute the failure and slow rates over.
+    window_size = 20
+    # The min number of calls in the window before the breaker can open.
+    min_calls = 10
+    # The rate of failed calls at which the breaker opens.
+    failure_rate_threshold = 0.5
+    # The duration, in seconds, above which a call is slow.
+    slow_call_duration: float = 5
+    # The rate of slow calls at which the breaker opens.
+    slow_call_rate_threshold = 0.5
+    # The seconds the breaker stays open before allowing probe calls.
+    open_duration: float = 30
+    # The number of probe calls which must succeed to close the breaker.
+    half_open_calls = 1
+
+    def __init__(self, clock: t.Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self._lock = Lock()
+        # Whether each of the latest calls failed and whether it was slow.
+        self._window: t.Deque[t.Tuple[bool, bool]] = deque(
+            maxlen=self.window_size
+        )
+        self._opened_at: t.Optional[float] = None
+        self._probes = 0
+        self._probe_successes = 0
+
+    @property
+    def state(self) -> State:
+        """The current state of the breaker."""
+        if self._opened_at is None:
+            return "closed"
+        if self.clock() - self._opened_at < self.open_duration:
+            return "open"
+        return "half-open"
+
+    def _open(self):
+        self._opened_at = self.clock()
+        self._probes = 0
+        self._probe_successes = 0
+
+    def before_call(self):
+        """Check a call is allowed and, if half-open, count it as a probe.
+
+        Raises:
+            CircuitOpenError: If the breaker is open, or if half-open and
+                enough probe calls are already in progress.
+        """
+        with self._lock:
+            state = self.state
+            if state == "open" or (
+                state == "half-open" and self._probes >= self.half_open_calls
+            ):
+                raise CircuitOpenError(
+                    "Not calling Dotdigital as the circuit breaker is open."
+                )
+            if state == "half-open":
+                self._probes += 1
+
+    def after_call(self, failed: bool, duration: float):
+        """Record the outcome of an allowed call.
+
+        Args:
+            failed: Whether the call failed.
+            duration: The seconds the call took.
+        """
+        slow = duration > self.slow_call_duration
+        with self._lock:
+            if self.state == "half-open":
+                if failed or slow:
+                    self._open()
+                else:
+                    self._probe_successes += 1
+                    if self._probe_successes >= self.half_open_calls:
+                        self._opened_at = None
+                        self._window.clear()
+                return
+
+            self._window.append((failed, slow))
+            if len(self._window) < self.min_calls:
+                return
+
+            failure_rate = sum(f for f, _ in self._window) / len(self._window)
+            slow_rate = sum(s for _, s in self._window) / len(self._window)
+            if (
+                failure_rate >= self.failure_rate_threshold
+                or slow_rate >= self.slow_call_rate_threshold
+            ):
+                self._open()
+                self._window.clear()
+
+
+_circuit_breakers: t.Dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(region: str = "r1"):
+    """Get the circuit breaker of a region.
+
+    Args:
+        region: The Dotdigital region id e.g. r1, r2 or r3.
+
+    Returns:
+        The region's circuit breaker.
+    """
+    with _lock:
+        return _circuit_breakers.setdefault(region, CircuitBreaker())
+
+
+def get_circuit_breakers():
+    """Get the circuit breakers of the regions that have been called."""
+    with _lock:
+        return dict(_circuit_breakers)
+
+
+def reset_circuit_breakers():
+    """Reset the circuit breakers of all regions."""
+    with _lock:
+        _circuit_breakers.clear()
+
+
+def get_url(path: str, region: str = "r1"):
+    """Get the URL of an endpoint of Dotdigital's API.
+
+    Args:
+        path: The path of the endpoint, starting with a "/".
+        region: The Dotdigital region id e.g. r1, r2 or r3.
+
+    Returns:
+        The endpoint's URL.
+    """
+    return settings.MAIL_API_URL.format(region=region) + path
+
+
+def _is_connect_error(error: Exception):
+    """Whether an error was raised before Dotdigital received the request."""
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    if isinstance(error, requests.exceptions.ConnectionError) and error.args:
+        reason = error.args[0]
+        return isinstance(reason, MaxRetryError) and isinstance(
+            reason.reason, ConnectTimeoutError
+        )
+    return False
+
+
+def _get_attempt_timeout(timeout: Timeout, remaining: float) -> Timeout:
+    """Cap an attempt's timeouts by the seconds remaining until the deadline."""
+    if isinstance(timeout, tuple):
+        return (min(timeout[0], remaining), min(timeout[1], remaining))
+
+    return min(timeout, remaining)
+
+
+# pylint: disable-next=too-many-locals
+def request(
+    method: str,
+    path: str,
+    region: str = "r1",
+    timeout: Timeout = TIMEOUT,
+    deadline: float = DEADLINE,
+    **kwargs,
+):
+    """Call an endpoint of Dotdigital's API through the region's pooled
+    session and circuit breaker, retrying as set by RETRY.
+
+    Each attempt is recorded by the circuit breaker. Rate-limited, 5xx and
+    raised attempts are recorded as failed. The attempts and the waits between
+    them stay within the deadline: an attempt's timeouts are capped by the
+    seconds remaining, and a retry which can't start before the deadline isn't
+    made.
+
+    Args:
+        method: The HTTP method.
+        path: The path of the endpoint, starting with a "/".
+        region: The Dotdigital region id e.g. r1, r2 or r3.
+        timeout: The timeout of each attempt. Either one timeout or a tuple of
+            the connect and read timeouts.
+        deadline: The max seconds the call may take.
+        **kwargs: The arguments of requests.Session.request.
+
+    Raises:
+        CircuitOpenError: If the region's circuit breaker is open.
+
+    Returns:
+        The last attempt's response.
+    """
+    retry = RETRY
+    circuit_breaker = get_circuit_breaker(region)
+    session = get_session(region)
+    url = get_url(path, region)
+    deadline_at = time.monotonic() + deadline
+
+    retries = 0
+    while True:
+        circuit_breaker.before_call()
+
+        start = time.monotonic()
+        try:
+            response = session.request(
+                method,
+                url,
+                timeout=_get_attempt_timeout(timeout, deadline_at - start),
+                **kwargs,
+            )
+        # pylint: disable-next=broad-exception-caught
+        except Exception as ex:
+            circuit_breaker.after_call(
+                failed=True, duration=time.monotonic() - start
+            )
+            if not (
+                retries < t.cast(int, retry.total)
+                and retries < t.cast(int, retry.connect)
+                and _is_connect_error(ex)
+            ):
+                raise
+
+            wait = retry.get_wait(retries)
+            if time.monotonic() + wait >= deadline_at:
+                raise
+        else:
+            failed = response.status_code == 429 or response.status_code >= 500
+            circuit_breaker.after_call(
+                failed=failed, duration=time.monotonic() - start
+            )
+            if not (
+                retries < t.cast(int, retry.total)
+                and response.status_code in retry.status_forcelist
+            ):
+                return response
+
+            wait = retry.get_wait(
+                retries,
+                (
+                    response.headers.get("Retry-After")
+                    if retry.respect_retry_after_header
+                    and response.status_code in retry.RETRY_AFTER_STATUS_CODES
+                    else None
+                ),
+            )
+            if time.monotonic() + wait >= deadline_at:
+                return response
+
+            response.close()
+
+        retries += 1
+        time.sleep(wait)
+
 
 @dataclass
 class Preference:
@@ -38,6 +417,35 @@ class Preference:
     is_opted_in: t.Optional[bool] = None
 
 
+def _preferences_to_json(preferences: t.List[Preference]):
+    return [
+        {
+            "id": preference.id,
+            "isPreference": preference.is_preference,
+            **(
+                {}
+                if preference.is_opted_in is None
+                else {"isOptedIn": preference.is_opted_in}
+            ),
+            **(
+                {}
+                if preference.preferences is None
+                else {
+                    "preferences": [
+                        {
+                            "id": _preference.id,
+                            "isPreference": _preference.is_preference,
+                            "isOptedIn": _preference.is_opted_in,
+                        }
+                        for _preference in preference.preferences
+                    ]
+                }
+            ),
+        }
+        for preference in preferences
+    ]
+
+
 # pylint: disable-next=too-many-arguments
 def add_contact(
     email: str,
@@ -50,7 +458,7 @@ def add_contact(
     preferences: t.Optional[t.List[Preference]] = None,
     region: str = "r1",
     auth: t.Optional[str] = None,
-    timeout: int = 30,
+    timeout: Timeout = TIMEOUT,
 ):
     # pylint: disable=line-too-long
     """Add a new contact to Dotdigital.
@@ -66,10 +474,11 @@ def add_contact(
         preferences: The marketing preferences to be applied.
         region: The Dotdigital region id your account belongs to e.g. r1, r2 or r3.
         auth: The authorization header used to enable API access. If None, the value will be retrieved from the MAIL_AUTH environment variable.
-        timeout: Send timeout to avoid hanging.
+        timeout: Send timeout to avoid hanging. Either one timeout or a tuple of the connect and read timeouts.
 
     Raises:
         AssertionError: If failed to add contact.
+        CircuitOpenError: If the region's circuit breaker is open.
     """
     # pylint: enable=line-too-long
 
@@ -98,32 +507,7 @@ def add_contact(
             for fields in consent_fields
         ]
     if preferences is not None:
-        body["preferences"] = [
-            {
-                "id": preference.id,
-                "isPreference": preference.is_preference,
-                **(
-                    {}
-                    if preference.is_opted_in is None
-                    else {"isOptedIn": preference.is_opted_in}
-                ),
-                **(
-                    {}
-                    if preference.preferences is None
-                    else {
-                        "preferences": [
-                            {
-                                "id": _preference.id,
-                                "isPreference": _preference.is_preference,
-                                "isOptedIn": _preference.is_opted_in,
-                            }
-                            for _preference in preference.preferences
-                        ]
-                    }
-                ),
-            }
-            for preference in preferences
-        ]
+        body["preferences"] = _preferences_to_json(preferences)
 
     if not settings.MAIL_ENABLED:
         logging.info(
@@ -131,9 +515,10 @@ def add_contact(
         )
         return
 
-    response = requests.post(
-        # pylint: disable-next=line-too-long
-        url=f"https://{region}-api.dotdigital.com/v2/contacts/with-consent-and-preferences",
+    response = request(
+        "POST",
+        "/v2/contacts/with-consent-and-preferences",
+        region,
         json=body,
         headers={
             "accept": "application/json",
@@ -155,7 +540,7 @@ def remove_contact(
     identifier: t.Literal["contact-id", "email", "mobile-number"] = "email",
     region: str = "r1",
     auth: t.Optional[str] = None,
-    timeout: int = 30,
+    timeout: Timeout = TIMEOUT,
 ):
     # pylint: disable=line-too-long
     """Remove an existing contact from Dotdigital.
@@ -167,10 +552,11 @@ def remove_contact(
         identifier: Field to use to uniquely identify the contact.
         region: The Dotdigital region id your account belongs to e.g. r1, r2 or r3.
         auth: The authorization header used to enable API access. If None, the value will be retrieved from the MAIL_AUTH environment variable.
-        timeout: Send timeout to avoid hanging.
+        timeout: Send timeout to avoid hanging. Either one timeout or a tuple of the connect and read timeouts.
 
     Raises:
         AssertionError: If failed to delete contact.
+        CircuitOpenError: If the region's circuit breaker is open.
 
     Returns:
         A flag designating whether the contact was removed. True if the contact
@@ -188,9 +574,10 @@ def remove_contact(
     if auth is None:
         auth = settings.MAIL_AUTH
 
-    response = requests.delete(
-        # pylint: disable-next=line-too-long
-        url=f"https://{region}-api.dotdigital.com/contacts/v3/{identifier}/{value}",
+    response = request(
+        "DELETE",
+        f"/contacts/v3/{identifier}/{value}",
+        region,
         headers={
             "accept": "application/json",
             "authorization": auth,
@@ -209,6 +596,284 @@ def remove_contact(
     return not not_found
 
 
+@dataclass
+class Contact:
+    """A contact to import to Dotdigital, with the same data as add_contact."""
+
+    email: str
+    opt_in_type: t.Optional[
+        t.Literal["Unknown", "Single", "Double", "VerifiedDouble"]
+    ] = None
+    email_type: t.Optional[t.Literal["PlainText", "Html"]] = None
+    data_fields: t.Optional[t.Dict[str, str]] = None
+    consent_fields: t.Optional[t.List[t.Dict[str, str]]] = None
+    preferences: t.Optional[t.List[Preference]] = None
+
+    # The keys of the consent records imported in bulk, by the keys of the
+    # consent fields of a contact added on its own.
+    consent_record_keys = {
+        "TEXT": "text",
+        "DATETIMECONSENTED": "dateTimeConsented",
+        "URL": "url",
+        "IPADDRESS": "ipAddress",
+        "USERAGENT": "userAgent",
+    }
+
+    def to_import_json(self):
+        """Convert this contact to an item of a bulk import.
+
+        https://developer.dotdigital.com/reference/import-contacts-v3
+
+        Returns:
+            The JSON of the contact.
+        """
+        contact: JsonDict = {"identifiers": {"email": self.email}}
+
+        email_properties: JsonDict = {}
+        # The bulk import's enums are camel case.
+        if self.opt_in_type is not None:
+            email_properties["optInType"] = (
+                self.opt_in_type[0].lower() + self.opt_in_type[1:]
+            )
+        if self.email_type is not None:
+            email_properties["emailType"] = (
+                self.email_type[0].lower() + self.email_type[1:]
+            )
+        if email_properties:
+            contact["channelProperties"] = {"email": email_properties}
+
+        if self.data_fields is not None:
+            contact["dataFields"] = self.data_fields
+        if self.consent_fields is not None:
+            contact["consentRecords"] = [
+                {
+                    self.consent_record_keys.get(key.upper(), key): value
+                    for key, value in fields.items()
+                }
+                for fields in self.consent_fields
+            ]
+        if self.preferences is not None:
+            contact["preferences"] = _preferences_to_json(self.preferences)
+
+        return contact
+
+
+@dataclass
+class ContactResult:
+    """The result of adding or removing one contact in bulk."""
+
+    value: str
+    ok: bool
+    reason: t.Optional[str] = None
+
+
+def _chunk(iterable: t.Iterable[t.Any], size: int):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+# pylint: disable-next=too-many-arguments
+def _import_contacts(
+    contacts: t.List[Contact],
+    region: str,
+    auth: str,
+    timeout: Timeout,
+    poll_interval: float,
+    poll_timeout: float,
+):
+    headers = {"accept": "application/json", "authorization": auth}
+
+    response = request(
+        "POST",
+        "/contacts/v3/import",
+        region,
+        json=[contact.to_import_json() for contact in contacts],
+        headers=headers,
+        timeout=timeout,
+    )
+    assert response.ok, (
+        "Failed to import contacts."
+        f" Reason: {response.reason}."
+        f" Text: {response.text}."
+    )
+    import_id = response.json()["importId"]
+
+    # The contacts are imported asynchronously.
+    deadline = time.monotonic() + poll_timeout
+    while True:
+        response = request(
+            "GET",
+            f"/contacts/v3/import/{import_id}",
+            region,
+            headers=headers,
+            timeout=timeout,
+        )
+        assert response.ok, (
+            "Failed to get contacts import."
+            f" Reason: {response.reason}."
+            f" Text: {response.text}."
+        )
+        report: JsonDict = response.json()
+        if report["status"] != "NotFinished":
+            break
+
+        assert time.monotonic() < deadline, "Timed out importing contacts."
+        time.sleep(poll_interval)
+
+    assert (
+        report["status"] == "Finished"
+    ), f"Failed to import contacts. Status: {report['status']}."
+
+    failures = {
+        failure["identifiers"]["email"]: failure["failureReason"]
+        for failure in t.cast(t.List[JsonDict], report.get("failures", []))
+    }
+
+    return [
+        ContactResult(
+            value=contact.email,
+            ok=contact.email not in failures,
+            reason=failures.get(contact.email),
+        )
+        for contact in contacts
+    ]
+
+
+# pylint: disable-next=too-many-arguments
+def add_contacts(
+    contacts: t.Iterable[t.Union[str, Contact]],
+    chunk_size: int = IMPORT_CHUNK_SIZE,
+    max_workers: int = MAX_WORKERS,
+    region: str = "r1",
+    auth: t.Optional[str] = None,
+    timeout: Timeout = TIMEOUT,
+    poll_interval: float = 1,
+    poll_timeout: float = 300,
+):
+    # pylint: disable=line-too-long
+    """Add many contacts to Dotdigital.
+
+    The contacts are imported in chunks, and many chunks are imported at the same time.
+
+    Args:
+        contacts: The contacts to add, or their email addresses.
+        chunk_size: The max number of contacts imported in one request.
+        max_workers: The max number of chunks imported at the same time.
+        region: The Dotdigital region id your account belongs to e.g. r1, r2 or r3.
+        auth: The authorization header used to enable API access. If None, the value will be retrieved from the MAIL_AUTH environment variable.
+        timeout: Send timeout to avoid hanging. Either one timeout or a tuple of the connect and read timeouts.
+        poll_interval: The seconds to wait between checking if a chunk's import has finished.
+        poll_timeout: The max seconds to wait for a chunk's import to finish.
+
+    Returns:
+        The result of adding each contact, in the same order as the contacts. If a chunk failed to import, all of its contacts failed.
+    """
+    # pylint: enable=line-too-long
+
+    if auth is None:
+        auth = settings.MAIL_AUTH
+
+    chunks = list(
+        _chunk(
+            (
+                (
+                    Contact(email=contact.lower())
+                    if isinstance(contact, str)
+                    else replace(contact, email=contact.email.lower())
+                )
+                for contact in contacts
+            ),
+            chunk_size,
+        )
+    )
+
+    if not settings.MAIL_ENABLED:
+        logging.info(
+            "Added contacts to DotDigital: %s",
+            ", ".join(contact.email for chunk in chunks for contact in chunk),
+        )
+        return [
+            ContactResult(value=contact.email, ok=True)
+            for chunk in chunks
+            for contact in chunk
+        ]
+
+    def import_chunk(chunk: t.List[Contact]):
+        try:
+            return _import_contacts(
+                chunk,
+                region=region,
+                auth=t.cast(str, auth),
+                timeout=timeout,
+                poll_interval=poll_interval,
+                poll_timeout=poll_timeout,
+            )
+        # pylint: disable-next=broad-exception-caught
+        except Exception as ex:
+            return [
+                ContactResult(value=contact.email, ok=False, reason=str(ex))
+                for contact in chunk
+            ]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return [
+            result
+            for results in executor.map(import_chunk, chunks)
+            for result in results
+        ]
+
+
+# pylint: disable-next=too-many-arguments
+def remove_contacts(
+    values: t.Iterable[str],
+    identifier: t.Literal["contact-id", "email", "mobile-number"] = "email",
+    max_workers: int = MAX_WORKERS,
+    region: str = "r1",
+    auth: t.Optional[str] = None,
+    timeout: Timeout = TIMEOUT,
+):
+    # pylint: disable=line-too-long
+    """Remove many existing contacts from Dotdigital.
+
+    Dotdigital can't remove contacts in bulk, so many contacts are removed at the same time.
+
+    Args:
+        values: The unique values to identify the contacts. Note: Must be the same type as the identifier.
+        identifier: Field to use to uniquely identify the contacts.
+        max_workers: The max number of contacts removed at the same time.
+        region: The Dotdigital region id your account belongs to e.g. r1, r2 or r3.
+        auth: The authorization header used to enable API access. If None, the value will be retrieved from the MAIL_AUTH environment variable.
+        timeout: Send timeout to avoid hanging. Either one timeout or a tuple of the connect and read timeouts.
+
+    Returns:
+        The result of removing each contact, in the same order as the values. A contact that was not found failed to be removed.
+    """
+    # pylint: enable=line-too-long
+
+    def remove(value: str):
+        try:
+            removed = remove_contact(
+                value,
+                identifier=identifier,
+                region=region,
+                auth=auth,
+                timeout=timeout,
+            )
+        # pylint: disable-next=broad-exception-caught
+        except Exception as ex:
+            return ContactResult(value=value, ok=False, reason=str(ex))
+
+        return ContactResult(
+            value=value,
+            ok=removed,
+            reason=None if removed else "Contact not found.",
+        )
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(remove, values))
+
+
 @dataclass
 class EmailAttachment:
     """An email attachment for a Dotdigital triggered campaign."""
@@ -230,7 +895,7 @@ def send_mail(
     attachments: t.Optional[t.List[EmailAttachment]] = None,
     region: str = "r1",
     auth: t.Optional[str] = None,
-    timeout: int = 30,
+    timeout: Timeout = TIMEOUT,
 ):
     # pylint: disable=line-too-long
     """Send a triggered email campaign using DotDigital's API.
@@ -248,10 +913,11 @@ def send_mail(
         attachments: A Base64 encoded string. All attachment types are supported. Maximum file size: 15 MB.
         region: The Dotdigital region id your account belongs to e.g. r1, r2 or r3.
         auth: The authorization header used to enable API access. If None, the value will be retrieved from the MAIL_AUTH environment variable.
-        timeout: Send timeout to avoid hanging.
+        timeout: Send timeout to avoid hanging. Either one timeout or a tuple of the connect and read timeouts.
 
     Raises:
         AssertionError: If failed to send email.
+        CircuitOpenError: If the region's circuit breaker is open.
     """
     # pylint: enable=line-too-long
 
@@ -295,8 +961,10 @@ def send_mail(
         )
         return
 
-    response = requests.post(
-        url=f"https://{region}-api.dotdigital.com/v2/email/triggered-campaign",
+    response = request(
+        "POST",
+        "/v2/email/triggered-campaign",
+        region,
         json=body,
         headers={
             "accept": "text/plain",
@@ -0,0 +1,349 @@
+"""
+© Ocado Group
+Created on 19/10/2026 at 18:47:26(+01:00).
+"""
+
+import time
+import typing as t
+from unittest.mock import patch
+
+import requests
+from django.test import override_settings
+
+from . import mail
+from .tests import FakeDotdigitalServer, TestCase
+
+
+@override_settings(MAIL_ENABLED=True)
+class TestMail(TestCase):
+    """Tests the mail helpers against a stand-in for Dotdigital's API."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        cls.server = cls.enterClassContext(FakeDotdigitalServer())
+
+    def setUp(self):
+        self.server.reset()
+
+        # Don't wait between retries.
+        retry_patcher = patch.object(
+            mail, "RETRY", mail.RETRY.new(backoff_factor=0)
+        )
+        retry_patcher.start()
+        self.addCleanup(retry_patcher.stop)
+
+        settings_overrider = override_settings(MAIL_API_URL=self.server.url)
+        settings_overrider.enable()
+        self.addCleanup(settings_overrider.disable)
+
+        mail.close_sessions()
+        self.addCleanup(mail.close_sessions)
+        mail.reset_circuit_breakers()
+        self.addCleanup(mail.reset_circuit_breakers)
+
+    def test_get_session(self):
+        """Each region has one session."""
+        assert mail.get_session("r1") is mail.get_session("r1")
+        assert mail.get_session("r1") is not mail.get_session("r2")
+
+    def test_keep_alive(self):
+        """Requests to the same region reuse the same connection."""
+        mail.add_contact("john.doe@codeforlife.com")
+        mail.send_mail(campaign_id=1, to_addresses=["john.doe@codeforlife.com"])
+        assert mail.remove_contact("john.doe@codeforlife.com")
+
+        assert self.server.requests == [
+            ("POST", "/v2/contacts/with-consent-and-preferences"),
+            ("POST", "/v2/email/triggered-campaign"),
+            ("DELETE", "/contacts/v3/email/john.doe@codeforlife.com"),
+        ]
+        assert len(self.server.client_addresses) == 1
+
+    def test_retry(self):
+        """Rate-limited and failed requests are retried."""
+        self.server.statuses.extend([429, 503])
+
+        mail.add_contact("john.doe@codeforlife.com")
+
+        assert len(self.server.requests) == 3
+
+    def test_retry__out_of_retries(self):
+        """Requests that fail after all retries raise an error."""
+        self.server.statuses.extend([500] * (t.cast(int, mail.RETRY.total) + 1))
+
+        with self.assertRaises(AssertionError):
+            mail.add_contact("john.doe@codeforlife.com")
+
+        assert len(self.server.requests) == t.cast(int, mail.RETRY.total) + 1
+
+    def test_retry__read_timeout(self):
+        """Requests that time out while waiting for the response are not
+        retried, as Dotdigital may still be processing them."""
+        self.server.latency = 0.5
+
+        with self.assertRaises(requests.exceptions.ReadTimeout):
+            mail.add_contact("john.doe@codeforlife.com", timeout=(1, 0.1))
+
+        # Wait long enough for any retried request to reach the server.
+        time.sleep(self.server.latency * 2)
+        assert len(self.server.requests) == 1
+
+    def test_retry__retry_after(self):
+        """A rate-limited response's Retry-After is capped by the max
+        backoff."""
+        assert mail.RETRY.parse_retry_after("1") == 1
+        assert mail.RETRY.parse_retry_after("3600") == mail.RETRY.backoff_max
+
+    def test_retry__connect_error(self):
+        """Requests that fail to connect are retried."""
+        with patch.object(
+            requests.Session,
+            "request",
+            side_effect=requests.exceptions.ConnectTimeout(),
+        ) as session_request:
+            with self.assertRaises(requests.exceptions.ConnectTimeout):
+                mail.add_contact("john.doe@codeforlife.com")
+
+        assert session_request.call_count == t.cast(int, mail.RETRY.total) + 1
+
+    def test_deadline__wait(self):
+        """A retry isn't made if its backoff would pass the call's
+        deadline."""
+        self.server.statuses.append(503)
+
+        start = time.monotonic()
+        with patch.object(mail, "RETRY", mail.RETRY.new(backoff_factor=10)):
+            response = mail.request("GET", "/", deadline=1)
+
+        assert response.status_code == 503
+        assert len(self.server.requests) == 1
+        assert time.monotonic() - start < 1
+
+    def test_deadline__timeout(self):
+        """An attempt's timeouts are capped by the time left until the call's
+        deadline."""
+        self.server.latency = 0.5
+
+        start = time.monotonic()
+        with self.assertRaises(requests.exceptions.ReadTimeout):
+            mail.request("GET", "/", timeout=(1, 5), deadline=0.1)
+
+        assert time.monotonic() - start < self.server.latency
+
+        # Wait for the server to finish handling the request.
+        time.sleep(self.server.latency * 2)
+
+    def test_remove_contact__not_found(self):
+        """Removing a contact that doesn't exist is not retried."""
+        assert not mail.remove_contact("john.doe@codeforlife.com")
+        assert len(self.server.requests) == 1
+
+    def test_timeout(self):
+        """The connect and read timeouts are passed separately."""
+        with patch.object(
+            requests.adapters.HTTPAdapter,
+            "send",
+            side_effect=requests.adapters.HTTPAdapter.send,
+            autospec=True,
+        ) as send:
+            mail.add_contact("john.doe@codeforlife.com", timeout=(1, 2))
+
+        assert send.call_args.kwargs["timeout"] == (1, 2)
+
+    def test_add_contacts(self):
+        """Contacts are imported in chunks, with a result per contact."""
+        emails = [f"user{i}@codeforlife.com" for i in range(5)]
+        self.server.import_failures[emails[3]] = "Invalid"
+
+        results = mail.add_contacts(
+            [emails[0], mail.Contact(email=emails[1].upper()), *emails[2:]],
+            chunk_size=2,
+            poll_interval=0,
+        )
+
+        assert results == [
+            (
+                mail.ContactResult(value=email, ok=False, reason="Invalid")
+                if email == emails[3]
+                else mail.ContactResult(value=email, ok=True)
+            )
+            for email in emails
+        ]
+        assert sorted(len(chunk) for chunk in self.server.imports) == [1, 2, 2]
+        assert sorted(self.server.contacts) == sorted(
+            email for email in emails if email != emails[3]
+        )
+
+    def test_add_contacts__consent_and_preferences(self):
+        """Contacts are imported with the same data as a contact added on its
+        own."""
+        preferences = [
+            mail.Preference(
+                id=1,
+                is_preference=False,
+                preferences=[
+                    mail.Preference.Preference(
+                        id=2, is_preference=True, is_opted_in=True
+                    )
+                ],
+            )
+        ]
+
+        results = mail.add_contacts(
+            [
+                mail.Contact(
+                    email="John.Doe@codeforlife.com",
+                    opt_in_type="VerifiedDouble",
+                    email_type="Html",
+                    data_fields={"FIRSTNAME": "John"},
+                    consent_fields=[
+                        {
+                            "TEXT": "Sign me up.",
+                            "DATETIMECONSENTED": "2026-10-19T12:00:00Z",
+                            "IPADDRESS": "127.0.0.1",
+                        }
+                    ],
+                    preferences=preferences,
+                )
+            ],
+            poll_interval=0,
+        )
+
+        assert results == [
+            mail.ContactResult(value="john.doe@codeforlife.com", ok=True)
+        ]
+        contact = self.server.contacts["john.doe@codeforlife.com"]
+        assert contact["channelProperties"] == {
+            "email": {"optInType": "verifiedDouble", "emailType": "html"}
+        }
+        assert contact["dataFields"] == {"FIRSTNAME": "John"}
+        assert contact["consentRecords"] == [
+            {
+                "text": "Sign me up.",
+                "dateTimeConsented": "2026-10-19T12:00:00Z",
+                "ipAddress": "127.0.0.1",
+            }
+        ]
+        assert contact["preferences"] == [
+            {
+                "id": 1,
+                "isPreference": False,
+                "preferences": [
+                    {"id": 2, "isPreference": True, "isOptedIn": True}
+                ],
+            }
+        ]
+
+    def test_add_contacts__failed_chunk(self):
+        """All contacts in a chunk which failed to import failed."""
+        self.server.statuses.append(400)
+
+        results = mail.add_contacts(
+            ["john.doe@codeforlife.com"], poll_interval=0
+        )
+
+        assert len(results) == 1
+        assert not results[0].ok
+        assert results[0].reason and "Failed to import" in results[0].reason
+
+    def test_remove_contacts(self):
+        """Contacts are removed at the same time, with a result per
+        contact."""
+        emails = [f"user{i}@codeforlife.com" for i in range(5)]
+        self.server.contacts.update(
+            {email: {"email": email} for email in emails}
+        )
+
+        results = mail.remove_contacts(emails, max_workers=5)
+
+        assert len(results) == 5
+        assert all(result.ok for result in results)
+        assert len(self.server.requests) == 5
+        assert not self.server.contacts
+
+    def test_circuit_breaker(self):
+        """Each attempt is recorded by the circuit breaker, so calls fail fast,
+        even partway through their retries, once Dotdigital keeps failing."""
+        circuit_breaker = mail.get_circuit_breaker()
+        attempts = t.cast(int, mail.RETRY.total) + 1
+        self.server.statuses.extend([500] * circuit_breaker.min_calls)
+
+        for _ in range(circuit_breaker.min_calls // attempts):
+            with self.assertRaises(AssertionError):
+                mail.add_contact("john.doe@codeforlife.com")
+
+        assert circuit_breaker.state == "closed"
+
+        with self.assertRaises(mail.CircuitOpenError):
+            mail.add_contact("john.doe@codeforlife.com")
+
+        assert circuit_breaker.state == "open"
+        assert len(self.server.requests) == circuit_breaker.min_calls
+
+
+class TestCircuitBreaker(TestCase):
+    """Tests the circuit breaker's states."""
+
+    def setUp(self):
+        self.now = 0.0
+        self.circuit_breaker = mail.CircuitBreaker(clock=lambda: self.now)
+
+    def _call(self, failed: bool = False, duration: float = 0):
+        self.circuit_breaker.before_call()
+        self.circuit_breaker.after_call(failed=failed, duration=duration)
+
+    def _open(self):
+        for _ in range(self.circuit_breaker.min_calls):
+            self._call(failed=True)
+
+        assert self.circuit_breaker.state == "open"
+
+    def test_closed(self):
+        """The breaker stays closed below the thresholds."""
+        for i in range(self.circuit_breaker.window_size):
+            self._call(failed=i % 3 == 0)
+
+        assert self.circuit_breaker.state == "closed"
+
+    def test_open__failure_rate(self):
+        """The breaker opens when too many calls fail."""
+        for _ in range(self.circuit_breaker.min_calls - 1):
+            self._call(failed=True)
+
+        assert self.circuit_breaker.state == "closed"
+        self._call(failed=True)
+        assert self.circuit_breaker.state == "open"
+
+        with self.assertRaises(mail.CircuitOpenError):
+            self.circuit_breaker.before_call()
+
+    def test_open__slow_call_rate(self):
+        """The breaker opens when too many calls are slow."""
+        for _ in range(self.circuit_breaker.min_calls):
+            self._call(duration=self.circuit_breaker.slow_call_duration + 1)
+
+        assert self.circuit_breaker.state == "open"
+
+    def test_half_open__close(self):
+        """The breaker closes if its probe call succeeds."""
+        self._open()
+        self.now += self.circuit_breaker.open_duration
+        assert self.circuit_breaker.state == "half-open"
+
+        self.circuit_breaker.before_call()
+        # Only the probe call is allowed.
+        with self.assertRaises(mail.CircuitOpenError):
+            self.circuit_breaker.before_call()
+
+        self.circuit_breaker.after_call(failed=False, duration=0)
+        assert self.circuit_breaker.state == "closed"
+
+    def test_half_open__reopen(self):
+        """The breaker opens again if its probe call fails."""
+        self._open()
+        self.now += self.circuit_breaker.open_duration
+
+        self._call(failed=True)
+        assert self.circuit_breaker.state == "open"
@@ -3,4 +3,5 @@
 Created on 23/07/2024 at 14:28:21(+01:00).
 """
 
+from .n_plus_one import NPlusOneDetection, NPlusOneDetector, NPlusOneMiddleware
 from .session import SessionMiddleware
@@ -0,0 +1,219 @@
+"""
+© Ocado Group
+Created on 19/10/2026 at 15:40:22(+01:00).
+
+Detect N+1 queries: the same query repeated from the same line of code with
+different parameters, which typically happens when a relation is lazily loaded
+for each model in a list. Repeating a query with the same parameters (e.g.
+loading the requesting user's profile more than once) isn't per-model, so it
+isn't detected.
+"""
+
+import logging
+import os
+import re
+import sys
+import sysconfig
+import typing as t
+from contextlib import ExitStack
+from dataclasses import dataclass
+
+import asgiref
+import django
+import django_filters
+import rest_framework
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from rest_framework.serializers import Serializer
+from rest_framework.views import APIView
+
+# The directories of the code which isn't the cause of N+1 queries.
+_EXCLUDED_DIRS = tuple(
+    os.path.dirname(module.__file__) + os.sep
+    for module in (asgiref, django, django_filters, rest_framework)
+    if module.__file__
+) + (__file__,)
+_STDLIB_DIR = sysconfig.get_paths()["stdlib"] + os.sep
+# Installed packages may be within the standard library's directory.
+_PACKAGE_DIRS = tuple(
+    {sysconfig.get_paths()[name] + os.sep for name in ("purelib", "platlib")}
+)
+
+# Collapse lists of placeholders so "IN (%s, %s)" and "IN (%s)" are the same.
+_PLACEHOLDER_LIST = re.compile(r"%s(?:\s*,\s*%s)+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@dataclass
+class NPlusOneDetection:
+    """A query that was repeated from the same line of code with different
+    parameters. The count is the number of different parameters."""
+
+    sql: str
+    call_site: str
+    count: int
+    view: t.Optional[str]
+    serializer_field: t.Optional[str]
+
+    def __str__(self):
+        return (
+            f"{self.count} identical queries from {self.call_site}"
+            f" (view: {self.view}, serializer field: {self.serializer_field})"
+            f": {self.sql}"
+        )
+
+
+class NPlusOneDetector:
+    """Detects N+1 queries made on any database connection within its context.
+
+    with NPlusOneDetector() as detector:
+        ...
+
+    assert not detector.detections
+    """
+
+    # The number of times the same query may be made from the same line of
+    # code, with different parameters, before it's detected.
+    threshold = 2
+
+    def __init__(self, threshold: t.Optional[int] = None):
+        if threshold is not None:
+            self.threshold = threshold
+
+        # The different parameters of each query, per line of code.
+        self.params: t.Dict[t.Tuple[str, str], t.Set[str]] = {}
+        self._detections: t.Dict[t.Tuple[str, str], NPlusOneDetection] = {}
+        self._exit_stack = ExitStack()
+        self._is_excluded_file: t.Dict[str, bool] = {}
+
+    @property
+    def detections(self):
+        """The detected N+1 queries."""
+        return list(self._detections.values())
+
+    def __enter__(self):
+        for connection in connections.all():
+            self._exit_stack.enter_context(connection.execute_wrapper(self))
+
+        return self
+
+    def __exit__(self, *args):
+        self._exit_stack.close()
+
+    @staticmethod
+    def normalize_sql(sql: str):
+        """Normalize a query's SQL so different values make the same SQL.
+
+        Args:
+            sql: The SQL with placeholders for its parameters.
+
+        Returns:
+            The normalized SQL.
+        """
+        return _PLACEHOLDER_LIST.sub("%s", _WHITESPACE.sub(" ", sql).strip())
+
+    def _get_call_site(self):
+        frame = sys._getframe(2)  # pylint: disable=protected-access
+        while frame is not None:
+            file_name = frame.f_code.co_filename
+            is_excluded = self._is_excluded_file.get(file_name)
+            if is_excluded is None:
+                is_excluded = file_name.startswith(_EXCLUDED_DIRS) or (
+                    file_name.startswith(_STDLIB_DIR)
+                    and not file_name.startswith(_PACKAGE_DIRS)
+                )
+                self._is_excluded_file[file_name] = is_excluded
+
+            if not is_excluded:
+                return frame
+
+            frame = frame.f_back
+
+        return None
+
+    @staticmethod
+    def _get_view_and_serializer_field():
+        view: t.Optional[str] = None
+        serializer_field: t.Optional[str] = None
+
+        frame = sys._getframe(2)  # pylint: disable=protected-access
+        while frame is not None and view is None:
+            _self = frame.f_locals.get("self")
+            if (
+                serializer_field is None
+                and isinstance(_self, Serializer)
+                and frame.f_code.co_name == "to_representation"
+                and "field" in frame.f_locals
+            ):
+                field_name = getattr(frame.f_locals["field"], "field_name", "")
+                serializer_field = f"{type(_self).__name__}.{field_name}"
+            elif isinstance(_self, APIView):
+                action = getattr(_self, "action", None) or frame.f_code.co_name
+                view = f"{type(_self).__name__}.{action}"
+
+            frame = frame.f_back
+
+        return view, serializer_field
+
+    # pylint: disable-next=too-many-arguments
+    def __call__(self, execute, sql, params, many, context):
+        if not many and sql.lstrip()[:6].upper() == "SELECT":
+            frame = self._get_call_site()
+            call_site = (
+                "unknown"
+                if frame is None
+                else (
+                    f"{frame.f_code.co_filename}:{frame.f_lineno}"
+                    f" in {frame.f_code.co_name}"
+                )
+            )
+            key = (self.normalize_sql(sql), call_site)
+            key_params = self.params.setdefault(key, set())
+            key_params.add(repr(params))
+            count = len(key_params)
+
+            if count == self.threshold:
+                view, serializer_field = self._get_view_and_serializer_field()
+                self._detections[key] = NPlusOneDetection(
+                    sql=key[0],
+                    call_site=call_site,
+                    count=count,
+                    view=view,
+                    serializer_field=serializer_field,
+                )
+            elif count > self.threshold:
+                self._detections[key].count = count
+
+        return execute(sql, params, many, context)
+
+
+# pylint: disable-next=too-few-public-methods
+class NPlusOneMiddleware:
+    """Logs the N+1 queries made by each request.
+
+    This is opt-in: it's only used if DEBUG or N_PLUS_ONE_DETECTION_ENABLED is
+    set. It should be placed first so all of the queries are checked.
+    """
+
+    detector_class = NPlusOneDetector
+
+    def __init__(self, get_response):
+        if not (settings.DEBUG or settings.N_PLUS_ONE_DETECTION_ENABLED):
+            raise MiddlewareNotUsed()
+
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with self.detector_class() as detector:
+            response = self.get_response(request)
+
+        for detection in detector.detections:
+            logging.warning(
+                "N+1 queries detected in request %s %s: %s",
+                request.method,
+                request.path,
+                detection,
+            )
+
+        return response
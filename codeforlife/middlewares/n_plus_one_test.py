@@ -0,0 +1,49 @@
+"""
+© Ocado Group
+Created on 19/10/2026 at 16:12:48(+01:00).
+"""
+
+from ..tests import TestCase
+from ..user.models import Student
+from .n_plus_one import NPlusOneDetector
+
+
+# pylint: disable-next=missing-class-docstring
+class TestNPlusOneDetector(TestCase):
+    fixtures = ["school_1"]
+
+    def test_detections(self):
+        """Lazily loading a relation for each model is detected once."""
+        with NPlusOneDetector() as detector:
+            students = list(Student.objects.filter(class_field__isnull=False))
+            for student in students:
+                assert student.class_field
+
+        class_ids = {student.class_field_id for student in students}
+        assert len(class_ids) >= 2
+        assert len(detector.detections) == 1
+
+        detection = detector.detections[0]
+        assert detection.count == len(class_ids)
+        assert detection.sql.startswith('SELECT "common_class"."id"')
+        assert detection.call_site.startswith(__file__)
+
+    def test_detections__none(self):
+        """Loading a relation with the models is not detected."""
+        with self.assert_no_n_plus_one_queries():
+            students = list(
+                Student.objects.filter(
+                    class_field__isnull=False
+                ).select_related("class_field")
+            )
+            for student in students:
+                assert student.class_field
+
+    def test_detections__same_params(self):
+        """Repeating a query with the same parameters is not detected."""
+        student = Student.objects.filter(class_field__isnull=False).first()
+        assert student
+
+        with self.assert_no_n_plus_one_queries():
+            for _ in range(3):
+                assert Student.objects.get(pk=student.pk).class_field
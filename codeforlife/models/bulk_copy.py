@@ -0,0 +1,192 @@
+"""
+© Ocado Group
+Created on 19/10/2026 at 09:12:37(+01:00).
+
+Bulk insert models with Postgres' COPY FROM STDIN.
+https://www.postgresql.org/docs/current/sql-copy.html
+"""
+
+import typing as t
+from io import StringIO
+
+from django.db import connections, router
+from django.db.models import Field, Model
+from django.db.models.fields import AutoFieldMixin
+from django.db.models.signals import ModelSignal, post_save, pre_save
+
+from ..response_cache import bump_generation
+
+AnyModel = t.TypeVar("AnyModel", bound=Model)
+
+# The internal types of the fields whose database values can be written as
+# text in a CSV.
+COPY_FIELD_TYPES = {
+    "AutoField",
+    "BigAutoField",
+    "SmallAutoField",
+    "BooleanField",
+    "CharField",
+    "TextField",
+    "IntegerField",
+    "BigIntegerField",
+    "SmallIntegerField",
+    "PositiveIntegerField",
+    "PositiveBigIntegerField",
+    "PositiveSmallIntegerField",
+    "FloatField",
+    "DecimalField",
+    "DateField",
+    "DateTimeField",
+    "TimeField",
+    "UUIDField",
+    "GenericIPAddressField",
+    "ForeignKey",
+    "OneToOneField",
+}
+
+
+def _has_receivers(signal: ModelSignal, model_class: t.Type[Model]):
+    return any(
+        # Model receivers are connected to all senders but only handle some.
+        getattr(receiver, "receives_sender", lambda _: True)(model_class)
+        # pylint: disable-next=protected-access
+        for receiver in signal._live_receivers(model_class)
+    )
+
+
+def can_bulk_copy(
+    model_class: t.Type[Model],
+    using: t.Optional[str] = None,
+    objs: t.Optional[t.Iterable[Model]] = None,
+):
+    """Check if a model can be bulk inserted with COPY.
+
+    Args:
+        model_class: The class of the models to insert.
+        using: The alias of the database to insert into.
+        objs: The models to insert. Required if the primary key isn't
+            auto-incremented, to check every model has its primary key set.
+
+    Returns:
+        A flag designating whether the model can be bulk inserted with COPY.
+    """
+    using = using or router.db_for_write(model_class)
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        return False
+
+    # COPY FROM STDIN is only supported by psycopg2's cursors.
+    with connection.cursor() as cursor:
+        if not hasattr(cursor, "copy_expert"):
+            return False
+
+    # Leave models with save side-effects to bulk_create.
+    if _has_receivers(pre_save, model_class) or _has_receivers(
+        post_save, model_class
+    ):
+        return False
+
+    # pylint: disable-next=protected-access
+    opts = model_class._meta
+    # Multi-table inheritance inserts into more than one table.
+    if opts.parents and not opts.proxy:
+        return False
+
+    # pylint: disable-next=protected-access
+    concrete_opts = opts.concrete_model._meta
+    # Only auto-incremented primary keys can be allocated from a sequence.
+    if not isinstance(concrete_opts.pk, AutoFieldMixin) and (
+        objs is None or any(obj.pk is None for obj in objs)
+    ):
+        return False
+
+    return all(
+        field.get_internal_type() in COPY_FIELD_TYPES
+        for field in concrete_opts.local_concrete_fields
+    )
+
+
+def _to_csv_value(value) -> str:
+    # An unquoted empty value is NULL. Every other value is quoted so empty
+    # strings are not.
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        value = "t" if value else "f"
+
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def bulk_copy(
+    model_class: t.Type[AnyModel],
+    objs: t.List[AnyModel],
+    using: t.Optional[str] = None,
+):
+    """Bulk insert many models with COPY and set their primary keys.
+
+    The caller is expected to check the models can be copied first with
+    `can_bulk_copy`. Auto-incremented primary keys are allocated from the
+    table's sequence before copying, so the models are returned with their
+    primary keys set, like with bulk_create. As COPY doesn't send save signals,
+    the model's response cache generation is bumped.
+
+    Args:
+        model_class: The class of the models to insert.
+        objs: The models to insert.
+        using: The alias of the database to insert into.
+
+    Returns:
+        The inserted models.
+    """
+    if not objs:
+        return objs
+
+    using = using or router.db_for_write(model_class)
+    connection = connections[using]
+    # pylint: disable-next=protected-access
+    opts = model_class._meta.concrete_model._meta
+    fields: t.List[Field] = list(opts.local_concrete_fields)
+
+    with connection.cursor() as cursor:
+        pending_objs = [obj for obj in objs if obj.pk is None]
+        if pending_objs:
+            cursor.execute(
+                "SELECT nextval(pg_get_serial_sequence(%s, %s))"
+                " FROM generate_series(1, %s)",
+                [opts.db_table, opts.pk.column, len(pending_objs)],
+            )
+            for obj, (pk,) in zip(pending_objs, cursor.fetchall()):
+                obj.pk = pk
+
+        buffer = StringIO()
+        for obj in objs:
+            buffer.write(
+                ",".join(
+                    _to_csv_value(
+                        field.get_db_prep_save(
+                            field.pre_save(obj, add=True), connection
+                        )
+                    )
+                    for field in fields
+                )
+            )
+            buffer.write("\n")
+        buffer.seek(0)
+
+        quote_name = connection.ops.quote_name
+        cursor.copy_expert(
+            f"COPY {quote_name(opts.db_table)}"
+            f" ({', '.join(quote_name(field.column) for field in fields)})"
+            " FROM STDIN WITH (FORMAT csv)",
+            buffer,
+        )
+
+    for obj in objs:
+        # pylint: disable-next=protected-access
+        obj._state.adding = False
+        # pylint: disable-next=protected-access
+        obj._state.db = using
+
+    bump_generation(model_class)
+
+    return objs
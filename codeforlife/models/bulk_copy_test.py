@@ -0,0 +1,152 @@
+"""
+© Ocado Group
+Created on 19/10/2026 at 21:36:02(+01:00).
+"""
+
+from contextlib import nullcontext
+from unittest.mock import patch
+
+from common.models import DynamicElement  # type: ignore[import-untyped]
+from django.db import connection
+from django.db.models.signals import pre_save
+from django.test.utils import CaptureQueriesContext
+
+from ..tests import TestCase
+from ..tests.dynamic_element import (
+    DynamicElementSerializer,
+    DynamicElementViewSet,
+)
+from ..user.models import MailOutboxMessage, Session, Teacher
+from .bulk_copy import bulk_copy, can_bulk_copy
+
+
+# pylint: disable-next=missing-class-docstring
+class TestBulkCopy(TestCase):
+    def test_bulk_copy(self):
+        """Values are escaped and empty strings are not copied as NULL."""
+        texts = [
+            'A "quoted", comma-separated\nmulti-line \\ text\r\n',
+            "",
+            None,
+            "\\N",
+        ]
+        objs = [
+            DynamicElement(
+                name=f"copy {index}", active=index % 2 == 0, text=text
+            )
+            for index, text in enumerate(texts)
+        ]
+
+        with CaptureQueriesContext(connection) as captured:
+            bulk_copy(DynamicElement, objs)
+
+        assert not any(
+            query["sql"].startswith("INSERT")
+            for query in captured.captured_queries
+        )
+
+        for obj, text in zip(objs, texts):
+            assert obj.pk is not None
+            assert not obj._state.adding  # pylint: disable=protected-access
+
+            copied = DynamicElement.objects.get(pk=obj.pk)
+            assert copied.name == obj.name
+            assert copied.active == obj.active
+            assert copied.text == text
+
+    def test_bulk_copy__pk(self):
+        """Primary keys are only allocated from the sequence if not set."""
+        last = DynamicElement.objects.create(name="last")
+        objs = [
+            DynamicElement(name="allocated 1", active=True),
+            DynamicElement(pk=last.pk + 100, name="set", active=True),
+            DynamicElement(name="allocated 2", active=True),
+        ]
+
+        bulk_copy(DynamicElement, objs)
+
+        assert [obj.pk for obj in objs] == [
+            last.pk + 1,
+            last.pk + 100,
+            last.pk + 2,
+        ]
+        assert list(
+            DynamicElement.objects.filter(pk__gt=last.pk)
+            .order_by("pk")
+            .values_list("pk", "name")
+        ) == [
+            (last.pk + 1, "allocated 1"),
+            (last.pk + 2, "allocated 2"),
+            (last.pk + 100, "set"),
+        ]
+
+    def test_can_bulk_copy(self):
+        """Models with auto-incremented primary keys and CSV-compatible
+        fields can be copied."""
+        assert can_bulk_copy(DynamicElement)
+
+    def test_can_bulk_copy__receivers(self):
+        """Models with save receivers can't be copied, unlike models whose
+        only receivers are for other models."""
+        assert not can_bulk_copy(Teacher)
+
+        def receiver(**_):
+            pass
+
+        pre_save.connect(receiver, sender=DynamicElement)
+        try:
+            assert not can_bulk_copy(DynamicElement)
+        finally:
+            pre_save.disconnect(receiver, sender=DynamicElement)
+
+    def test_can_bulk_copy__field_types(self):
+        """Models with fields which can't be written as CSV text can't be
+        copied."""
+        assert not can_bulk_copy(MailOutboxMessage)
+
+    def test_can_bulk_copy__pk(self):
+        """Models whose primary keys aren't auto-incremented can only be
+        copied if every model's primary key is set."""
+        assert not can_bulk_copy(Session)
+        assert not can_bulk_copy(Session, objs=[Session(session_key=None)])
+        assert can_bulk_copy(Session, objs=[Session(session_key="a")])
+
+    def test_can_bulk_copy__copy_expert(self):
+        """Models can't be copied if the database driver's cursors don't
+        support COPY FROM STDIN."""
+        with patch.object(
+            connection, "cursor", return_value=nullcontext(object())
+        ):
+            assert not can_bulk_copy(DynamicElement)
+
+    def test_create__copy_threshold(self):
+        """A list serializer bulk creates models with COPY once the number of
+        models reaches its copy threshold."""
+        view = DynamicElementViewSet()
+
+        for count, copied in [(1, False), (2, True)]:
+            serializer = DynamicElementSerializer(
+                data=[
+                    {
+                        "name": f"element {count} {index}",
+                        "active": True,
+                        "text": "",
+                    }
+                    for index in range(count)
+                ],
+                many=True,
+                context={"view": view},
+            )
+            serializer.is_valid(raise_exception=True)
+
+            with CaptureQueriesContext(connection) as captured:
+                objs = serializer.save()
+
+            assert copied != any(
+                query["sql"].startswith("INSERT")
+                for query in captured.captured_queries
+            )
+            assert all(obj.pk is not None for obj in objs)
+            assert DynamicElement.objects.filter(
+                pk__in=[obj.pk for obj in objs], text=""
+            ).count() == len(objs)
@@ -41,20 +41,23 @@ def model_receiver(base: t.Type[AnyModel]):
     ):
         senders = sender
 
+        def receives_sender(sender: t.Type[AnyModel]):
+            if sender is base:
+                return True
+            if senders is None:
+                return issubclass(sender, base)
+            return sender in senders
+
         def decorator(handler: t.Callable):
             def handler_wrapper(
                 sender: t.Type[AnyModel], instance, *args, **kwargs
             ):
-                def handle_signal():
+                if receives_sender(sender):
                     handler(sender, instance, *args, **kwargs)
 
-                if sender is base:
-                    handle_signal()
-                elif senders is None:
-                    if issubclass(sender, base):
-                        handle_signal()
-                elif sender in senders:
-                    handle_signal()
+            # Lets callers check which senders are handled, as the wrapper is
+            # connected to all senders.
+            setattr(handler_wrapper, "receives_sender", receives_sender)
 
             return _receiver(signal, **kwargs)(handler_wrapper)
 
@@ -3,21 +3,173 @@
 Created on 11/04/2024 at 11:22:25(+01:00).
 """
 
+import json
+import typing as t
+from hashlib import md5
+from urllib.parse import parse_qs, urlparse
+
+from asgiref.sync import sync_to_async
 from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from rest_framework.pagination import CursorPagination as _CursorPagination
 from rest_framework.pagination import (
     LimitOffsetPagination as _LimitOffsetPagination,
 )
 from rest_framework.response import Response
 
+CountStrategy = t.Literal["exact", "cached", "estimate"]
+
 
 class LimitOffsetPagination(_LimitOffsetPagination):
-    """Default pagination class for all list actions."""
+    """Default pagination class for all list actions.
+
+    How the total count is got depends on the count strategy, which a view
+    set may override by setting its own "count_strategy":
+    - "exact": count the models on every request.
+    - "cached": count the models once per query and cache it for a while.
+    - "estimate": use the planner's estimate if it reaches a threshold, else
+        count the models.
+
+    The count is always omitted (null) if the request's "count" query
+    parameter is "false".
+    """
 
     # Set larger limits when debugging to avoid having to paginate lists.
     # When deployed, the limits should be reasonable for performance reasons.
     default_limit = 1000000 if settings.DEBUG else 50
     max_limit = 1000000 if settings.DEBUG else 150
 
+    count_strategy: CountStrategy = "exact"
+    count_query_param = "count"
+    # How many seconds to cache a count for.
+    count_cache_timeout = 60
+    # The min number of estimated rows to trust the planner's estimate.
+    count_estimate_threshold = 10000
+
+    count: t.Optional[int]  # type: ignore[assignment]
+
+    def get_count_strategy(
+        self, request, view=None
+    ) -> t.Optional[CountStrategy]:
+        """Get the strategy to count the models with.
+
+        Args:
+            request: The request to paginate.
+            view: The view paginating the request.
+
+        Returns:
+            The count strategy or None if the count is omitted.
+        """
+        if request.query_params.get(self.count_query_param) == "false":
+            return None
+
+        return getattr(view, "count_strategy", self.count_strategy)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        # pylint: disable=attribute-defined-outside-init
+        self.request = request
+        self.limit = self.get_limit(request)
+        if self.limit is None:
+            return None
+
+        self.offset = self.get_offset(request)
+        strategy = self.get_count_strategy(request, view)
+        if strategy is None:
+            self.count = None
+        elif strategy == "cached":
+            self.count = self.get_cached_count(queryset)
+        elif strategy == "estimate":
+            self.count = self.get_estimated_count(queryset)
+        else:
+            self.count = self.get_count(queryset)
+            if self.count == 0 or self.offset > self.count:
+                return []
+
+        return list(queryset[self.offset : self.offset + self.limit])
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """Paginate a queryset with the async ORM.
+
+        Args:
+            queryset: The queryset to paginate.
+            request: The request to paginate.
+            view: The view paginating the request.
+
+        Returns:
+            The models in the page or None if the request isn't paginated.
+        """
+        # pylint: disable=attribute-defined-outside-init
+        self.request = request
+        self.limit = self.get_limit(request)
+        if self.limit is None:
+            return None
+
+        self.offset = self.get_offset(request)
+        strategy = self.get_count_strategy(request, view)
+        if strategy is None:
+            self.count = None
+        elif strategy == "cached":
+            self.count = await sync_to_async(self.get_cached_count)(queryset)
+        elif strategy == "estimate":
+            self.count = await sync_to_async(self.get_estimated_count)(queryset)
+        else:
+            self.count = await queryset.acount()
+            if self.count == 0 or self.offset > self.count:
+                return []
+
+        return [
+            model
+            async for model in queryset[self.offset : self.offset + self.limit]
+        ]
+
+    def get_cached_count(self, queryset) -> int:
+        """Get the count of a query from the cache, if it was counted recently.
+
+        Args:
+            queryset: The queryset to count.
+
+        Returns:
+            The count of the queryset.
+        """
+        sql, params = queryset.query.sql_with_params()
+        signature = md5(
+            f"{queryset.db}:{sql}:{params!r}".encode(), usedforsecurity=False
+        ).hexdigest()
+
+        return cache.get_or_set(
+            f"pagination:count:{signature}",
+            lambda: self.get_count(queryset),
+            timeout=self.count_cache_timeout,
+        )
+
+    def get_estimated_count(self, queryset) -> int:
+        """Get the planner's estimate of the count of a query, if it's large
+        enough to be worth not counting exactly.
+
+        Args:
+            queryset: The queryset to count.
+
+        Returns:
+            The estimated or exact count of the queryset.
+        """
+        connection = connections[queryset.db]
+        if connection.vendor != "postgresql":
+            return self.get_count(queryset)
+
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+
+        estimate = int(plan[0]["Plan"]["Plan Rows"])
+        if estimate < self.count_estimate_threshold:
+            return self.get_count(queryset)
+
+        return estimate
+
     def get_paginated_response(self, data):
         return Response(
             {
@@ -28,3 +180,39 @@ class LimitOffsetPagination(_LimitOffsetPagination):
                 "data": data,
             }
         )
+
+
+class KeysetPagination(_CursorPagination):
+    """Keyset pagination for list actions.
+
+    Instead of counting all the models and skipping to an offset, each page
+    seeks past the last model of the previous page by its primary key. Deep
+    pages are as fast as the first one. Set it as a view set's
+    pagination_class to opt in.
+
+    The response shares the limit-offset envelope, with the opaque "next" and
+    "previous" cursors replacing the count and offset. Pass a cursor back as
+    the "cursor" query parameter to get the next or previous page.
+    """
+
+    ordering = "pk"
+    page_size_query_param = "limit"
+    page_size = LimitOffsetPagination.default_limit
+    max_page_size = LimitOffsetPagination.max_limit
+
+    def _get_cursor(self, link: t.Optional[str]):
+        if link is None:
+            return None
+
+        return parse_qs(urlparse(link).query)[self.cursor_query_param][0]
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "next": self._get_cursor(self.get_next_link()),
+                "previous": self._get_cursor(self.get_previous_link()),
+                "limit": self.page_size,
+                "max_limit": self.max_page_size,
+                "data": data,
+            }
+        )
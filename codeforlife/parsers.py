@@ -0,0 +1,37 @@
+"""
+© Ocado Group
+Created on 19/10/2026 at 14:34:16(+01:00).
+
+Override default parsers.
+"""
+
+import codecs
+
+import orjson
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser as _JSONParser
+
+from .renderers import JSONRenderer
+
+
+# pylint: disable-next=too-few-public-methods
+class JSONParser(_JSONParser):
+    """Parses JSON with orjson instead of the standard library's json
+    module."""
+
+    renderer_class = JSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+
+        data = stream.read()
+        # orjson only decodes UTF-8.
+        if codecs.lookup(encoding).name != "utf-8":
+            data = data.decode(encoding)
+
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}") from exc
@@ -0,0 +1,31 @@
+"""
+© Ocado Group
+Created on 19/10/2026 at 14:27:51(+01:00).
+
+Override default renderers.
+"""
+
+import orjson
+from rest_framework.renderers import JSONRenderer as _JSONRenderer
+
+from .encoders import dumps
+
+
+class JSONRenderer(_JSONRenderer):
+    """Renders JSON with orjson instead of the standard library's json module.
+
+    The JSON is always compact and UTF-8 encoded. If an indent is requested,
+    it's rendered with an indent of 2 spaces.
+
+    The JSON is always strict, as orjson renders NaN and infinity as null.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        indent = self.get_indent(
+            accepted_media_type or "", renderer_context or {}
+        )
+
+        return dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
@@ -0,0 +1,84 @@
+"""
+© Ocado Group
+Created on 19/10/2026 at 14:52:13(+01:00).
+"""
+
+import json
+import typing as t
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from io import BytesIO
+from uuid import uuid4
+
+from django.utils.translation import gettext_lazy
+from rest_framework.parsers import JSONParser as _JSONParser
+from rest_framework.renderers import JSONRenderer as _JSONRenderer
+
+from .parsers import JSONParser
+from .renderers import JSONRenderer
+from .tests import TestCase
+
+
+# pylint: disable-next=missing-class-docstring
+class TestJSONRenderer(TestCase):
+    def setUp(self):
+        now = datetime(2026, 10, 19, 14, 52, 13, 123456, tzinfo=timezone.utc)
+
+        # A page of nested users.
+        self.data: t.Dict[str, t.Any] = {
+            "count": 150,
+            "offset": 0,
+            "limit": 150,
+            "max_limit": 1000,
+            "detail": gettext_lazy("Users"),
+            "score": Decimal("12.5"),
+            "data": [
+                {
+                    "id": index,
+                    "uuid": uuid4(),
+                    "first_name": f"Fïrst {index}\u2028",
+                    "last_name": "Last",
+                    "email": f"user.{index}@codeforlife.com",
+                    "is_active": True,
+                    "date_joined": now - timedelta(days=index),
+                    "birthday": date(2000, 1, 1),
+                    "student": {
+                        "klass": "AB123",
+                        "school": {"id": 1, "name": "School 1"},
+                    },
+                    "teacher": None,
+                    "requesting_to_join_class": None,
+                    "scores": {1: 10, 2: 20},
+                }
+                for index in range(150)
+            ],
+        }
+
+    def test_render(self):
+        """Renders the same JSON as DRF's renderer."""
+        renderer = JSONRenderer()
+        drf_renderer = _JSONRenderer()
+
+        rendered = renderer.render(self.data)
+        drf_rendered = drf_renderer.render(self.data)
+        assert json.loads(rendered) == json.loads(drf_rendered)
+        assert b"\\u2028" in rendered
+
+    def test_render__non_finite_float(self):
+        """Renders NaN and infinity as null, so the JSON is always strict."""
+        renderer = JSONRenderer()
+
+        for value in [float("nan"), float("inf"), -float("inf")]:
+            rendered = renderer.render({"data": [{"scores": (1.5, value)}]})
+
+            assert rendered == b'{"data":[{"scores":[1.5,null]}]}'
+
+    def test_parse(self):
+        """Parses the same data as DRF's parser."""
+        parser = JSONParser()
+        drf_parser = _JSONParser()
+        rendered = JSONRenderer().render(self.data)
+
+        assert parser.parse(BytesIO(rendered)) == drf_parser.parse(
+            BytesIO(rendered)
+        )
@@ -0,0 +1,89 @@
+"""
+© Ocado Group
+Created on 19/10/2026 at 11:04:21(+01:00).
+
+Helpers to cache responses until the models they depend on change.
+
+Each model has a generation in the cache, which is bumped whenever one of its
+instances is saved or deleted. A cached response's key includes the current
+generations of the models it depends on, so bumping a generation orphans all
+the responses that depend on that model and they expire with their timeout.
+
+Generations are bumped by the model's post_save and post_delete receivers, and
+by the bulk creates and updates of the model list serializers and bulk_copy.
+QuerySet.update(), bulk_create(), bulk_update() and raw SQL don't send signals,
+so callers must call bump_generation after using them directly.
+
+The generations and responses are kept in the default cache, which must be
+shared by all of a service's processes (e.g. Redis or Memcached) when it runs
+more than one. Django's default local-memory cache is per process, so a bump in
+one process isn't seen by the others, which keep serving their stale responses
+until they expire.
+"""
+
+import typing as t
+from time import time_ns
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Model
+
+
+def get_generation_key(model_class: t.Type[Model]):
+    """Get the cache key of a model's generation.
+
+    Proxies share the generation of their concrete model.
+
+    Args:
+        model_class: The class of the model.
+
+    Returns:
+        The cache key.
+    """
+    # pylint: disable-next=protected-access
+    concrete_model = t.cast(t.Type[Model], model_class._meta.concrete_model)
+
+    # pylint: disable-next=protected-access
+    return f"response_cache:generation:{concrete_model._meta.label}"
+
+
+def get_generations(model_classes: t.Iterable[t.Type[Model]]):
+    """Get the current generations of many models.
+
+    A missing generation (never set or evicted) is set to a new value, so it
+    can't match the generation of a previously cached response.
+
+    Args:
+        model_classes: The classes of the models.
+
+    Returns:
+        The generations, in the same order as the models.
+    """
+    keys = [get_generation_key(model_class) for model_class in model_classes]
+    generations: t.Dict[str, int] = cache.get_many(keys)
+    for key in keys:
+        if key not in generations:
+            cache.add(key, time_ns(), timeout=None)
+            generations[key] = cache.get(key)
+
+    return [generations[key] for key in keys]
+
+
+def bump_generation(model_class: t.Type[Model]):
+    """Bump a model's generation, now and once the current transaction is
+    committed, so a response cached while the transaction was open (with the
+    old data) is also orphaned.
+
+    Args:
+        model_class: The class of the model.
+    """
+    key = get_generation_key(model_class)
+
+    def bump():
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, time_ns(), timeout=None)
+
+    bump()
+    transaction.on_commit(bump)
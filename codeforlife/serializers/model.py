@@ -7,7 +7,12 @@ Base model serializers.
 
 import typing as t
 
+from django.core.exceptions import FieldDoesNotExist
 from django.db.models import Model
+from rest_framework.fields import Field, SkipField
+from rest_framework.relations import PKOnlyObject, RelatedField
+from rest_framework.serializers import BaseSerializer as _BaseSerializer
+from rest_framework.serializers import ListSerializer as _ListSerializer
 from rest_framework.serializers import ModelSerializer as _ModelSerializer
 
 from ..request import BaseRequest, Request
@@ -32,21 +37,258 @@ AnyBaseRequest = t.TypeVar("AnyBaseRequest", bound=BaseRequest)
 # pylint: enable=duplicate-code
 
 
+def _get_leaf_names(names: t.Set[str]):
+    # Selecting or prefetching "a__b" also selects or prefetches "a".
+    return {
+        name
+        for name in names
+        if not any(other.startswith(f"{name}__") for other in names)
+    }
+
+
+# pylint: disable-next=too-many-arguments
+def _add_related_names(
+    serializer: _BaseSerializer,
+    model: t.Type[Model],
+    prefix: t.List[str],
+    many: bool,
+    select_related: t.Set[str],
+    prefetch_related: t.Set[str],
+):
+    for field in t.cast(t.Dict[str, Field], serializer.fields).values():
+        if not field.source_attrs:  # source="*"
+            continue
+        if (
+            isinstance(field, RelatedField)
+            and field.use_pk_only_optimization()
+            and len(field.source_attrs) == 1
+        ):
+            continue
+
+        # Walk the relations in the field's source.
+        path = list(prefix)
+        field_many = many
+        related_model: t.Optional[t.Type[Model]] = model
+        for attr in field.source_attrs:
+            try:
+                # pylint: disable-next=protected-access
+                opts = t.cast(t.Type[Model], related_model)._meta
+                model_field = opts.get_field(attr)
+            except FieldDoesNotExist:
+                related_model = None
+                break
+            if not model_field.is_relation:
+                related_model = None
+                break
+
+            path.append(attr)
+            field_many = field_many or bool(
+                model_field.one_to_many or model_field.many_to_many
+            )
+            (prefetch_related if field_many else select_related).add(
+                "__".join(path)
+            )
+            related_model = model_field.related_model
+
+        if related_model is None:
+            continue
+
+        if isinstance(field, _ListSerializer):
+            field = field.child
+        if isinstance(field, _BaseSerializer):
+            _add_related_names(
+                field,
+                related_model,
+                prefix=path,
+                many=field_many,
+                select_related=select_related,
+                prefetch_related=prefetch_related,
+            )
+
+
 class BaseModelSerializer(
     BaseSerializer[AnyBaseRequest],
     _ModelSerializer[AnyModel],
     t.Generic[AnyBaseRequest, AnyBaseModelViewSet, AnyModel],
 ):
-    """Base model serializer for all model serializers."""
+    """Base model serializer for all model serializers.
+
+    A GET request may ask for a sparse fieldset with the "fields" query
+    parameter, a comma-separated list of the fields to serialize. Nested
+    serializers are only serialized if they are listed in either the "fields"
+    or the "expand" query parameter. For example:
+    "?fields=id,first_name&expand=student". If only "expand" is given, all the
+    fields but the nested serializers not listed in it are serialized. For
+    example: "?expand=student".
+    """
 
     instance: t.Optional[AnyModel]
     view: AnyBaseModelViewSet
 
+    fields_query_param = "fields"
+    expand_query_param = "expand"
+
     @property
     def non_none_instance(self):
         """Casts the instance to not None."""
         return t.cast(AnyModel, self.instance)
 
+    def get_sparse_field_names(
+        self, fields: t.Optional[t.Dict[str, Field]] = None
+    ) -> t.Optional[t.Set[str]]:
+        """Get the names of the fields the request asked to serialize.
+
+        Only the top-level serializer of a GET request is sparse.
+
+        Args:
+            fields: The serializer's fields, before they're made sparse. If
+                None, the serializer's fields are used.
+
+        Returns:
+            The names of the fields or None if all the fields are serialized.
+        """
+        parent = self.parent
+        if isinstance(parent, _ListSerializer):
+            parent = parent.parent
+        if parent is not None:
+            return None
+
+        request = self.context.get("request")
+        if request is None or request.method != "GET":
+            return None
+
+        def get_names(query_param: str):
+            return {
+                name.strip()
+                for name in request.GET.get(query_param, "").split(",")
+                if name.strip()
+            }
+
+        names = get_names(self.fields_query_param)
+        expand_names = get_names(self.expand_query_param)
+        if not names:
+            if not expand_names:
+                return None
+
+            # Serialize all the fields but the nested serializers not expanded.
+            names = {
+                field_name
+                for field_name, field in (fields or self.fields).items()
+                if not isinstance(field, _BaseSerializer)
+            }
+
+        return names | expand_names
+
+    def get_fields(self):
+        fields = super().get_fields()
+
+        names = self.get_sparse_field_names(fields)
+        if names is not None:
+            fields = {
+                field_name: field
+                for field_name, field in fields.items()
+                if field_name in names
+            }
+
+        return fields
+
+    def get_model_field_names(self) -> t.Optional[t.Set[str]]:
+        """Get the names of the model's fields this serializer reads or writes.
+
+        Reverse relations are skipped as they're not columns of the model's
+        table. A field sourced from the whole model ("*") or from a
+        non-concrete attribute (e.g. a property) could read any column.
+
+        Returns:
+            The names of the model's fields or None if they can't be known.
+        """
+        # pylint: disable-next=no-member,protected-access
+        opts = self.Meta.model._meta
+        names = {t.cast(str, opts.pk.name)}
+        for field in self.fields.values():
+            if not field.source_attrs:  # source="*"
+                return None
+
+            try:
+                model_field = opts.get_field(field.source_attrs[0])
+            except FieldDoesNotExist:
+                return None
+
+            if model_field.auto_created and not model_field.concrete:
+                continue
+            if not model_field.concrete or model_field.many_to_many:
+                return None
+
+            names.add(model_field.name)
+
+        return names
+
+    def get_related_names(self) -> t.Tuple[t.Set[str], t.Set[str]]:
+        """Get the relations of the model this serializer traverses.
+
+        The relations are inferred from the fields' dotted sources and from
+        nested serializers. Primary-key related fields are skipped as they only
+        read the foreign key's column.
+
+        Returns:
+            The relations to select and the relations to prefetch.
+        """
+        select_related: t.Set[str] = set()
+        prefetch_related: t.Set[str] = set()
+        _add_related_names(
+            self,
+            self.Meta.model,  # pylint: disable=no-member
+            prefix=[],
+            many=False,
+            select_related=select_related,
+            prefetch_related=prefetch_related,
+        )
+
+        return (
+            _get_leaf_names(select_related),
+            _get_leaf_names(prefetch_related),
+        )
+
+    def compile_to_representation(self) -> t.Callable[[AnyModel], DataDict]:
+        """Compile a function that serializes a model with this serializer's
+        readable fields, for serializing many models with one serializer.
+
+        The function's output is the same as the default to_representation's
+        (not this serializer's if it's overridden), but the readable fields
+        and their methods are looked up once instead of once per model.
+
+        Returns:
+            A function that serializes a model to a dict.
+        """
+        fields = [
+            (field.field_name, field.get_attribute, field.to_representation)
+            # pylint: disable-next=protected-access
+            for field in self._readable_fields
+        ]
+
+        def to_representation(instance: AnyModel):
+            data: DataDict = {}
+            for field_name, get_attribute, to_representation in fields:
+                try:
+                    attribute = get_attribute(instance)
+                except SkipField:
+                    continue
+
+                data[field_name] = (
+                    None
+                    if (
+                        attribute.pk
+                        if isinstance(attribute, PKOnlyObject)
+                        else attribute
+                    )
+                    is None
+                    else to_representation(attribute)
+                )
+
+            return data
+
+        return to_representation
+
     # pylint: disable-next=useless-parent-delegation
     def update(self, instance: AnyModel, validated_data: DataDict) -> AnyModel:
         return super().update(instance, validated_data)
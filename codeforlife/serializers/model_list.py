@@ -6,12 +6,23 @@ Base model list serializers.
 """
 
 import typing as t
-
-from django.db.models import Model
+from contextlib import contextmanager
+from copy import copy
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db.models import Field, Model
+from rest_framework.relations import (
+    ManyRelatedField,
+    PrimaryKeyRelatedField,
+    RelatedField,
+    SlugRelatedField,
+)
 from rest_framework.serializers import ListSerializer as _ListSerializer
 from rest_framework.serializers import ValidationError as _ValidationError
 
+from ..models.bulk_copy import bulk_copy, can_bulk_copy
 from ..request import BaseRequest, Request
+from ..response_cache import bump_generation
 from ..types import DataDict, OrderedDataDict
 from .base import BaseSerializer
 
@@ -61,6 +72,8 @@ class BaseModelListSerializer(
 
     instance: t.Optional[t.List[AnyModel]]
     batch_size: t.Optional[int] = None
+    # The min number of models to create with COPY instead of INSERT.
+    copy_threshold: t.Optional[int] = None
     view: AnyBaseModelViewSet
 
     @property
@@ -85,17 +98,34 @@ class BaseModelListSerializer(
 
         https://www.django-rest-framework.org/api-guide/serializers/#customizing-multiple-create
 
+        If the number of models to create reaches the copy threshold, the
+        models are created with COPY, unless the model doesn't support it.
+
+        As bulk creates don't send save signals, the model's response cache
+        generation is bumped.
+
         Args:
             validated_data: The data used to create the models.
 
         Returns:
             The models.
         """
+        objs = [self.model_class(**data) for data in validated_data]
+        if (
+            self.copy_threshold is not None
+            and len(objs) >= self.copy_threshold
+            and can_bulk_copy(self.model_class, objs=objs)
+        ):
+            return bulk_copy(self.model_class, objs)
+
         # pylint: disable-next=line-too-long
-        return self.model_class.objects.bulk_create(  # type: ignore[attr-defined]
-            objs=[self.model_class(**data) for data in validated_data],
+        objs = self.model_class.objects.bulk_create(  # type: ignore[attr-defined]
+            objs=objs,
             batch_size=self.batch_size,
         )
+        bump_generation(self.model_class)
+
+        return objs
 
     def update(
         self,
@@ -106,6 +136,9 @@ class BaseModelListSerializer(
 
         https://www.django-rest-framework.org/api-guide/serializers/#customizing-multiple-update
 
+        As bulk updates don't send save signals, the model's response cache
+        generation is bumped.
+
         Args:
             instance: The models to update.
             validated_data: The field-value pairs to update for each model.
@@ -113,7 +146,7 @@ class BaseModelListSerializer(
         Returns:
             The models.
         """
-        # Models and data must have equal length and be ordered the same!
+        # Models and data have equal length and are ordered the same.
         for model, data in zip(instance, validated_data):
             for field, value in data.items():
                 setattr(model, field, value)
@@ -123,6 +156,7 @@ class BaseModelListSerializer(
             fields={field for data in validated_data for field in data.keys()},
             batch_size=self.batch_size,
         )
+        bump_generation(self.model_class)
 
         return instance
 
@@ -142,38 +176,215 @@ class BaseModelListSerializer(
                     "Nothing to update.",
                     code="nothing_to_update",
                 )
-            if len(attrs) != len(self.instance):
-                raise _ValidationError(
-                    "Some models do not exist.",
-                    code="models_do_not_exist",
-                )
 
         return attrs
 
+    @staticmethod
+    def _get_related_key_field(relation: RelatedField):
+        """Get the model field a related field looks up its objects by.
+
+        Args:
+            relation: The related field.
+
+        Returns:
+            The model field or None if the lookup is not supported in bulk.
+        """
+        # pylint: disable-next=protected-access
+        opts = relation.get_queryset().model._meta
+        if isinstance(relation, PrimaryKeyRelatedField):
+            if relation.pk_field is None:
+                return opts.pk
+        elif isinstance(relation, SlugRelatedField):
+            if "__" not in relation.slug_field:
+                return opts.get_field(relation.slug_field)
+
+        return None
+
+    @staticmethod
+    def _get_key(key_field: Field, value):
+        """Get the normalized key of a model field's value, if it's valid."""
+        if isinstance(value, bool):
+            return None
+        try:
+            return str(key_field.to_python(value))
+        except (ValidationError, TypeError, ValueError):
+            return None
+
+    def _get_related_objects(self, data: BulkCreateDataList):
+        """Get the related objects of all the data items with one query per
+        related field.
+
+        Only primary-key and slug related fields are resolved in bulk.
+
+        Args:
+            data: The data items to validate.
+
+        Returns:
+            The related field's key field and objects, by the related field's
+            name. An object is None if its key is not unique.
+        """
+        related_objects: t.Dict[
+            str, t.Tuple[Field, t.Dict[str, t.Optional[Model]]]
+        ] = {}
+        for field_name, field in self.child.fields.items():
+            if field.read_only:
+                continue
+
+            many = isinstance(field, ManyRelatedField)
+            relation = field.child_relation if many else field
+            if not isinstance(relation, RelatedField):
+                continue
+            key_field = self._get_related_key_field(relation)
+            if key_field is None:
+                continue
+
+            keys: t.Set[str] = set()
+            for item in data:
+                if isinstance(item, dict) and field_name in item:
+                    values = item[field_name]
+                    if not (many and isinstance(values, list)):
+                        values = [values]
+                    keys.update(
+                        key
+                        for key in (
+                            self._get_key(key_field, value) for value in values
+                        )
+                        if key is not None
+                    )
+            if not keys:
+                continue
+
+            objects: t.Dict[str, t.Optional[Model]] = {}
+            for obj in relation.get_queryset().filter(
+                **{f"{key_field.name}__in": keys}
+            ):
+                key = str(getattr(obj, key_field.attname))
+                # Leave duplicate slugs to the field's default lookup.
+                objects[key] = None if key in objects else obj
+
+            related_objects[field_name] = (key_field, objects)
+
+        return related_objects
+
+    @contextmanager
+    def _resolve_related_objects(self, data: BulkCreateDataList):
+        """Validate the data items with a copy of the child serializer whose
+        related fields look up the objects resolved in bulk.
+
+        Any value that was not resolved falls back to the field's default
+        lookup, so validation errors for missing or invalid values are
+        unchanged. The child serializer and its fields are not modified, as
+        they may be shared.
+
+        Args:
+            data: The data items to validate.
+        """
+        related_objects = self._get_related_objects(data)
+        if not related_objects:
+            yield
+            return
+
+        # Copy the child without its fields, so the copy binds its own.
+        child = copy(self.child)
+        child.__dict__.pop("fields", None)
+        for field_name, (key_field, objects) in related_objects.items():
+            field = child.fields[field_name]
+            relation = (
+                field.child_relation
+                if isinstance(field, ManyRelatedField)
+                else field
+            )
+            setattr(
+                relation,
+                "to_internal_value",
+                self._make_related_object_resolver(
+                    relation, key_field, objects
+                ),
+            )
+
+        self.child, original_child = child, self.child
+        try:
+            yield
+        finally:
+            self.child = original_child
+
+    @classmethod
+    def _make_related_object_resolver(
+        cls,
+        relation: RelatedField,
+        key_field: Field,
+        objects: t.Dict[str, t.Optional[Model]],
+    ):
+        default = relation.to_internal_value
+
+        def to_internal_value(value):
+            key = cls._get_key(key_field, value)
+            obj = None if key is None else objects.get(key)
+            return default(value) if obj is None else obj
+
+        return to_internal_value
+
     def to_internal_value(self, data: Data):
         # If performing a bulk create.
         if self.instance is None:
             data = t.cast(BulkCreateDataList, data)
 
-            return t.cast(
-                t.List[OrderedDataDict],
-                super().to_internal_value(data),
-            )
+            with self._resolve_related_objects(data):
+                return t.cast(
+                    t.List[OrderedDataDict],
+                    super().to_internal_value(data),
+                )
 
         # Else, performing a bulk update.
         data = t.cast(BulkUpdateDataDict, data)
-        data_items = list(data.items())
 
-        # Models and data are required to be sorted by the lookup field.
-        data_items.sort(key=lambda item: item[0])
-        self.instance.sort(
-            key=lambda model: getattr(model, self.view.lookup_field)
-        )
+        # Match each model to its data by the lookup value. JSON object keys
+        # are always strings, so keys are normalized by the lookup field, if
+        # it's a field of the model, and are then compared as strings.
+        lookup_field = self.view.lookup_field
+        # pylint: disable-next=protected-access
+        opts = self.model_class._meta
+        try:
+            key_field: t.Optional[Field] = (
+                opts.pk
+                if lookup_field == "pk"
+                else opts.get_field(lookup_field)
+            )
+        except FieldDoesNotExist:
+            key_field = None
+
+        def get_key(value):
+            if key_field is None:
+                return str(value)
+            return self._get_key(key_field, value)
+
+        models = {
+            get_key(getattr(model, lookup_field)): model
+            for model in self.instance
+        }
+        instance: t.List[AnyModel] = []
+        missing_keys: t.List[str] = []
+        for key in data:
+            model = models.get(get_key(key))
+            if model is None:
+                missing_keys.append(str(key))
+            else:
+                instance.append(model)
+
+        if missing_keys:
+            raise _ValidationError(
+                f"Some models do not exist: {', '.join(missing_keys)}.",
+                code="models_do_not_exist",
+            )
 
-        return t.cast(
-            t.List[OrderedDataDict],
-            super().to_internal_value([item[1] for item in data_items]),
-        )
+        # Models and data are required to be in the same order.
+        self.instance = instance
+        data_list = list(data.values())
+        with self._resolve_related_objects(data_list):
+            return t.cast(
+                t.List[OrderedDataDict],
+                super().to_internal_value(data_list),
+            )
 
     # pylint: disable-next=useless-parent-delegation,arguments-renamed
     def to_representation(self, instance: t.List[AnyModel]) -> t.List[DataDict]:
@@ -0,0 +1,201 @@
+"""
+© Ocado Group
+Created on 19/10/2026 at 23:41:05(+01:00).
+"""
+
+from rest_framework import serializers
+
+from ..tests import TestCase
+from ..user.models import Class, Student, User
+from ..views import ModelViewSet
+from .model import ModelSerializer
+from .model_list import ModelListSerializer
+
+# pylint: disable=missing-class-docstring,too-many-ancestors,too-few-public-methods
+
+
+class StudentListSerializer(ModelListSerializer[User, Student]):
+    pass
+
+
+class StudentSerializer(ModelSerializer[User, Student]):
+    class_name = serializers.SlugRelatedField(
+        source="pending_class_request",
+        slug_field="name",
+        queryset=Class.objects.all(),
+        required=False,
+    )
+
+    class Meta:
+        model = Student
+        fields = ["id", "class_field", "class_name"]
+        list_serializer_class = StudentListSerializer
+
+
+class StudentViewSet(ModelViewSet[User, Student]):
+    request_user_class = User
+    model_class = Student
+    serializer_class = StudentSerializer
+
+
+# pylint: enable=missing-class-docstring,too-many-ancestors,too-few-public-methods
+
+
+# pylint: disable-next=missing-class-docstring
+class TestModelListSerializer(TestCase):
+    fixtures = ["school_1"]
+
+    def setUp(self):
+        self.classes = list(Class.objects.order_by("pk"))
+        assert len(self.classes) >= 2
+        self.students = list(Student.objects.order_by("pk")[:4])
+        assert len(self.students) == 4
+        self.context = {"view": StudentViewSet()}
+
+    def get_data(self):
+        """Get the data of each student, alternating between the classes."""
+        return [
+            {"class_field": klass.pk, "class_name": klass.name}
+            for klass in self.classes[:2] * 2
+        ]
+
+    def get_update_data(self, data):
+        """Get the data of each student by their primary key."""
+        return {student.pk: item for student, item in zip(self.students, data)}
+
+    def assert_related_objects(self, validated_data):
+        """Assert the related objects were resolved from the data."""
+        for data, klass in zip(validated_data, self.classes[:2] * 2):
+            assert data["class_field"] == klass
+            assert data["pending_class_request"] == klass
+
+    def test_to_internal_value__create(self):
+        """The related objects of all the data items are resolved with one
+        query per related field."""
+        serializer = StudentSerializer(
+            data=self.get_data(), many=True, context=self.context
+        )
+
+        with self.assertNumQueries(2):
+            serializer.is_valid(raise_exception=True)
+
+        self.assert_related_objects(serializer.validated_data)
+
+    def test_to_internal_value__update(self):
+        """The related objects of all the data items are resolved with one
+        query per related field."""
+        serializer = StudentSerializer(
+            self.students,
+            data=self.get_update_data(self.get_data()),
+            many=True,
+            context=self.context,
+        )
+
+        with self.assertNumQueries(2):
+            serializer.is_valid(raise_exception=True)
+
+        self.assert_related_objects(serializer.validated_data)
+
+    def test_to_internal_value__errors(self):
+        """The errors of invalid and missing related values are the same as
+        those of validating each data item on its own."""
+        data = [
+            {"class_field": "not a pk", "class_name": "Does Not Exist"},
+            {"class_field": 0, "class_name": ["not", "a", "slug"]},
+            {"class_field": True, "class_name": None},
+            {"class_field": self.classes[1].pk, "class_name": 1},
+        ]
+        expected_serializer = serializers.ListSerializer(
+            child=StudentSerializer(context=self.context), data=data
+        )
+        assert not expected_serializer.is_valid()
+
+        for serializer in [
+            StudentSerializer(data=data, many=True, context=self.context),
+            StudentSerializer(
+                self.students,
+                data=self.get_update_data(data),
+                many=True,
+                context=self.context,
+            ),
+        ]:
+            assert not serializer.is_valid()
+            assert serializer.errors == expected_serializer.errors
+
+    def test_to_internal_value__duplicate_slug(self):
+        """Duplicate slugs are left to the related field's default lookup."""
+        klass = self.classes[0]
+        duplicate = Class.objects.get(pk=klass.pk)
+        duplicate.pk = None
+        duplicate.access_code = "DU999"
+        duplicate.save()
+
+        data = [
+            {"class_name": klass.name},
+            {"class_name": self.classes[1].name},
+        ]
+        expected_serializer = serializers.ListSerializer(
+            child=StudentSerializer(context=self.context), data=data
+        )
+        with self.assertRaises(Class.MultipleObjectsReturned):
+            expected_serializer.is_valid()
+
+        for serializer in [
+            StudentSerializer(data=data, many=True, context=self.context),
+            StudentSerializer(
+                self.students,
+                data=self.get_update_data(data),
+                many=True,
+                context=self.context,
+            ),
+        ]:
+            with self.assertRaises(Class.MultipleObjectsReturned):
+                serializer.is_valid()
+
+    def test_to_internal_value__child(self):
+        """The child serializer's fields are not modified."""
+        serializer = StudentListSerializer(
+            child=StudentSerializer(),
+            data=self.get_data(),
+            context=self.context,
+        )
+        child = serializer.child
+        fields = dict(child.fields)
+
+        serializer.is_valid(raise_exception=True)
+
+        assert serializer.child is child
+        assert dict(child.fields) == fields
+        for field in fields.values():
+            assert "to_internal_value" not in vars(field)
+
+    def test_to_internal_value__update__models_do_not_exist(self):
+        """The keys of the data items without a model are listed."""
+        data = self.get_update_data(self.get_data())
+        data["0"] = data.pop(self.students[1].pk)
+        data["not a pk"] = data.pop(self.students[3].pk)
+        serializer = StudentSerializer(
+            self.students, data=data, many=True, context=self.context
+        )
+
+        assert not serializer.is_valid()
+        assert serializer.errors == ["Some models do not exist: 0, not a pk."]
+        assert serializer.errors[0].code == "models_do_not_exist"
+
+    def test_to_internal_value__update__lookup_key(self):
+        """The data items are matched to the models by the normalized value of
+        their lookup field, in the order of the data."""
+        students = self.students[::-1]
+        serializer = StudentSerializer(
+            self.students,
+            data={
+                f"0{student.pk}": {"class_field": self.classes[0].pk}
+                for student in students
+            },
+            many=True,
+            context=self.context,
+        )
+
+        serializer.is_valid(raise_exception=True)
+
+        assert serializer.instance == students
@@ -52,10 +52,27 @@ SERVICE_S3_STATIC_LOCATION = f"{AWS_S3_STATIC_FOLDER}/{SERVICE_NAME}"
 # The authorization bearer token used to authenticate with Dotdigital.
 MAIL_AUTH = os.getenv("MAIL_AUTH", "REPLACE_ME")
 
+# The base URL of Dotdigital's API. "{region}" is replaced with the region id
+# of the account, e.g. r1, r2 or r3.
+MAIL_API_URL = os.getenv("MAIL_API_URL", "https://{region}-api.dotdigital.com")
+
 # A global flag to enable/disable sending emails.
 # If disabled, emails will be logged to the console instead.
 MAIL_ENABLED = bool(int(os.getenv("MAIL_ENABLED", "0")))
 
+# A global flag to enable/disable draining the mail outbox in a single
+# background worker after each transaction that adds to it commits. If
+# disabled, the outbox is only drained by the drain_mail_outbox command.
+MAIL_OUTBOX_DRAIN_ON_COMMIT = bool(
+    int(os.getenv("MAIL_OUTBOX_DRAIN_ON_COMMIT", "1"))
+)
+
+# A global flag to enable/disable detecting N+1 queries in each request.
+# If enabled (or DEBUG is), N+1 queries are logged as warnings.
+N_PLUS_ONE_DETECTION_ENABLED = bool(
+    int(os.getenv("N_PLUS_ONE_DETECTION_ENABLED", "0"))
+)
+
 # The session metadata cookie settings.
 # These work the same as Django's session cookie settings.
 SESSION_METADATA_COOKIE_NAME = "session_metadata"
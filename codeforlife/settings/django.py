@@ -263,6 +263,7 @@ INSTALLED_APPS = [
     "django.contrib.messages",
     "django.contrib.sites",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "game",  # TODO: remove
     "portal",  # TODO: remove
     "common",  # TODO: remove
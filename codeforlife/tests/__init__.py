@@ -9,6 +9,7 @@ from .api import APITestCase, BaseAPITestCase
 from .api_client import APIClient, BaseAPIClient
 from .api_request_factory import APIRequestFactory, BaseAPIRequestFactory
 from .cron import CronTestCase
+from .dotdigital import FakeDotdigitalServer
 from .model import ModelTestCase
 from .model_list_serializer import (
     BaseModelListSerializerTestCase,
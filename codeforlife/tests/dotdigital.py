@@ -0,0 +1,227 @@
+"""
+© Ocado Group
+Created on 19/10/2026 at 20:41:37(+01:00).
+
+A local stand-in for Dotdigital's API.
+"""
+
+import json
+import random
+import re
+import time
+import typing as t
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+
+from ..types import JsonDict
+
+
+class FakeDotdigitalHandler(BaseHTTPRequestHandler):
+    """Handles the requests to the endpoints used by codeforlife.mail."""
+
+    protocol_version = "HTTP/1.1"  # Keep connections alive.
+    server: "FakeDotdigitalServer"
+
+    def _send_json(self, status: int, data: t.Any = None):
+        content = b"" if data is None else json.dumps(data).encode()
+        self.send_response(status)
+        if status == 429:
+            self.send_header("Retry-After", "0")
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def _handle(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length)) if length else None
+
+        server = self.server
+        if server.latency:
+            time.sleep(server.latency)
+
+        with server.lock:
+            server.requests.append((self.command, self.path))
+            server.client_addresses.add(self.client_address)
+            status = server.statuses.pop(0) if server.statuses else None
+
+        if status is None and server.should_fail():
+            status = server.error_status
+        if status is not None:
+            self._send_json(status, {"message": "Injected."})
+            return
+
+        if not self.headers.get("authorization"):
+            self._send_json(401, {"message": "Unauthorized."})
+            return
+
+        for method, pattern, handler in _ROUTES:
+            if method == self.command:
+                match = pattern.fullmatch(self.path)
+                if match:
+                    status, data = handler(server, body, *match.groups())
+                    self._send_json(status, data)
+                    return
+
+        self._send_json(404, {"message": "Not found."})
+
+    do_GET = _handle
+    do_POST = _handle
+    do_DELETE = _handle
+
+    # pylint: disable-next=redefined-builtin
+    def log_message(self, format, *args):
+        pass
+
+
+def _create_contact(server: "FakeDotdigitalServer", body: JsonDict):
+    contact: JsonDict = body["contact"]
+    with server.lock:
+        server.contacts[contact["email"]] = contact
+
+    return 200, {"contact": contact}
+
+
+def _remove_contact(
+    server: "FakeDotdigitalServer", _: None, identifier: str, value: str
+):
+    if identifier != "email":
+        return 400, {"message": f'Unsupported identifier "{identifier}".'}
+
+    with server.lock:
+        contact = server.contacts.pop(value, None)
+
+    return (404, {"message": "Not found."}) if contact is None else (204, None)
+
+
+def _send_mail(server: "FakeDotdigitalServer", body: JsonDict):
+    with server.lock:
+        server.emails.append(body)
+
+    return 200, None
+
+
+def _import_contacts(server: "FakeDotdigitalServer", body: t.List[JsonDict]):
+    with server.lock:
+        for contact in body:
+            email = contact["identifiers"]["email"]
+            if email not in server.import_failures:
+                server.contacts[email] = {"email": email, **contact}
+
+        import_id = str(len(server.imports))
+        server.imports.append([contact["identifiers"] for contact in body])
+
+    return 202, {"importId": import_id}
+
+
+def _get_import(server: "FakeDotdigitalServer", _: None, import_id: str):
+    with server.lock:
+        if not import_id.isdigit() or int(import_id) >= len(server.imports):
+            return 404, {"message": "Not found."}
+
+        failures = [
+            {
+                "identifiers": identifiers,
+                "failureReason": server.import_failures[identifiers["email"]],
+            }
+            for identifiers in server.imports[int(import_id)]
+            if identifiers["email"] in server.import_failures
+        ]
+
+    return 200, {"status": "Finished", "failures": failures}
+
+
+_ROUTES: t.List[t.Tuple[str, t.Pattern[str], t.Callable[..., t.Any]]] = [
+    (
+        "POST",
+        re.compile(r"/v2/contacts/with-consent-and-preferences"),
+        _create_contact,
+    ),
+    ("DELETE", re.compile(r"/contacts/v3/([^/]+)/([^/]+)"), _remove_contact),
+    ("POST", re.compile(r"/v2/email/triggered-campaign"), _send_mail),
+    ("POST", re.compile(r"/contacts/v3/import"), _import_contacts),
+    ("GET", re.compile(r"/contacts/v3/import/([^/]+)"), _get_import),
+]
+
+
+# pylint: disable-next=too-many-instance-attributes
+class FakeDotdigitalServer(ThreadingHTTPServer):
+    """A local stand-in for the contacts, consent and triggered-campaign
+    endpoints of Dotdigital's API, with configurable latency and errors.
+
+    The server runs in a background thread while in its context:
+
+    with FakeDotdigitalServer(latency=0.05) as server:
+        with override_settings(MAIL_ENABLED=True, MAIL_API_URL=server.url):
+            mail.send_mail(...)
+
+    Tests may also queue the statuses to respond to the next requests with
+    and inspect the requests the server received.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        latency: float = 0,
+        error_rate: float = 0,
+        error_status: int = 503,
+        seed: t.Optional[int] = None,
+    ):
+        """Create a fake Dotdigital server on a free local port.
+
+        Args:
+            latency: The seconds to wait before responding to each request.
+            error_rate: The probability of responding to a request with an
+                error.
+            error_status: The status of the injected errors.
+            seed: The seed of the random errors.
+        """
+        super().__init__(("127.0.0.1", 0), FakeDotdigitalHandler)
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.lock = Lock()
+        self.contacts: t.Dict[str, JsonDict] = {}
+        self.emails: t.List[JsonDict] = []
+        self.imports: t.List[t.List[JsonDict]] = []
+        # The reason each email address fails to be imported.
+        self.import_failures: t.Dict[str, str] = {}
+        # The statuses to respond to the next requests with.
+        self.statuses: t.List[int] = []
+        # The method and path of each request received.
+        self.requests: t.List[t.Tuple[str, str]] = []
+        self.client_addresses: t.Set[t.Tuple[str, int]] = set()
+        self._random = random.Random(seed)
+
+    @property
+    def url(self):
+        """The base URL of the server."""
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def reset(self):
+        """Forget the contacts, emails, imports and requests, and stop
+        injecting latency and errors."""
+        with self.lock:
+            self.latency = 0
+            self.error_rate = 0
+            self.contacts.clear()
+            self.emails.clear()
+            self.imports.clear()
+            self.import_failures.clear()
+            self.statuses.clear()
+            self.requests.clear()
+            self.client_addresses.clear()
+
+    def should_fail(self):
+        """Whether to respond to the next request with an injected error."""
+        with self.lock:
+            return self._random.random() < self.error_rate
+
+    def __enter__(self):
+        Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+        self.server_close()
@@ -0,0 +1,43 @@
+"""
+© Ocado Group
+Created on 19/10/2026 at 23:58:14(+01:00).
+
+A serializer and view set of a simple model, for testing the bulk actions of
+the base serializers and view sets.
+"""
+
+from common.models import DynamicElement  # type: ignore[import-untyped]
+from rest_framework import serializers
+
+from ..serializers import ModelListSerializer, ModelSerializer
+from ..user.models import User
+from ..views import ModelViewSet
+
+# pylint: disable=missing-class-docstring,too-many-ancestors,too-few-public-methods
+
+
+class DynamicElementListSerializer(ModelListSerializer[User, DynamicElement]):
+    copy_threshold = 2
+
+
+class DynamicElementSerializer(ModelSerializer[User, DynamicElement]):
+    name = serializers.CharField()  # Not editable in the model.
+
+    class Meta:
+        model = DynamicElement
+        fields = ["id", "name", "active", "text"]
+        list_serializer_class = DynamicElementListSerializer
+
+
+class DynamicElementViewSet(ModelViewSet[User, DynamicElement]):
+    request_user_class = User
+    model_class = DynamicElement
+    serializer_class = DynamicElementSerializer
+    bulk_destroy_chunk_size = 2
+
+    # pylint: disable-next=missing-function-docstring
+    def get_queryset(self):
+        return DynamicElement.objects.all()
+
+
+# pylint: enable=missing-class-docstring,too-many-ancestors,too-few-public-methods
@@ -45,6 +45,13 @@ class BaseModelViewSetTestCase(
     basename: str
     model_view_set_class: t.Type[AnyBaseModelViewSet]
 
+    # The max number of queries a request made by each of the client's actions
+    # may make. For example: {"list": 3, "retrieve": 2}.
+    max_query_counts: t.Dict[str, int] = {}
+    # The max wall time, in seconds, a request made by each of the client's
+    # actions may take.
+    max_wall_times: t.Dict[str, float] = {}
+
     REQUIRED_ATTRS: t.Set[str] = {
         "client_class",
         "basename",
@@ -6,9 +6,13 @@ Base test case for all model view clients.
 """
 
 import typing as t
+from contextlib import contextmanager
+from time import perf_counter
 
+from django.db import connection
 from django.db.models import Model
 from django.db.models.query import QuerySet
+from django.test.utils import CaptureQueriesContext
 from django.utils.http import urlencode
 from rest_framework import status
 from rest_framework.response import Response
@@ -59,6 +63,51 @@ class BaseModelViewSetClient(
         """Shortcut to get model view set class."""
         return self._test_case.model_view_set_class
 
+    @contextmanager
+    def _assert_budget(
+        self,
+        name: str,
+        max_query_count: t.Optional[int],
+        max_wall_time: t.Optional[float],
+    ):
+        """Assert the request made within this context is within its budget.
+
+        Args:
+            name: The name of the client's action.
+            max_query_count: The max number of queries the request may make.
+                If None, the test case's max for the action is used, if any.
+            max_wall_time: The max seconds the request may take. If None, the
+                test case's max for the action is used, if any.
+        """
+        if max_query_count is None:
+            max_query_count = self._test_case.max_query_counts.get(name)
+        if max_wall_time is None:
+            max_wall_time = self._test_case.max_wall_times.get(name)
+
+        with CaptureQueriesContext(connection) as captured:
+            start = perf_counter()
+            yield
+            wall_time = perf_counter() - start
+
+        if max_query_count is not None:
+            query_count = len(captured.captured_queries)
+            assert query_count <= max_query_count, (
+                f'Action "{name}" made {query_count} queries, exceeding its'
+                f" budget of {max_query_count}. Captured queries:\n"
+                + "\n".join(
+                    f"{index}. {query['sql']}"
+                    for index, query in enumerate(
+                        captured.captured_queries, start=1
+                    )
+                )
+            )
+
+        if max_wall_time is not None:
+            assert wall_time <= max_wall_time, (
+                f'Action "{name}" took {wall_time:.3f}s, exceeding its budget'
+                f" of {max_wall_time:.3f}s."
+            )
+
     # --------------------------------------------------------------------------
     # Create (HTTP POST)
     # --------------------------------------------------------------------------
@@ -71,6 +120,7 @@ class BaseModelViewSetClient(
             model, json_model, action, request_method="post"
         )
 
+    # pylint: disable-next=too-many-arguments
     def create(
         self,
         data: DataDict,
@@ -79,6 +129,8 @@ class BaseModelViewSetClient(
         ),
         make_assertions: bool = True,
         reverse_kwargs: t.Optional[KwArgs] = None,
+        max_query_count: t.Optional[int] = None,
+        max_wall_time: t.Optional[float] = None,
         **kwargs,
     ):
         # pylint: disable=line-too-long
@@ -89,18 +141,21 @@ class BaseModelViewSetClient(
             status_code_assertion: The expected status code.
             make_assertions: A flag designating whether to make the default assertions.
             reverse_kwargs: The kwargs for the reverse URL.
+            max_query_count: The max number of queries the request may make.
+            max_wall_time: The max seconds the request may take.
 
         Returns:
             The HTTP response.
         """
         # pylint: enable=line-too-long
 
-        response: Response = self.post(
-            self._test_case.reverse_action("list", kwargs=reverse_kwargs),
-            data=data,
-            status_code_assertion=status_code_assertion,
-            **kwargs,
-        )
+        with self._assert_budget("create", max_query_count, max_wall_time):
+            response: Response = self.post(
+                self._test_case.reverse_action("list", kwargs=reverse_kwargs),
+                data=data,
+                status_code_assertion=status_code_assertion,
+                **kwargs,
+            )
 
         if make_assertions:
             self._assert_response_json(
@@ -112,6 +167,7 @@ class BaseModelViewSetClient(
 
         return response
 
+    # pylint: disable-next=too-many-arguments
     def bulk_create(
         self,
         data: t.List[DataDict],
@@ -120,6 +176,8 @@ class BaseModelViewSetClient(
         ),
         make_assertions: bool = True,
         reverse_kwargs: t.Optional[KwArgs] = None,
+        max_query_count: t.Optional[int] = None,
+        max_wall_time: t.Optional[float] = None,
         **kwargs,
     ):
         # pylint: disable=line-too-long
@@ -130,18 +188,21 @@ class BaseModelViewSetClient(
             status_code_assertion: The expected status code.
             make_assertions: A flag designating whether to make the default assertions.
             reverse_kwargs: The kwargs for the reverse URL.
+            max_query_count: The max number of queries the request may make.
+            max_wall_time: The max seconds the request may take.
 
         Returns:
             The HTTP response.
         """
         # pylint: enable=line-too-long
 
-        response: Response = self.post(
-            self._test_case.reverse_action("bulk", kwargs=reverse_kwargs),
-            data=data,
-            status_code_assertion=status_code_assertion,
-            **kwargs,
-        )
+        with self._assert_budget("bulk_create", max_query_count, max_wall_time):
+            response: Response = self.post(
+                self._test_case.reverse_action("bulk", kwargs=reverse_kwargs),
+                data=data,
+                status_code_assertion=status_code_assertion,
+                **kwargs,
+            )
 
         if make_assertions:
 
@@ -157,6 +218,7 @@ class BaseModelViewSetClient(
     # Retrieve (HTTP GET)
     # --------------------------------------------------------------------------
 
+    # pylint: disable-next=too-many-arguments
     def retrieve(
         self,
         model: AnyModel,
@@ -165,6 +227,8 @@ class BaseModelViewSetClient(
         ),
         make_assertions: bool = True,
         reverse_kwargs: t.Optional[KwArgs] = None,
+        max_query_count: t.Optional[int] = None,
+        max_wall_time: t.Optional[float] = None,
         **kwargs,
     ):
         # pylint: disable=line-too-long
@@ -175,21 +239,24 @@ class BaseModelViewSetClient(
             status_code_assertion: The expected status code.
             make_assertions: A flag designating whether to make the default assertions.
             reverse_kwargs: The kwargs for the reverse URL.
+            max_query_count: The max number of queries the request may make.
+            max_wall_time: The max seconds the request may take.
 
         Returns:
             The HTTP response.
         """
         # pylint: enable=line-too-long
 
-        response: Response = self.get(
-            self._test_case.reverse_action(
-                "detail",
-                model,
-                kwargs=reverse_kwargs,
-            ),
-            status_code_assertion=status_code_assertion,
-            **kwargs,
-        )
+        with self._assert_budget("retrieve", max_query_count, max_wall_time):
+            response: Response = self.get(
+                self._test_case.reverse_action(
+                    "detail",
+                    model,
+                    kwargs=reverse_kwargs,
+                ),
+                status_code_assertion=status_code_assertion,
+                **kwargs,
+            )
 
         if make_assertions:
             self._assert_response_json(
@@ -216,6 +283,8 @@ class BaseModelViewSetClient(
         make_assertions: bool = True,
         filters: t.Optional[t.Dict[str, t.Union[str, t.Iterable[str]]]] = None,
         reverse_kwargs: t.Optional[KwArgs] = None,
+        max_query_count: t.Optional[int] = None,
+        max_wall_time: t.Optional[float] = None,
         **kwargs,
     ):
         # pylint: disable=line-too-long
@@ -227,6 +296,8 @@ class BaseModelViewSetClient(
             make_assertions: A flag designating whether to make the default assertions.
             filters: The filters to apply to the list.
             reverse_kwargs: The kwargs for the reverse URL.
+            max_query_count: The max number of queries the request may make.
+            max_wall_time: The max seconds the request may take.
 
         Returns:
             The HTTP response.
@@ -241,14 +312,17 @@ class BaseModelViewSetClient(
                 for value in values:
                     query.append((key, value))
 
-        response: Response = self.get(
-            (
-                self._test_case.reverse_action("list", kwargs=reverse_kwargs)
-                + f"?{urlencode(query)}"
-            ),
-            status_code_assertion=status_code_assertion,
-            **kwargs,
-        )
+        with self._assert_budget("list", max_query_count, max_wall_time):
+            response: Response = self.get(
+                (
+                    self._test_case.reverse_action(
+                        "list", kwargs=reverse_kwargs
+                    )
+                    + f"?{urlencode(query)}"
+                ),
+                status_code_assertion=status_code_assertion,
+                **kwargs,
+            )
 
         if make_assertions:
 
@@ -292,6 +366,8 @@ class BaseModelViewSetClient(
         ),
         make_assertions: bool = True,
         reverse_kwargs: t.Optional[KwArgs] = None,
+        max_query_count: t.Optional[int] = None,
+        max_wall_time: t.Optional[float] = None,
         **kwargs,
     ):
         # pylint: disable=line-too-long
@@ -303,21 +379,26 @@ class BaseModelViewSetClient(
             status_code_assertion: The expected status code.
             make_assertions: A flag designating whether to make the default assertions.
             reverse_kwargs: The kwargs for the reverse URL.
+            max_query_count: The max number of queries the request may make.
+            max_wall_time: The max seconds the request may take.
 
         Returns:
             The HTTP response.
         """
         # pylint: enable=line-too-long
-        response: Response = self.patch(
-            self._test_case.reverse_action(
-                "detail",
-                model,
-                kwargs=reverse_kwargs,
-            ),
-            data=data,
-            status_code_assertion=status_code_assertion,
-            **kwargs,
-        )
+        with self._assert_budget(
+            "partial_update", max_query_count, max_wall_time
+        ):
+            response: Response = self.patch(
+                self._test_case.reverse_action(
+                    "detail",
+                    model,
+                    kwargs=reverse_kwargs,
+                ),
+                data=data,
+                status_code_assertion=status_code_assertion,
+                **kwargs,
+            )
 
         if make_assertions:
             self._assert_response_json(
@@ -343,6 +424,8 @@ class BaseModelViewSetClient(
         ),
         make_assertions: bool = True,
         reverse_kwargs: t.Optional[KwArgs] = None,
+        max_query_count: t.Optional[int] = None,
+        max_wall_time: t.Optional[float] = None,
         **kwargs,
     ):
         # pylint: disable=line-too-long
@@ -354,6 +437,8 @@ class BaseModelViewSetClient(
             status_code_assertion: The expected status code.
             make_assertions: A flag designating whether to make the default assertions.
             reverse_kwargs: The kwargs for the reverse URL.
+            max_query_count: The max number of queries the request may make.
+            max_wall_time: The max seconds the request may take.
 
         Returns:
             The HTTP response.
@@ -362,21 +447,20 @@ class BaseModelViewSetClient(
         if not isinstance(models, list):
             models = list(models)
 
-        response: Response = self.patch(
-            self._test_case.reverse_action("bulk", kwargs=reverse_kwargs),
-            data=data,
-            status_code_assertion=status_code_assertion,
-            **kwargs,
-        )
+        with self._assert_budget(
+            "bulk_partial_update", max_query_count, max_wall_time
+        ):
+            response: Response = self.patch(
+                self._test_case.reverse_action("bulk", kwargs=reverse_kwargs),
+                data=data,
+                status_code_assertion=status_code_assertion,
+                **kwargs,
+            )
 
         if make_assertions:
 
             def _make_assertions(json_models: t.List[JsonDict]):
-                models.sort(
-                    key=lambda model: getattr(
-                        model, self._model_view_set_class.lookup_field
-                    )
-                )
+                # NOTE: Models are returned in the same order as their data.
                 for model, json_model in zip(models, json_models):
                     self._assert_update(
                         model,
@@ -405,6 +489,8 @@ class BaseModelViewSetClient(
         ),
         make_assertions: bool = True,
         reverse_kwargs: t.Optional[KwArgs] = None,
+        max_query_count: t.Optional[int] = None,
+        max_wall_time: t.Optional[float] = None,
         **kwargs,
     ):
         # pylint: disable=line-too-long
@@ -417,19 +503,22 @@ class BaseModelViewSetClient(
             status_code_assertion: The expected status code.
             make_assertions: A flag designating whether to make the default assertions.
             reverse_kwargs: The kwargs for the reverse URL.
+            max_query_count: The max number of queries the request may make.
+            max_wall_time: The max seconds the request may take.
 
         Returns:
             The HTTP response.
         """
         # pylint: enable=line-too-long
-        response = self.put(
-            path=self._test_case.reverse_action(
-                action, model, kwargs=reverse_kwargs
-            ),
-            data=data,
-            status_code_assertion=status_code_assertion,
-            **kwargs,
-        )
+        with self._assert_budget("update", max_query_count, max_wall_time):
+            response = self.put(
+                path=self._test_case.reverse_action(
+                    action, model, kwargs=reverse_kwargs
+                ),
+                data=data,
+                status_code_assertion=status_code_assertion,
+                **kwargs,
+            )
 
         if make_assertions:
             self._assert_response_json(
@@ -456,6 +545,8 @@ class BaseModelViewSetClient(
         ),
         make_assertions: bool = True,
         reverse_kwargs: t.Optional[KwArgs] = None,
+        max_query_count: t.Optional[int] = None,
+        max_wall_time: t.Optional[float] = None,
         **kwargs,
     ):
         # pylint: disable=line-too-long
@@ -468,6 +559,8 @@ class BaseModelViewSetClient(
             status_code_assertion: The expected status code.
             make_assertions: A flag designating whether to make the default assertions.
             reverse_kwargs: The kwargs for the reverse URL.
+            max_query_count: The max number of queries the request may make.
+            max_wall_time: The max seconds the request may take.
 
         Returns:
             The HTTP response.
@@ -479,24 +572,23 @@ class BaseModelViewSetClient(
         assert models
         assert len(models) == len(data)
 
-        response = self.put(
-            self._test_case.reverse_action(action, kwargs=reverse_kwargs),
-            data={
-                getattr(model, self._model_view_set_class.lookup_field): _data
-                for model, _data in zip(models, data)
-            },
-            status_code_assertion=status_code_assertion,
-            **kwargs,
-        )
+        with self._assert_budget("bulk_update", max_query_count, max_wall_time):
+            response = self.put(
+                self._test_case.reverse_action(action, kwargs=reverse_kwargs),
+                data={
+                    getattr(
+                        model, self._model_view_set_class.lookup_field
+                    ): _data
+                    for model, _data in zip(models, data)
+                },
+                status_code_assertion=status_code_assertion,
+                **kwargs,
+            )
 
         if make_assertions:
 
             def _make_assertions(json_models: t.List[JsonDict]):
-                models.sort(
-                    key=lambda model: getattr(
-                        model, self._model_view_set_class.lookup_field
-                    )
-                )
+                # NOTE: Models are returned in the same order as their data.
                 for model, json_model in zip(models, json_models):
                     self._assert_update(
                         model,
@@ -519,6 +611,7 @@ class BaseModelViewSetClient(
             **{f"{self._model_view_set_class.lookup_field}__in": lookup_values}
         ).exists()
 
+    # pylint: disable-next=too-many-arguments
     def destroy(
         self,
         model: AnyModel,
@@ -527,6 +620,8 @@ class BaseModelViewSetClient(
         ),
         make_assertions: bool = True,
         reverse_kwargs: t.Optional[KwArgs] = None,
+        max_query_count: t.Optional[int] = None,
+        max_wall_time: t.Optional[float] = None,
         **kwargs,
     ):
         # pylint: disable=line-too-long
@@ -537,21 +632,24 @@ class BaseModelViewSetClient(
             status_code_assertion: The expected status code.
             make_assertions: A flag designating whether to make the default assertions.
             reverse_kwargs: The kwargs for the reverse URL.
+            max_query_count: The max number of queries the request may make.
+            max_wall_time: The max seconds the request may take.
 
         Returns:
             The HTTP response.
         """
         # pylint: enable=line-too-long
 
-        response: Response = self.delete(
-            self._test_case.reverse_action(
-                "detail",
-                model,
-                kwargs=reverse_kwargs,
-            ),
-            status_code_assertion=status_code_assertion,
-            **kwargs,
-        )
+        with self._assert_budget("destroy", max_query_count, max_wall_time):
+            response: Response = self.delete(
+                self._test_case.reverse_action(
+                    "detail",
+                    model,
+                    kwargs=reverse_kwargs,
+                ),
+                status_code_assertion=status_code_assertion,
+                **kwargs,
+            )
 
         if make_assertions:
             self._assert_response(
@@ -561,6 +659,7 @@ class BaseModelViewSetClient(
 
         return response
 
+    # pylint: disable-next=too-many-arguments
     def bulk_destroy(
         self,
         data: t.List,
@@ -569,6 +668,8 @@ class BaseModelViewSetClient(
         ),
         make_assertions: bool = True,
         reverse_kwargs: t.Optional[KwArgs] = None,
+        max_query_count: t.Optional[int] = None,
+        max_wall_time: t.Optional[float] = None,
         **kwargs,
     ):
         # pylint: disable=line-too-long
@@ -579,18 +680,23 @@ class BaseModelViewSetClient(
             status_code_assertion: The expected status code.
             make_assertions: A flag designating whether to make the default assertions.
             reverse_kwargs: The kwargs for the reverse URL.
+            max_query_count: The max number of queries the request may make.
+            max_wall_time: The max seconds the request may take.
 
         Returns:
             The HTTP response.
         """
         # pylint: enable=line-too-long
 
-        response: Response = self.delete(
-            self._test_case.reverse_action("bulk", kwargs=reverse_kwargs),
-            data=data,
-            status_code_assertion=status_code_assertion,
-            **kwargs,
-        )
+        with self._assert_budget(
+            "bulk_destroy", max_query_count, max_wall_time
+        ):
+            response: Response = self.delete(
+                self._test_case.reverse_action("bulk", kwargs=reverse_kwargs),
+                data=data,
+                status_code_assertion=status_code_assertion,
+                **kwargs,
+            )
 
         if make_assertions:
             self._assert_response(
@@ -4,13 +4,17 @@ Created on 10/04/2024 at 13:03:00(+01:00).
 """
 
 import typing as t
+from contextlib import contextmanager
 from unittest.case import _AssertRaisesContext
 
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.http import HttpResponse
 from django.test import Client as _Client
 from django.test import TestCase as _TestCase
 
+from ..middlewares import NPlusOneDetector
+
 
 class Client(_Client):
     """A Django client with type hints."""
@@ -40,6 +44,12 @@ class Client(_Client):
 class TestCase(_TestCase):
     """Base test case for all tests to inherit."""
 
+    def _pre_setup(self):
+        super()._pre_setup()  # type: ignore[misc]
+
+        # The cache isn't rolled back with the database after each test.
+        cache.clear()
+
     def assert_raises_validation_error(self, code: str, *args, **kwargs):
         """Assert code block raises a validation error.
 
@@ -65,3 +75,21 @@ class TestCase(_TestCase):
                 return value
 
         return Wrapper(self.assertRaises(ValidationError, *args, **kwargs))
+
+    @contextmanager
+    def assert_no_n_plus_one_queries(self, threshold: t.Optional[int] = None):
+        """Assert code block makes no N+1 queries.
+
+        Args:
+            threshold: The number of times the same query may be made from the
+                same line of code before it's detected.
+
+        Yields:
+            The N+1 query detector.
+        """
+        with NPlusOneDetector(threshold) as detector:
+            yield detector
+
+        assert not detector.detections, "N+1 queries detected:\n" + "\n".join(
+            str(detection) for detection in detector.detections
+        )
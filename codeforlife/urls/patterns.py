@@ -9,6 +9,7 @@ from django.contrib import admin
 from django.urls import URLPattern, URLResolver, include, path
 
 from ..views import (
+    BatchView,
     CsrfCookieView,
     HealthCheckView,
     LogoutView,
@@ -22,6 +23,7 @@ def get_urlpatterns(
     api_url_patterns: UrlPatterns,
     health_check_view: t.Type[HealthCheckView] = HealthCheckView,
     include_user_urls: bool = True,
+    batch_view: t.Optional[t.Type[BatchView]] = BatchView,
 ) -> UrlPatterns:
     """Generate standard url patterns for each service.
 
@@ -29,6 +31,7 @@ def get_urlpatterns(
         api_urls_path: The path to the api's urls.
         health_check_view: The health check view to use.
         include_user_urls: Whether or not to include the CFL's user urls.
+        batch_view: The batch view to use. If None, batching is disabled.
 
     Returns:
         The standard url patterns for each service.
@@ -63,6 +66,15 @@ def get_urlpatterns(
         *api_url_patterns,
     ]
 
+    if batch_view is not None:
+        urlpatterns.append(
+            path(
+                "batch/",
+                batch_view.as_view(),
+                name="batch",
+            )
+        )
+
     if include_user_urls:
         urlpatterns.append(
             path(
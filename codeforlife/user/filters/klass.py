@@ -21,9 +21,13 @@ class ClassFilterSet(FilterSet):
     id_or_name = filters.CharFilter(method="id_or_name__method")
 
     def id_or_name__method(self, queryset: QuerySet[Class], _: str, value: str):
-        """Get classes where the id or the name contain a substring."""
+        """Get classes where the id starts with or the name contains a
+        substring.
+
+        The ids and names are searched with indexes.
+        """
         return queryset.filter(
-            Q(access_code__icontains=value) | Q(name__icontains=value)
+            Q(access_code__istartswith=value) | Q(name__icontains=value)
         )
 
     class Meta:
@@ -5,7 +5,11 @@ Created on 03/04/2024 at 16:37:44(+01:00).
 
 import typing as t
 
-from django.db.models import Q  # isort: skip
+from django.contrib.postgres.search import (  # isort: skip
+    TrigramSimilarity,
+)
+from django.db.models import F, Q  # isort: skip
+from django.db.models.functions import Greatest, Upper  # isort: skip
 from django.db.models.query import QuerySet  # isort: skip
 from django_filters import (  # type: ignore[import-untyped] # isort: skip
     rest_framework as filters,
@@ -32,6 +36,12 @@ class UserFilterSet(FilterSet):
 
     name = filters.CharFilter(method="name__method")
 
+    name_similar = filters.CharFilter(method="name_similar__method")
+    # The min trigram similarity of a first or last name to the searched name.
+    # NOTE: Names are first matched with the "%" operator, so a threshold below
+    # Postgres' pg_trgm.similarity_threshold (0.3 by default) has no effect.
+    name_similarity_threshold: float = 0.3
+
     type = filters.ChoiceFilter(
         choices=[
             ("teacher", "teacher"),
@@ -42,22 +52,77 @@ class UserFilterSet(FilterSet):
         method="type__method",
     )
 
+    @staticmethod
+    def _split_name(value: str):
+        """Split a name into a first name and last name. If the name is one
+        word, it's both the first and last name."""
+        names = value.split(" ", maxsplit=1)
+        first_name, last_name = (
+            names if len(names) == 2 else (names[0], names[0])
+        )
+
+        return first_name, last_name
+
     def name__method(
         self: FilterSet, queryset: QuerySet[User], name: str, *args
     ):
-        """Get all first names and last names that contain a substring."""
-        names = t.cast(str, self.request.GET[name]).split(" ", maxsplit=1)
-        first_name, last_name = (
-            names if len(names) == 2 else (names[0], names[0])
+        """Get all first names and last names that contain a substring.
+
+        The names are searched with the trigram indexes.
+        """
+        first_name, last_name = UserFilterSet._split_name(
+            t.cast(str, self.request.GET[name])
         )
 
-        # TODO: use PostgreSQL specific lookup
-        # https://docs.djangoproject.com/en/5.0/ref/contrib/postgres/lookups/#std-fieldlookup-trigram_similar
         return queryset.filter(
             Q(first_name__icontains=first_name)
             | Q(last_name__icontains=last_name)
         )
 
+    def name_similar__method(
+        self: FilterSet, queryset: QuerySet[User], name: str, *args
+    ):
+        """Get all first names and last names that are similar to a name,
+        ordered by how similar they are.
+
+        The names are searched with the trigram indexes.
+        https://docs.djangoproject.com/en/4.2/ref/contrib/postgres/lookups/#trigram-similarity
+        """
+        first_name, last_name = UserFilterSet._split_name(
+            t.cast(str, self.request.GET[name]).upper()
+        )
+
+        first_name_similarity = TrigramSimilarity(
+            F("upper_first_name"), first_name
+        )
+        last_name_similarity = TrigramSimilarity(
+            F("upper_last_name"), last_name
+        )
+
+        return (
+            queryset.alias(
+                upper_first_name=Upper("first_name"),
+                upper_last_name=Upper("last_name"),
+            )
+            .filter(
+                Q(upper_first_name__trigram_similar=first_name)
+                | Q(upper_last_name__trigram_similar=last_name)
+            )
+            .alias(
+                name_similarity=Greatest(
+                    first_name_similarity, last_name_similarity
+                )
+            )
+            .filter(
+                name_similarity__gte=t.cast(
+                    UserFilterSet, self
+                ).name_similarity_threshold
+            )
+            .order_by(
+                (first_name_similarity + last_name_similarity).desc(), "pk"
+            )
+        )
+
     def type__method(
         self: FilterSet,
         queryset: QuerySet[User],
@@ -73,4 +138,4 @@ class UserFilterSet(FilterSet):
 
     class Meta:
         model = User
-        fields = ["students_in_class", "type", "_id", "name"]
+        fields = ["students_in_class", "type", "_id", "name", "name_similar"]
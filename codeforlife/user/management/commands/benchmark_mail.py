@@ -0,0 +1,11 @@
+"""
+© Ocado Group
+Created on 19/10/2026 at 20:58:10(+01:00).
+"""
+
+from ....commands.benchmark_mail import BenchmarkMail
+
+
+# pylint: disable-next=missing-class-docstring
+class Command(BenchmarkMail):
+    pass
@@ -0,0 +1,11 @@
+"""
+© Ocado Group
+Created on 19/10/2026 at 19:20:05(+01:00).
+"""
+
+from ....commands import DrainMailOutbox
+
+
+# pylint: disable-next=missing-class-docstring
+class Command(DrainMailOutbox):
+    pass
@@ -0,0 +1,40 @@
+"""
+© Ocado Group
+Created on 19/10/2026 at 16:45:31(+01:00).
+
+Index users' first and last names with trigrams so they can be searched by
+substring (icontains) and by similarity (trigram_similar) without scanning the
+whole table. The names are indexed in upper case, as Postgres compares them
+in upper case when searching case-insensitively.
+
+The indexes are created concurrently so the user table isn't locked.
+"""
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+def create_trigram_index(column: str):
+    index = f"auth_user_{column}_upper_trgm"
+    return migrations.RunSQL(
+        sql=(
+            f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "{index}"'
+            f' ON "auth_user" USING gin (UPPER("{column}") gin_trgm_ops);'
+        ),
+        reverse_sql=f'DROP INDEX CONCURRENTLY IF EXISTS "{index}";',
+    )
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("user", "0001_initial"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        create_trigram_index("first_name"),
+        create_trigram_index("last_name"),
+    ]
@@ -0,0 +1,42 @@
+"""
+© Ocado Group
+Created on 19/10/2026 at 17:32:08(+01:00).
+
+Index classes' access codes and names so they can be searched without scanning
+the whole class table:
+- access codes are searched by prefix (istartswith) with a b-tree index;
+- names are searched by substring (icontains) with a trigram index.
+The columns are indexed in upper case, as Postgres compares them in upper case
+when searching case-insensitively.
+
+The indexes are created concurrently so the class table isn't locked.
+"""
+
+from django.db import migrations
+
+
+def create_index(column: str, index_type: str, op_class: str):
+    index = f"common_class_{column}_upper_{index_type}"
+    return migrations.RunSQL(
+        sql=(
+            f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "{index}"'
+            f' ON "common_class" USING {index_type} (UPPER("{column}")'
+            f" {op_class});"
+        ),
+        reverse_sql=f'DROP INDEX CONCURRENTLY IF EXISTS "{index}";',
+    )
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ("user", "0002_user_name_trigram_indexes"),
+    ]
+
+    operations = [
+        # Supports LIKE 'PREFIX%' regardless of the database's collation.
+        create_index("access_code", "btree", "text_pattern_ops"),
+        create_index("name", "gin", "gin_trgm_ops"),
+    ]
@@ -0,0 +1,75 @@
+# Generated by Django 4.2.17 on 2026-10-19 19:15
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("user", "0003_class_search_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MailOutboxMessage",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "action",
+                    models.TextField(
+                        choices=[
+                            ("send_mail", "send mail"),
+                            ("add_contact", "add contact"),
+                        ]
+                    ),
+                ),
+                (
+                    "kwargs",
+                    models.JSONField(
+                        default=dict,
+                        help_text="The arguments to call the mail helper with.",
+                        verbose_name="keyword arguments",
+                    ),
+                ),
+                (
+                    "status",
+                    models.TextField(
+                        choices=[
+                            ("pending", "pending"),
+                            ("sent", "sent"),
+                            ("dead", "dead-lettered"),
+                        ],
+                        default="pending",
+                    ),
+                ),
+                ("attempts", models.PositiveSmallIntegerField(default=0)),
+                ("last_error", models.TextField(blank=True, default="")),
+                (
+                    "next_attempt_at",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("sent_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "verbose_name": "mail outbox message",
+                "verbose_name_plural": "mail outbox messages",
+                "indexes": [
+                    models.Index(
+                        condition=models.Q(("status", "pending")),
+                        fields=["next_attempt_at"],
+                        name="mail_outbox_pending_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,96 @@
+# Generated by Django 4.2.17 on 2026-10-19 20:42
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def delete_messages(apps, schema_editor):
+    """Delete the existing messages, as they store personal data and aren't
+    linked to a user."""
+    MailOutboxMessage = apps.get_model("user", "MailOutboxMessage")
+    MailOutboxMessage.objects.using(schema_editor.connection.alias).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("user", "0004_mailoutboxmessage"),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_messages, migrations.RunPython.noop),
+        migrations.RenameField(
+            model_name="mailoutboxmessage",
+            old_name="sent_at",
+            new_name="finished_at",
+        ),
+        migrations.AlterField(
+            model_name="mailoutboxmessage",
+            name="finished_at",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="When the message was sent, dead-lettered or cancelled.",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="mailoutboxmessage",
+            name="leased_until",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="mailoutboxmessage",
+            name="email",
+            field=models.EmailField(
+                blank=True,
+                default="",
+                help_text="The email address of the contact to remove. It's redacted once the message is processed.",
+                max_length=254,
+            ),
+        ),
+        migrations.AddField(
+            model_name="mailoutboxmessage",
+            name="user",
+            field=models.ForeignKey(
+                db_constraint=False,
+                default=0,
+                on_delete=django.db.models.deletion.DO_NOTHING,
+                related_name="+",
+                to="user.user",
+            ),
+            preserve_default=False,
+        ),
+        migrations.AlterField(
+            model_name="mailoutboxmessage",
+            name="action",
+            field=models.TextField(
+                choices=[
+                    ("send_mail", "send mail"),
+                    ("add_contact", "add contact"),
+                    ("remove_contact", "remove contact"),
+                ]
+            ),
+        ),
+        migrations.AlterField(
+            model_name="mailoutboxmessage",
+            name="kwargs",
+            field=models.JSONField(
+                default=dict,
+                help_text="The non-personal arguments to call the mail helper with.",
+                verbose_name="keyword arguments",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="mailoutboxmessage",
+            name="status",
+            field=models.TextField(
+                choices=[
+                    ("pending", "pending"),
+                    ("sent", "sent"),
+                    ("dead", "dead-lettered"),
+                    ("cancelled", "cancelled"),
+                ],
+                default="pending",
+            ),
+        ),
+    ]
@@ -5,6 +5,7 @@ Created on 05/02/2024 at 13:48:55(+00:00).
 
 from .auth_factor import AuthFactor
 from .klass import Class
+from .mail_outbox_message import MailOutboxMessage
 from .otp_bypass_token import OtpBypassToken
 from .school import School
 from .session import Session
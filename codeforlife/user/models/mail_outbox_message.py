@@ -0,0 +1,519 @@
+"""
+© Ocado Group
+Created on 19/10/2026 at 19:12:40(+01:00).
+"""
+
+import logging
+import typing as t
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, is_dataclass
+from datetime import datetime, timedelta
+from threading import Lock
+
+from django.conf import settings
+from django.db import connections, models, transaction
+from django.db.models import Exists, OuterRef, Q
+from django.utils import timezone
+from django.utils.module_loading import import_string
+from django.utils.translation import gettext_lazy as _
+
+from ... import mail
+from ...types import JsonDict
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from django_stubs_ext.db.models import TypedModelMeta
+
+    from .user import ContactableUser, User
+else:
+    TypedModelMeta = object
+
+
+def _to_json(value):
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if isinstance(value, (list, tuple)):
+        return [_to_json(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _to_json(item) for key, item in value.items()}
+    return value
+
+
+# Drains the outbox in the background, one drain at a time.
+_drain_executor = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="mail_outbox"
+)
+# Held while a drain is waiting to run in the background.
+_drain_queued = Lock()
+
+
+@dataclass
+class DrainResult:
+    """The number of outbox messages processed by a drain, per outcome."""
+
+    sent: int = 0
+    retried: int = 0
+    dead: int = 0
+    cancelled: int = 0
+
+
+class MailOutboxMessage(models.Model):
+    """A call to Dotdigital which is stored in the same transaction as the
+    change that caused it, and is only made after the transaction commits.
+
+    Only the user's id and the call's non-personal arguments are stored. The
+    user's email address and the email's personalization values (e.g. links
+    containing tokens) are read when the message is sent. If the user can no
+    longer be contacted by then, the message is cancelled. The one exception
+    is removing a contact, which stores the email address as the user is
+    usually anonymized in the same transaction. It's redacted once processed.
+
+    Each user's messages are an ordered lane: a message isn't sent until the
+    user's earlier messages are processed. Pending messages are sent in
+    batches by draining the outbox. A message that fails is retried with an
+    exponential backoff until it runs out of attempts, after which it's
+    dead-lettered: it's kept, but not sent again. Processed messages are
+    purged once they're older than their retention period.
+    """
+
+    class Action(models.TextChoices):
+        """The mail helper to call."""
+
+        SEND_MAIL = "send_mail", _("send mail")
+        ADD_CONTACT = "add_contact", _("add contact")
+        REMOVE_CONTACT = "remove_contact", _("remove contact")
+
+    class Status(models.TextChoices):
+        """The delivery status of the message."""
+
+        PENDING = "pending", _("pending")
+        SENT = "sent", _("sent")
+        DEAD = "dead", _("dead-lettered")
+        CANCELLED = "cancelled", _("cancelled")
+
+    # The max number of times a message is attempted to be sent.
+    max_attempts = 5
+    # The delay before the first retry, which doubles after each retry.
+    retry_delay = timedelta(minutes=1)
+    # The max number of messages claimed by a drain at once.
+    batch_size = 100
+    # How long a drain has to send the messages it claimed before other drains
+    # may claim them.
+    lease_duration = timedelta(minutes=10)
+    # How long sent and cancelled messages are kept before they're purged.
+    retention = timedelta(days=7)
+    # How long dead-lettered messages are kept before they're purged.
+    dead_retention = timedelta(days=30)
+    # The arguments of the mail helpers which hold personal data, and so
+    # can't be stored.
+    personal_kwargs = frozenset(
+        [
+            "email",
+            "value",
+            "to_addresses",
+            "cc_addresses",
+            "bcc_addresses",
+            "personalization_values",
+            "attachments",
+            "data_fields",
+        ]
+    )
+
+    # pylint: disable-next=missing-class-docstring
+    class Manager(models.Manager["MailOutboxMessage"]):
+        def enqueue(
+            self,
+            action: "MailOutboxMessage.Action",
+            user: "User",
+            **kwargs,
+        ):
+            """Store a call to a mail helper for a user in the outbox.
+
+            Removing a contact cancels the user's pending messages, except
+            those being sent, which are still sent before it.
+
+            If MAIL_OUTBOX_DRAIN_ON_COMMIT is set, the outbox is drained in the
+            background once the current transaction commits.
+
+            Args:
+                action: The mail helper to call.
+                user: The user to call the mail helper for.
+                **kwargs: The non-personal arguments to call the mail helper
+                    with.
+
+            Returns:
+                The outbox message.
+            """
+            assert (
+                "auth" not in kwargs
+            ), "The authorization header must not be stored in the outbox."
+            personal_kwargs = MailOutboxMessage.personal_kwargs & kwargs.keys()
+            assert not personal_kwargs, (
+                "Personal data must not be stored in the outbox:"
+                f" {', '.join(sorted(personal_kwargs))}."
+            )
+            if kwargs.get("get_personalization_values") is not None:
+                # Check the function exists before it's called when sending.
+                import_string(kwargs["get_personalization_values"])
+
+            email = ""
+            if action == MailOutboxMessage.Action.REMOVE_CONTACT:
+                email = user.email.lower()
+                self.cancel(user)
+
+            message = self.create(
+                action=action,
+                user=user,
+                email=email,
+                kwargs=_to_json(kwargs),
+            )
+
+            if settings.MAIL_OUTBOX_DRAIN_ON_COMMIT:
+                transaction.on_commit(self.drain_in_background)
+
+            return message
+
+        def cancel(self, user: "User"):
+            """Cancel a user's pending messages which aren't being sent.
+
+            Args:
+                user: The user whose messages to cancel.
+
+            Returns:
+                The number of messages cancelled.
+            """
+            now = timezone.now()
+            return self.filter(
+                Q(leased_until__isnull=True) | Q(leased_until__lte=now),
+                user=user,
+                status=MailOutboxMessage.Status.PENDING,
+            ).update(
+                status=MailOutboxMessage.Status.CANCELLED,
+                finished_at=now,
+            )
+
+        def claim(self, batch_size: int, lease_expires_at: datetime):
+            """Claim a batch of the pending messages which are due and are
+            first in their user's lane, by leasing them until the lease
+            expires. Other drains skip leased messages until then.
+
+            Args:
+                batch_size: The max number of messages to claim.
+                lease_expires_at: When the claim expires.
+
+            Returns:
+                The claimed messages.
+            """
+            now = timezone.now()
+            with transaction.atomic():
+                messages = list(
+                    self.select_for_update(skip_locked=True)
+                    .filter(
+                        Q(leased_until__isnull=True) | Q(leased_until__lte=now),
+                        status=MailOutboxMessage.Status.PENDING,
+                        next_attempt_at__lte=now,
+                    )
+                    .exclude(
+                        Exists(
+                            MailOutboxMessage.objects.filter(
+                                user_id=OuterRef("user_id"),
+                                pk__lt=OuterRef("pk"),
+                                status=MailOutboxMessage.Status.PENDING,
+                            )
+                        )
+                    )
+                    .order_by("next_attempt_at", "pk")[:batch_size]
+                )
+
+                self.filter(pk__in=[message.pk for message in messages]).update(
+                    leased_until=lease_expires_at
+                )
+
+            for message in messages:
+                message.leased_until = lease_expires_at
+
+            return messages
+
+        def drain(self, batch_size: t.Optional[int] = None):
+            """Send all the pending messages which are due, in batches.
+
+            Each batch is claimed in a short transaction. The messages are then
+            sent outside of it and each result is saved as soon as its message
+            is sent, so a failure partway through a batch doesn't send the
+            batch's sent messages again. If a batch's claim expires before all
+            its messages are sent, the rest are left for the next claim. As a
+            batch only has the first message of each user's lane, the next
+            messages are sent by the following batches.
+
+            Args:
+                batch_size: The max number of messages claimed at once.
+
+            Returns:
+                The number of messages processed, per outcome.
+            """
+            if batch_size is None:
+                batch_size = MailOutboxMessage.batch_size
+
+            result = DrainResult()
+            while True:
+                lease_expires_at = (
+                    timezone.now() + MailOutboxMessage.lease_duration
+                )
+                messages = self.claim(batch_size, lease_expires_at)
+                if not messages:
+                    return result
+
+                for message in messages:
+                    if timezone.now() >= lease_expires_at:
+                        break
+
+                    message.attempt()
+                    message.leased_until = None
+                    message.save(
+                        update_fields=[
+                            "status",
+                            "email",
+                            "attempts",
+                            "last_error",
+                            "next_attempt_at",
+                            "leased_until",
+                            "finished_at",
+                        ]
+                    )
+
+                    if message.status == MailOutboxMessage.Status.SENT:
+                        result.sent += 1
+                    elif message.status == MailOutboxMessage.Status.DEAD:
+                        result.dead += 1
+                    elif message.status == MailOutboxMessage.Status.CANCELLED:
+                        result.cancelled += 1
+                    else:
+                        result.retried += 1
+
+        def drain_in_background(self) -> t.Optional[Future]:
+            """Drain the outbox in a background worker.
+
+            Drains run one at a time in a single worker thread. A drain isn't
+            queued if one is already waiting to run, as the waiting drain will
+            also send the messages committed since it was queued.
+
+            Returns:
+                The future of the queued drain, or None if one was already
+                queued.
+            """
+            # pylint: disable-next=consider-using-with
+            if not _drain_queued.acquire(blocking=False):
+                return None
+
+            def drain():
+                _drain_queued.release()
+                try:
+                    self.drain()
+                # pylint: disable-next=broad-exception-caught
+                except Exception:
+                    logging.exception("Failed to drain the mail outbox.")
+                finally:
+                    # Close the connections opened by the worker thread.
+                    connections.close_all()
+
+            return _drain_executor.submit(drain)
+
+        def purge(self):
+            """Delete the processed messages which are older than their
+            retention period.
+
+            Returns:
+                The number of messages deleted.
+            """
+            now = timezone.now()
+            deleted, _ = self.filter(
+                Q(
+                    status__in=[
+                        MailOutboxMessage.Status.SENT,
+                        MailOutboxMessage.Status.CANCELLED,
+                    ],
+                    finished_at__lt=now - MailOutboxMessage.retention,
+                )
+                | Q(
+                    status=MailOutboxMessage.Status.DEAD,
+                    finished_at__lt=now - MailOutboxMessage.dead_retention,
+                )
+            ).delete()
+
+            return deleted
+
+    objects: Manager = Manager()
+
+    action = models.TextField(choices=Action.choices)
+
+    # The user's id is kept if they're deleted, so their contact can still be
+    # removed after their earlier messages.
+    user = models.ForeignKey(
+        "user.User",
+        related_name="+",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+    )
+
+    email = models.EmailField(
+        blank=True,
+        default="",
+        help_text=_(
+            "The email address of the contact to remove. It's redacted once"
+            " the message is processed."
+        ),
+    )
+
+    kwargs = models.JSONField(
+        _("keyword arguments"),
+        default=dict,
+        help_text=_("The non-personal arguments to call the mail helper with."),
+    )
+
+    status = models.TextField(choices=Status.choices, default=Status.PENDING)
+
+    attempts = models.PositiveSmallIntegerField(default=0)
+
+    last_error = models.TextField(blank=True, default="")
+
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+
+    leased_until = models.DateTimeField(null=True, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    finished_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text=_("When the message was sent, dead-lettered or cancelled."),
+    )
+
+    class Meta(TypedModelMeta):
+        verbose_name = _("mail outbox message")
+        verbose_name_plural = _("mail outbox messages")
+        indexes = [
+            models.Index(
+                fields=["next_attempt_at"],
+                condition=Q(status="pending"),
+                name="mail_outbox_pending_idx",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.action} ({self.status})"
+
+    def get_mail_kwargs(self, user: t.Optional["ContactableUser"]):
+        """Get the arguments to call the mail helper with, converting the
+        stored JSON back to the helper's types and adding the user's personal
+        data.
+
+        Args:
+            user: The user to call the mail helper for, if they can still be
+                contacted.
+
+        Returns:
+            The arguments or None if the user can no longer be contacted.
+        """
+        kwargs: JsonDict = dict(self.kwargs)
+        if "timeout" in kwargs and isinstance(kwargs["timeout"], list):
+            kwargs["timeout"] = tuple(kwargs["timeout"])
+
+        if self.action == self.Action.REMOVE_CONTACT:
+            kwargs["value"] = self.email
+            return kwargs
+
+        if user is None:
+            return None
+
+        if self.action == self.Action.SEND_MAIL:
+            kwargs["to_addresses"] = [user.email]
+            get_personalization_values = kwargs.pop(
+                "get_personalization_values", None
+            )
+            if get_personalization_values is not None:
+                kwargs["personalization_values"] = import_string(
+                    get_personalization_values
+                )(user)
+        elif self.action == self.Action.ADD_CONTACT:
+            kwargs["email"] = user.email
+            if kwargs.get("preferences") is not None:
+                kwargs["preferences"] = [
+                    mail.Preference(
+                        **{
+                            **preference,
+                            "preferences": (
+                                None
+                                if preference.get("preferences") is None
+                                else [
+                                    mail.Preference.Preference(**_preference)
+                                    for _preference in preference["preferences"]
+                                ]
+                            ),
+                        }
+                    )
+                    for preference in kwargs["preferences"]
+                ]
+
+        return kwargs
+
+    def finish(self, status: "MailOutboxMessage.Status"):
+        """Stop processing the message and redact its personal data. The
+        message isn't saved.
+
+        Args:
+            status: The final status of the message.
+        """
+        self.status = status
+        self.finished_at = timezone.now()
+        if self.email:
+            self.last_error = self.last_error.replace(self.email, "[redacted]")
+            self.email = ""
+
+    def attempt(self):
+        """Attempt to send the message once, updating its status. The message
+        isn't saved.
+
+        If the user can no longer be contacted, the message is cancelled. If
+        Dotdigital's circuit breaker is open, the message is deferred until the
+        breaker may allow calls again, without using up an attempt.
+        """
+        # pylint: disable-next=import-outside-toplevel
+        from .user import ContactableUser
+
+        user = (
+            ContactableUser.objects.filter(pk=self.user_id, is_active=True)
+            .exclude(email="")
+            .first()
+        )
+        try:
+            kwargs = self.get_mail_kwargs(user)
+            if kwargs is None:
+                self.finish(self.Status.CANCELLED)
+                return
+
+            getattr(mail, self.action)(**kwargs)
+        except mail.CircuitOpenError as ex:
+            self.last_error = repr(ex)
+            self.next_attempt_at = timezone.now() + timedelta(
+                seconds=mail.CircuitBreaker.open_duration
+            )
+        # pylint: disable-next=broad-exception-caught
+        except Exception as ex:
+            self.attempts += 1
+            self.last_error = repr(ex)
+            if self.attempts >= self.max_attempts:
+                self.finish(self.Status.DEAD)
+                logging.error(
+                    "Dead-lettered mail outbox message %s after %s attempts:"
+                    " %s",
+                    self.pk,
+                    self.attempts,
+                    self.last_error,
+                )
+            else:
+                self.next_attempt_at = timezone.now() + (
+                    self.retry_delay * 2 ** (self.attempts - 1)
+                )
+        else:
+            self.attempts += 1
+            self.last_error = ""
+            self.finish(self.Status.SENT)
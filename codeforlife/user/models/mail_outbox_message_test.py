@@ -0,0 +1,502 @@
+"""
+© Ocado Group
+Created on 19/10/2026 at 19:31:52(+01:00).
+"""
+
+from datetime import timedelta
+from io import StringIO
+from threading import Event
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.db import transaction
+from django.test import override_settings
+from django.utils import timezone
+
+from ... import mail
+from ...tests import ModelTestCase
+from .mail_outbox_message import DrainResult, MailOutboxMessage
+from .user import ContactableUser
+
+
+def get_personalization_values(user: ContactableUser):
+    """Get the personalization values of a test email."""
+    return {"FIRST_NAME": user.first_name, "TOKEN": f"token-{user.pk}"}
+
+
+# pylint: disable-next=missing-class-docstring,too-many-public-methods
+class TestMailOutboxMessage(ModelTestCase[MailOutboxMessage]):
+    fixtures = ["school_1"]
+
+    def setUp(self):
+        self.users = list(
+            ContactableUser.objects.filter(is_active=True)
+            .exclude(email="")
+            .order_by("pk")[:3]
+        )
+        assert len(self.users) == 3
+        self.user = self.users[0]
+
+    def get_personalization_values_path(self):
+        """Get the import path of the test's personalization values."""
+        return f"{__name__}.{get_personalization_values.__name__}"
+
+    def test_email_user(self):
+        """Emailing a user stores the email in the outbox instead of sending
+        it."""
+        with patch.object(mail, "send_mail") as send_mail:
+            self.user.email_user(campaign_id=1)
+
+        send_mail.assert_not_called()
+
+        message = MailOutboxMessage.objects.get()
+        assert message.action == MailOutboxMessage.Action.SEND_MAIL
+        assert message.status == MailOutboxMessage.Status.PENDING
+        assert message.user_id == self.user.pk
+        assert message.email == ""
+        assert message.kwargs == {
+            "campaign_id": 1,
+            "get_personalization_values": None,
+        }
+
+    def test_email_user__personal_data(self):
+        """Personal data can't be stored in the outbox."""
+        with self.assertRaises(AssertionError):
+            MailOutboxMessage.objects.enqueue(
+                MailOutboxMessage.Action.SEND_MAIL,
+                user=self.user,
+                campaign_id=1,
+                personalization_values={"TOKEN": "token"},
+            )
+
+        with self.assertRaises(ImportError):
+            self.user.email_user(
+                campaign_id=1, get_personalization_values=f"{__name__}.missing"
+            )
+
+        assert not MailOutboxMessage.objects.exists()
+
+    def test_email_user__rollback(self):
+        """Emailing a user in a transaction that rolls back sends nothing."""
+        with self.assertRaises(ValueError), transaction.atomic():
+            self.user.email_user(campaign_id=1)
+            raise ValueError()
+
+        assert not MailOutboxMessage.objects.exists()
+
+    def test_drain_in_background(self):
+        """Drains run one at a time in the background and a drain isn't
+        queued while another is waiting to run."""
+        running = Event()
+        release = Event()
+
+        def drain():
+            running.set()
+            release.wait(timeout=5)
+            return DrainResult()
+
+        with patch.object(
+            MailOutboxMessage.objects, "drain", side_effect=drain
+        ) as drain_mock:
+            future = MailOutboxMessage.objects.drain_in_background()
+            assert future
+            assert running.wait(timeout=5)
+
+            # One drain is queued while the first is running.
+            queued_future = MailOutboxMessage.objects.drain_in_background()
+            assert queued_future
+            assert MailOutboxMessage.objects.drain_in_background() is None
+
+            release.set()
+            future.result(timeout=5)
+            queued_future.result(timeout=5)
+
+        assert drain_mock.call_count == 2
+
+    def test_email_user__drain_on_commit(self):
+        """The outbox is drained once the transaction commits."""
+        with patch.object(
+            MailOutboxMessage.objects, "drain_in_background"
+        ) as drain_in_background, self.captureOnCommitCallbacks(execute=True):
+            self.user.email_user(campaign_id=1)
+            drain_in_background.assert_not_called()
+
+        drain_in_background.assert_called_once()
+
+    @override_settings(MAIL_OUTBOX_DRAIN_ON_COMMIT=False)
+    def test_email_user__drain_on_commit__disabled(self):
+        """The outbox is not drained on commit if disabled."""
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.user.email_user(campaign_id=1)
+
+        assert not callbacks
+
+    def test_add_contact_to_dot_digital(self):
+        """Adding a contact stores the call in the outbox."""
+        with patch.object(mail, "add_contact") as add_contact:
+            self.user.add_contact_to_dot_digital()
+
+        add_contact.assert_not_called()
+
+        message = MailOutboxMessage.objects.get()
+        assert message.action == MailOutboxMessage.Action.ADD_CONTACT
+        assert message.user_id == self.user.pk
+        assert message.kwargs == {}
+
+    def test_remove_contact_from_dot_digital(self):
+        """Removing a contact stores the call in the outbox, after the user's
+        messages which are being sent, and cancels the user's other pending
+        messages."""
+        other_user = self.users[1]
+        other_user.email_user(campaign_id=1)
+        self.user.email_user(campaign_id=1)
+        self.user.add_contact_to_dot_digital()
+        leased = MailOutboxMessage.objects.filter(user=self.user).first()
+        assert leased
+        MailOutboxMessage.objects.filter(pk=leased.pk).update(
+            leased_until=timezone.now() + MailOutboxMessage.lease_duration
+        )
+        email = self.user.email
+
+        with patch.object(mail, "remove_contact") as remove_contact:
+            self.user.remove_contact_from_dot_digital()
+            self.user.anonymize()
+
+        remove_contact.assert_not_called()
+
+        message = MailOutboxMessage.objects.order_by("pk").last()
+        assert message
+        assert message.action == MailOutboxMessage.Action.REMOVE_CONTACT
+        assert message.user_id == self.user.pk
+        assert message.email == email.lower()
+
+        statuses = dict(
+            MailOutboxMessage.objects.filter(user=self.user)
+            .exclude(pk=message.pk)
+            .values_list("action", "status")
+        )
+        assert statuses == {
+            MailOutboxMessage.Action.SEND_MAIL: (
+                MailOutboxMessage.Status.PENDING
+            ),
+            MailOutboxMessage.Action.ADD_CONTACT: (
+                MailOutboxMessage.Status.CANCELLED
+            ),
+        }
+        assert MailOutboxMessage.objects.get(user=other_user).status == (
+            MailOutboxMessage.Status.PENDING
+        )
+
+    def test_get_mail_kwargs(self):
+        """The stored JSON is converted back to the mail helpers' types and
+        the user's personal data is added when the message is sent."""
+        preference = mail.Preference(
+            id=1,
+            is_preference=False,
+            preferences=[
+                mail.Preference.Preference(
+                    id=2, is_preference=True, is_opted_in=True
+                )
+            ],
+        )
+
+        self.user.email_user(
+            campaign_id=1,
+            get_personalization_values=self.get_personalization_values_path(),
+            timeout=(1, 2),
+        )
+        send_mail = MailOutboxMessage.objects.get()
+        assert send_mail.get_mail_kwargs(self.user) == {
+            "campaign_id": 1,
+            "to_addresses": [self.user.email],
+            "personalization_values": get_personalization_values(self.user),
+            "timeout": (1, 2),
+        }
+        assert send_mail.get_mail_kwargs(None) is None
+
+        add_contact = MailOutboxMessage.objects.enqueue(
+            MailOutboxMessage.Action.ADD_CONTACT,
+            user=self.user,
+            preferences=[preference],
+        )
+        add_contact.refresh_from_db()
+        assert add_contact.get_mail_kwargs(self.user) == {
+            "email": self.user.email,
+            "preferences": [preference],
+        }
+
+        remove_contact = MailOutboxMessage.objects.enqueue(
+            MailOutboxMessage.Action.REMOVE_CONTACT, user=self.user
+        )
+        assert remove_contact.get_mail_kwargs(None) == {
+            "value": self.user.email.lower()
+        }
+
+    def test_drain(self):
+        """Pending messages are sent in batches."""
+        for campaign_id in range(3):
+            self.users[campaign_id % 2].email_user(campaign_id=campaign_id)
+
+        with patch.object(mail, "send_mail") as send_mail:
+            result = MailOutboxMessage.objects.drain(batch_size=2)
+
+        assert result.sent == 3
+        assert send_mail.call_count == 3
+        campaign_ids = [
+            call.kwargs["campaign_id"] for call in send_mail.mock_calls
+        ]
+        assert campaign_ids == [0, 1, 2]
+        assert not MailOutboxMessage.objects.filter(
+            status=MailOutboxMessage.Status.PENDING
+        ).exists()
+        assert not MailOutboxMessage.objects.filter(
+            leased_until__isnull=False
+        ).exists()
+
+    def test_drain__personal_data(self):
+        """The user's personal data is read when the message is sent."""
+        self.user.email_user(
+            campaign_id=1,
+            get_personalization_values=self.get_personalization_values_path(),
+        )
+        self.user.first_name = "Renamed"
+        self.user.save(update_fields=["first_name"])
+
+        with patch.object(mail, "send_mail") as send_mail:
+            MailOutboxMessage.objects.drain()
+
+        send_mail.assert_called_once_with(
+            campaign_id=1,
+            to_addresses=[self.user.email],
+            personalization_values=get_personalization_values(self.user),
+        )
+
+    def test_drain__lane(self):
+        """A user's messages are sent in order, each after the previous one is
+        processed."""
+        # The user's email is being sent when their contact is removed.
+        self.user.email_user(campaign_id=1)
+        MailOutboxMessage.objects.update(
+            leased_until=timezone.now() + MailOutboxMessage.lease_duration
+        )
+        self.user.remove_contact_from_dot_digital()
+        MailOutboxMessage.objects.update(leased_until=None)
+        self.users[1].email_user(campaign_id=2)
+
+        with patch.object(
+            mail, "send_mail", side_effect=AssertionError("Failed")
+        ), patch.object(mail, "remove_contact") as remove_contact:
+            result = MailOutboxMessage.objects.drain()
+
+        # The user's email is retried before their contact is removed.
+        assert result == DrainResult(retried=2)
+        remove_contact.assert_not_called()
+
+        MailOutboxMessage.objects.update(next_attempt_at=timezone.now())
+        with patch.object(mail, "send_mail"), patch.object(
+            mail, "remove_contact"
+        ) as remove_contact:
+            result = MailOutboxMessage.objects.drain()
+
+        assert result == DrainResult(sent=3)
+        remove_contact.assert_called_once_with(value=self.user.email.lower())
+
+    def test_drain__cancelled(self):
+        """Messages are cancelled if their user can no longer be contacted by
+        the time they're sent."""
+        self.user.email_user(campaign_id=1)
+        self.user.anonymize()
+
+        with patch.object(mail, "send_mail") as send_mail:
+            result = MailOutboxMessage.objects.drain()
+
+        assert result == DrainResult(cancelled=1)
+        send_mail.assert_not_called()
+
+        message = MailOutboxMessage.objects.get()
+        assert message.status == MailOutboxMessage.Status.CANCELLED
+        assert message.finished_at
+
+    def test_drain__redacted(self):
+        """A removed contact's email address is redacted once processed."""
+        email = self.user.email.lower()
+        self.user.remove_contact_from_dot_digital()
+        MailOutboxMessage.objects.update(
+            attempts=MailOutboxMessage.max_attempts - 1
+        )
+
+        with patch.object(
+            mail, "remove_contact", side_effect=AssertionError(email)
+        ), self.assertLogs(level="ERROR") as logs:
+            result = MailOutboxMessage.objects.drain()
+
+        assert result == DrainResult(dead=1)
+
+        message = MailOutboxMessage.objects.get()
+        assert message.status == MailOutboxMessage.Status.DEAD
+        assert message.email == ""
+        assert message.last_error == "AssertionError('[redacted]')"
+        assert email not in "".join(logs.output)
+
+    def test_drain__failure_partway(self):
+        """A failure partway through a batch doesn't send the batch's sent
+        messages again."""
+        for campaign_id in range(3):
+            self.users[campaign_id].email_user(campaign_id=campaign_id)
+
+        with patch.object(
+            mail, "send_mail", side_effect=[None, KeyboardInterrupt()]
+        ) as send_mail, self.assertRaises(KeyboardInterrupt):
+            MailOutboxMessage.objects.drain()
+
+        assert send_mail.call_count == 2
+        assert (
+            MailOutboxMessage.objects.filter(
+                status=MailOutboxMessage.Status.SENT
+            ).count()
+            == 1
+        )
+
+        # The rest of the batch is still claimed by the failed drain.
+        assert MailOutboxMessage.objects.drain() == DrainResult()
+
+        # Once the claim expires, only the unsent messages are sent.
+        MailOutboxMessage.objects.filter(
+            status=MailOutboxMessage.Status.PENDING
+        ).update(leased_until=timezone.now())
+
+        with patch.object(mail, "send_mail") as send_mail:
+            result = MailOutboxMessage.objects.drain()
+
+        assert result.sent == 2
+        campaign_ids = [
+            call.kwargs["campaign_id"] for call in send_mail.mock_calls
+        ]
+        assert campaign_ids == [1, 2]
+
+    def test_drain__lease_expired(self):
+        """Messages aren't sent once their claim expires, as another drain may
+        have claimed them."""
+        for campaign_id in range(2):
+            self.users[campaign_id].email_user(campaign_id=campaign_id)
+
+        now = timezone.now
+        delay = timedelta()
+
+        def send_mail(**_):
+            # Sending the first message takes longer than the claim, and
+            # another drain claims the second message meanwhile.
+            nonlocal delay
+            delay = MailOutboxMessage.lease_duration
+            MailOutboxMessage.objects.filter(kwargs__campaign_id=1).update(
+                leased_until=now() + delay * 2
+            )
+
+        with patch.object(
+            timezone, "now", side_effect=lambda: now() + delay
+        ), patch.object(mail, "send_mail", side_effect=send_mail) as send_mail:
+            result = MailOutboxMessage.objects.drain(batch_size=2)
+
+        assert result.sent == 1
+        send_mail.assert_called_once()
+
+    def test_drain__retry(self):
+        """Messages which fail to send are retried later with a backoff."""
+        self.user.email_user(campaign_id=1)
+
+        with patch.object(
+            mail, "send_mail", side_effect=AssertionError("Failed")
+        ) as send_mail:
+            result = MailOutboxMessage.objects.drain()
+
+            assert result.retried == 1
+            send_mail.assert_called_once()
+
+            # The message isn't due yet.
+            assert MailOutboxMessage.objects.drain().retried == 0
+            send_mail.assert_called_once()
+
+        message = MailOutboxMessage.objects.get()
+        assert message.status == MailOutboxMessage.Status.PENDING
+        assert message.attempts == 1
+        assert message.last_error == "AssertionError('Failed')"
+        assert message.next_attempt_at > timezone.now()
+
+    def test_drain__dead(self):
+        """Messages which run out of attempts are dead-lettered."""
+        self.user.email_user(campaign_id=1)
+        MailOutboxMessage.objects.update(
+            attempts=MailOutboxMessage.max_attempts - 1
+        )
+
+        with patch.object(
+            mail, "send_mail", side_effect=AssertionError("Failed")
+        ), self.assertLogs(level="ERROR"):
+            result = MailOutboxMessage.objects.drain()
+
+        assert result.dead == 1
+
+        message = MailOutboxMessage.objects.get()
+        assert message.status == MailOutboxMessage.Status.DEAD
+        assert message.attempts == MailOutboxMessage.max_attempts
+
+    def test_drain__circuit_open(self):
+        """Messages are deferred without using an attempt if Dotdigital's
+        circuit breaker is open."""
+        self.user.email_user(campaign_id=1)
+
+        with patch.object(
+            mail, "send_mail", side_effect=mail.CircuitOpenError()
+        ):
+            result = MailOutboxMessage.objects.drain()
+
+        assert result.retried == 1
+
+        message = MailOutboxMessage.objects.get()
+        assert message.status == MailOutboxMessage.Status.PENDING
+        assert message.attempts == 0
+        assert message.next_attempt_at > timezone.now()
+
+    def test_purge(self):
+        """Processed messages are purged once they're older than their
+        retention period."""
+        for _ in range(5):
+            self.user.email_user(campaign_id=1)
+
+        now = timezone.now()
+        old_sent, sent, old_cancelled, old_dead, dead = (
+            MailOutboxMessage.objects.order_by("pk")
+        )
+        for message, status, age in [
+            (old_sent, "SENT", MailOutboxMessage.retention),
+            (sent, "SENT", timedelta()),
+            (old_cancelled, "CANCELLED", MailOutboxMessage.retention),
+            (old_dead, "DEAD", MailOutboxMessage.dead_retention),
+            (dead, "DEAD", MailOutboxMessage.retention),
+        ]:
+            MailOutboxMessage.objects.filter(pk=message.pk).update(
+                status=MailOutboxMessage.Status[status],
+                finished_at=now - age - timedelta(seconds=1),
+            )
+
+        assert MailOutboxMessage.objects.purge() == 3
+        assert set(MailOutboxMessage.objects.values_list("pk", flat=True)) == {
+            sent.pk,
+            dead.pk,
+        }
+
+    def test_drain_mail_outbox_command(self):
+        """The command drains the outbox and purges old processed messages."""
+        self.user.email_user(campaign_id=1)
+
+        stdout = StringIO()
+        with patch.object(mail, "send_mail"), patch.object(
+            MailOutboxMessage, "retention", timedelta(seconds=-1)
+        ):
+            call_command("drain_mail_outbox", stdout=stdout)
+
+        assert stdout.getvalue().splitlines() == [
+            "Sent 1, retried 0, dead-lettered 0 and cancelled 0 message(s).",
+            "Purged 1 processed message(s).",
+        ]
+        assert not MailOutboxMessage.objects.exists()
@@ -18,7 +18,6 @@ from django.db.models.query import QuerySet
 from django.utils.crypto import get_random_string
 from pyotp import TOTP
 
-from ... import mail
 from ...models import AbstractBaseUser
 from .klass import Class
 from .school import School
@@ -197,24 +196,54 @@ class ContactableUser(User):
         proxy = True
 
     def add_contact_to_dot_digital(self):
-        """Add contact info to DotDigital."""
-        mail.add_contact(self.email)
+        """Add contact info to DotDigital, after the current transaction
+        commits."""
+        # pylint: disable-next=import-outside-toplevel
+        from .mail_outbox_message import MailOutboxMessage
+
+        MailOutboxMessage.objects.enqueue(
+            MailOutboxMessage.Action.ADD_CONTACT, user=self
+        )
 
     def remove_contact_from_dot_digital(self):
-        """Remove contact info from DotDigital."""
-        mail.remove_contact(self.email)
+        """Remove contact info from DotDigital, after the current transaction
+        commits and the user's messages being sent are sent. The user's other
+        pending messages are cancelled.
+
+        This must be called before the user is anonymized, as it stores the
+        user's email address until the contact is removed.
+        """
+        # pylint: disable-next=import-outside-toplevel
+        from .mail_outbox_message import MailOutboxMessage
+
+        MailOutboxMessage.objects.enqueue(
+            MailOutboxMessage.Action.REMOVE_CONTACT, user=self
+        )
 
     # pylint: disable-next=arguments-differ
     def email_user(  # type: ignore[override]
         self,
         campaign_id: int,
-        personalization_values: t.Optional[t.Dict[str, str]] = None,
+        get_personalization_values: t.Optional[str] = None,
         **kwargs,
     ):
-        kwargs["to_addresses"] = [self.email]
-        mail.send_mail(
+        """Email the user, after the current transaction commits.
+
+        Args:
+            campaign_id: The ID of the email campaign to send.
+            get_personalization_values: The import path of a function which
+                takes the user and returns the email's personalization values.
+                It's called when the email is sent, so the values (e.g. links
+                containing tokens) aren't stored.
+        """
+        # pylint: disable-next=import-outside-toplevel
+        from .mail_outbox_message import MailOutboxMessage
+
+        MailOutboxMessage.objects.enqueue(
+            MailOutboxMessage.Action.SEND_MAIL,
+            user=self,
             campaign_id=campaign_id,
-            personalization_values=personalization_values,
+            get_personalization_values=get_personalization_values,
             **kwargs,
         )
 
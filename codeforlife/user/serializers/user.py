@@ -4,6 +4,8 @@ Created on 19/01/2024 at 11:06:00(+00:00).
 """
 
 import typing as t
+from functools import cached_property
+from operator import attrgetter
 
 from rest_framework import serializers
 
@@ -61,43 +63,65 @@ class UserSerializer(BaseUserSerializer[AnyUser], t.Generic[AnyUser]):
     class Meta(BaseUserSerializer.Meta):
         fields = [*BaseUserSerializer.Meta.fields, "student", "teacher"]
 
-    def to_representation(self, instance):
+    @cached_property
+    def _student_to_representation(self):
+        return StudentSerializer().compile_to_representation()
+
+    @cached_property
+    def _teacher_to_representation(self):
+        return TeacherSerializer[Teacher]().compile_to_representation()
+
+    def _get_student(self, instance: AnyUser):
         try:
-            student = (
-                dict(StudentSerializer(instance.new_student).data)
-                if instance.new_student and instance.new_student.class_field
-                else None
-            )
+            student = instance.new_student
         except Student.DoesNotExist:
-            student = None
+            return None
 
+        return (
+            None
+            if student.class_field is None
+            else self._student_to_representation(student)
+        )
+
+    @staticmethod
+    def _get_requesting_to_join_class(instance: AnyUser):
         try:
-            requesting_to_join_class = (
-                instance.new_student.pending_class_request.access_code
-                if instance.new_student
-                and instance.new_student.pending_class_request
-                else None
-            )
+            klass = instance.new_student.pending_class_request
         except Student.DoesNotExist:
-            requesting_to_join_class = None
+            return None
+
+        return None if klass is None else klass.access_code
 
+    def _get_teacher(self, instance: AnyUser):
         try:
-            teacher = (
-                dict(TeacherSerializer[Teacher](instance.new_teacher).data)
-                if instance.new_teacher
-                else None
-            )
+            teacher = instance.new_teacher
         except Teacher.DoesNotExist:
-            teacher = None
-
-        return {
-            "id": instance.id,
-            "first_name": instance.first_name,
-            "last_name": instance.last_name,
-            "email": instance.email,
-            "is_active": instance.is_active,
-            "date_joined": instance.date_joined,
-            "requesting_to_join_class": requesting_to_join_class,
-            "student": student,
-            "teacher": teacher,
+            return None
+
+        return self._teacher_to_representation(teacher)
+
+    @cached_property
+    def _getters(self) -> t.List[t.Tuple[str, t.Callable[[AnyUser], t.Any]]]:
+        getters: t.Dict[str, t.Callable[[AnyUser], t.Any]] = {
+            "id": attrgetter("id"),
+            "first_name": attrgetter("first_name"),
+            "last_name": attrgetter("last_name"),
+            "email": attrgetter("email"),
+            "is_active": attrgetter("is_active"),
+            "date_joined": attrgetter("date_joined"),
+            "requesting_to_join_class": self._get_requesting_to_join_class,
+            "student": self._get_student,
+            "teacher": self._get_teacher,
         }
+
+        # Only serialize the fields in a sparse fieldset.
+        return [
+            (name, getter)
+            for name, getter in getters.items()
+            if name in self.fields
+        ]
+
+    def to_representation(self, instance):
+        # NOTE: The getters are compiled once per serializer, so serializing
+        # many users doesn't create nested serializers for each user.
+        return {name: getter(instance) for name, getter in self._getters}
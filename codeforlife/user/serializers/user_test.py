@@ -3,8 +3,21 @@
 Created on 18/04/2024 at 17:26:59(+01:00).
 """
 
+import typing as t
+from timeit import repeat
+
 from ...tests import ModelSerializerTestCase
-from ..models import IndependentUser, StudentUser, TeacherUser, User
+from ...types import DataDict
+from ..models import (
+    IndependentUser,
+    Student,
+    StudentUser,
+    Teacher,
+    TeacherUser,
+    User,
+)
+from .student import StudentSerializer
+from .teacher import TeacherSerializer
 from .user import UserSerializer
 
 
@@ -69,3 +82,63 @@ class TestUserSerializer(ModelSerializerTestCase[User, User]):
             # TODO: remove in new schema.
             non_model_fields={"requesting_to_join_class", "teacher", "student"},
         )
+
+    def test_to_representation__fast_path(self):
+        """
+        Serializing users with the compiled representation has the same output
+        as serializing them with DRF's serializers and is at least 5x faster.
+        """
+
+        def to_representation(user: User) -> DataDict:
+            try:
+                student: t.Optional[DataDict] = (
+                    dict(StudentSerializer(user.new_student).data)
+                    if user.new_student.class_field
+                    else None
+                )
+                pending_class_request = user.new_student.pending_class_request
+                requesting_to_join_class = (
+                    pending_class_request.access_code
+                    if pending_class_request
+                    else None
+                )
+            except Student.DoesNotExist:
+                student, requesting_to_join_class = None, None
+
+            try:
+                teacher: t.Optional[DataDict] = dict(
+                    TeacherSerializer[Teacher](user.new_teacher).data
+                )
+            except Teacher.DoesNotExist:
+                teacher = None
+
+            return {
+                "id": user.id,
+                "first_name": user.first_name,
+                "last_name": user.last_name,
+                "email": user.email,
+                "is_active": user.is_active,
+                "date_joined": user.date_joined,
+                "requesting_to_join_class": requesting_to_join_class,
+                "student": student,
+                "teacher": teacher,
+            }
+
+        serializer = UserSerializer[User]()
+        select_related, _ = serializer.get_related_names()
+        users = list(User.objects.select_related(*select_related))
+        assert users
+
+        for user in users:
+            assert serializer.to_representation(user) == to_representation(user)
+
+        def time(serialize: t.Callable[[User], DataDict]):
+            return min(
+                repeat(
+                    lambda: [serialize(user) for user in users],
+                    number=10,
+                    repeat=5,
+                )
+            )
+
+        assert time(to_representation) >= time(serializer.to_representation) * 5
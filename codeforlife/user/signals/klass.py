@@ -0,0 +1,25 @@
+"""
+© Ocado Group
+Created on 19/10/2026 at 11:32:08(+01:00).
+"""
+
+from django.db.models import signals
+
+from ...models.signals import model_receiver
+from ...response_cache import bump_generation
+from ..models import Class
+
+# pylint: disable=missing-function-docstring
+# pylint: disable=unused-argument
+
+class_receiver = model_receiver(Class)
+
+
+@class_receiver(signals.post_save)
+def class__post_save(sender, instance: Class, *args, **kwargs):
+    bump_generation(Class)
+
+
+@class_receiver(signals.post_delete)
+def class__post_delete(sender, instance: Class, *args, **kwargs):
+    bump_generation(Class)
@@ -0,0 +1,25 @@
+"""
+© Ocado Group
+Created on 19/10/2026 at 11:32:08(+01:00).
+"""
+
+from django.db.models import signals
+
+from ...models.signals import model_receiver
+from ...response_cache import bump_generation
+from ..models import School
+
+# pylint: disable=missing-function-docstring
+# pylint: disable=unused-argument
+
+school_receiver = model_receiver(School)
+
+
+@school_receiver(signals.post_save)
+def school__post_save(sender, instance: School, *args, **kwargs):
+    bump_generation(School)
+
+
+@school_receiver(signals.post_delete)
+def school__post_delete(sender, instance: School, *args, **kwargs):
+    bump_generation(School)
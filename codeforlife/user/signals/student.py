@@ -0,0 +1,25 @@
+"""
+© Ocado Group
+Created on 19/10/2026 at 11:32:08(+01:00).
+"""
+
+from django.db.models import signals
+
+from ...models.signals import model_receiver
+from ...response_cache import bump_generation
+from ..models import Student
+
+# pylint: disable=missing-function-docstring
+# pylint: disable=unused-argument
+
+student_receiver = model_receiver(Student)
+
+
+@student_receiver(signals.post_save)
+def student__post_save(sender, instance: Student, *args, **kwargs):
+    bump_generation(Student)
+
+
+@student_receiver(signals.post_delete)
+def student__post_delete(sender, instance: Student, *args, **kwargs):
+    bump_generation(Student)
@@ -3,7 +3,23 @@
 Created on 14/03/2024 at 12:41:05(+00:00).
 """
 
+from django.db.models import signals
+
 from ...models.signals import model_receiver
+from ...response_cache import bump_generation
 from ..models import Teacher
 
+# pylint: disable=missing-function-docstring
+# pylint: disable=unused-argument
+
 teacher_receiver = model_receiver(Teacher)
+
+
+@teacher_receiver(signals.post_save)
+def teacher__post_save(sender, instance: Teacher, *args, **kwargs):
+    bump_generation(Teacher)
+
+
+@teacher_receiver(signals.post_delete)
+def teacher__post_delete(sender, instance: Teacher, *args, **kwargs):
+    bump_generation(Teacher)
@@ -3,10 +3,12 @@
 Created on 24/01/2024 at 13:47:53(+00:00).
 """
 
+import typing as t
+
 from ...permissions import OR
 from ...views import ModelViewSet
 from ..filters import ClassFilterSet
-from ..models import Class, User
+from ..models import Class, School, Student, Teacher, User
 from ..permissions import IsStudent, IsTeacher
 from ..serializers import ClassSerializer
 
@@ -19,6 +21,8 @@ class ClassViewSet(ModelViewSet[User, Class]):
     lookup_field = "access_code"
     serializer_class = ClassSerializer
     filterset_class = ClassFilterSet
+    response_cache_timeout = 60
+    response_cache_models = (School, Student, Teacher)
 
     # pylint: disable-next=missing-function-docstring
     def get_permissions(self):
@@ -34,4 +38,14 @@ class ClassViewSet(ModelViewSet[User, Class]):
         if user.student:
             return Class.objects.filter(students=user.student)
 
-        return self.request.school_teacher_user.teacher.classes
+        return Class.objects.filter(
+            teacher__school_id=t.cast(Teacher, user.teacher).school_id
+        )
+
+    # pylint: disable-next=missing-function-docstring
+    def get_response_cache_scope(self):
+        user = self.request.auth_user
+        if user.student:
+            return f"class:{user.student.class_field_id}"
+
+        return f"school:{t.cast(Teacher, user.teacher).school_id}"
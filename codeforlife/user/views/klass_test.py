@@ -3,10 +3,26 @@
 Created on 20/01/2024 at 09:48:30(+00:00).
 """
 
+from unittest.mock import patch
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+
 from ...permissions import OR
+from ...serializers import ModelListSerializer
 from ...tests import ModelViewSetTestCase
-from ..models import AdminSchoolTeacherUser, Class, StudentUser, User
+from ..filters import ClassFilterSet
+from ..models import (
+    AdminSchoolTeacherUser,
+    Class,
+    School,
+    SchoolTeacherUser,
+    StudentUser,
+    User,
+)
 from ..permissions import IsStudent, IsTeacher
+from ..serializers import ClassSerializer
 from ..views import ClassViewSet
 
 RequestUser = User
@@ -17,6 +33,14 @@ class TestClassViewSet(ModelViewSetTestCase[RequestUser, Class]):
     basename = "class"
     model_view_set_class = ClassViewSet
     fixtures = ["school_1"]
+    # Authenticating the requester and saving their session takes 13 queries.
+    max_query_counts = {
+        # Count the classes and get their page.
+        "list": 13 + 2,
+        # Check the student's class (2), get the class (1) and check the
+        # session's auth factors for the class (1).
+        "retrieve": 13 + 4,
+    }
 
     def setUp(self):
         self.admin_school_teacher_user = AdminSchoolTeacherUser.objects.get(
@@ -61,6 +85,32 @@ class TestClassViewSet(ModelViewSetTestCase[RequestUser, Class]):
             request=self.client.request_factory.get(user=user),
         )
 
+    # test: get response cache scope
+
+    def test_get_response_cache_scope__student(self):
+        """A student's scope is their class, without making any queries once
+        they're authenticated."""
+        user = StudentUser.objects.first()
+        assert user
+        view = ClassViewSet(request=self.client.request_factory.get(user=user))
+
+        with self.assertNumQueries(0):
+            scope = view.get_response_cache_scope()
+
+        assert scope == f"class:{user.student.class_field_id}"
+
+    def test_get_response_cache_scope__teacher(self):
+        """A teacher's scope is their school, without making any queries once
+        they're authenticated."""
+        user = self.admin_school_teacher_user
+        assert user.student is None and user.teacher
+        view = ClassViewSet(request=self.client.request_factory.get(user=user))
+
+        with self.assertNumQueries(0):
+            scope = view.get_response_cache_scope()
+
+        assert scope == f"school:{user.teacher.school_id}"
+
     # test: actions
 
     def test_retrieve(self):
@@ -71,6 +121,89 @@ class TestClassViewSet(ModelViewSetTestCase[RequestUser, Class]):
         self.client.login_as(user, password="Password1")
         self.client.retrieve(model=user.student.class_field)
 
+    def test_retrieve__not_modified(self):
+        """Retrieving an unchanged class responds with not modified."""
+        user = StudentUser.objects.first()
+        assert user
+
+        self.client.login_as(user, password="Password1")
+        response = self.client.retrieve(model=user.student.class_field)
+        etag = response["ETag"]
+        assert etag.startswith('W/"')
+
+        with patch.object(
+            ClassSerializer, "to_representation"
+        ) as to_representation:
+            response = self.client.retrieve(
+                model=user.student.class_field,
+                status_code_assertion=status.HTTP_304_NOT_MODIFIED,
+                make_assertions=False,
+                HTTP_IF_NONE_MATCH=etag,
+            )
+        assert response["ETag"] == etag
+        to_representation.assert_not_called()
+
+    def test_retrieve__not_modified__permissions(self):
+        """An unchanged class is only answered with not modified if the
+        requester may still retrieve it."""
+        user = self.admin_school_teacher_user
+        klass = user.teacher.classes.first()
+        assert klass
+
+        other_teacher = SchoolTeacherUser.objects.create_user(
+            first_name="Other",
+            last_name="Teacher",
+            email="teacher@other-school.com",
+            password="Password1",
+            school=School.objects.create(name="Other School"),
+        ).teacher
+
+        self.client.login_as(user)
+        response = self.client.get(self.reverse_action("detail", model=klass))
+        etag = response["ETag"]
+
+        # Move the class to another school without bumping its generation.
+        Class.objects.filter(pk=klass.pk).update(teacher=other_teacher)
+
+        self.client.get(
+            self.reverse_action("detail", model=klass),
+            status_code_assertion=status.HTTP_404_NOT_FOUND,
+            HTTP_IF_NONE_MATCH=etag,
+        )
+
+    def test_list__not_modified(self):
+        """Listing unchanged classes responds with not modified, without
+        getting the classes, until a class changes."""
+        user = self.admin_school_teacher_user
+        klass = user.teacher.classes.first()
+        assert klass
+
+        self.client.login_as(user)
+        etag = self.client.get(self.reverse_action("list"))["ETag"]
+
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get(
+                self.reverse_action("list"),
+                status_code_assertion=status.HTTP_304_NOT_MODIFIED,
+                HTTP_IF_NONE_MATCH=etag,
+            )
+        assert response["ETag"] == etag
+        assert not [
+            query["sql"]
+            for query in captured.captured_queries
+            if query["sql"].startswith('SELECT "common_class"."id"')
+        ]
+
+        klass.name = "Modified Class"
+        klass.save()
+
+        response = self.client.get(
+            self.reverse_action("list"),
+            status_code_assertion=status.HTTP_200_OK,
+            HTTP_IF_NONE_MATCH=etag,
+        )
+        assert response["ETag"] != etag
+
     def test_list(self):
         """Can successfully list classes."""
         user = self.admin_school_teacher_user
@@ -78,8 +211,119 @@ class TestClassViewSet(ModelViewSetTestCase[RequestUser, Class]):
         assert user.teacher.classes.count() >= 2
 
         self.client.login_as(user)
+        with self.assert_no_n_plus_one_queries():
+            self.client.get(self.reverse_action("list"))
+
         self.client.list(models=user.teacher.classes.all())
 
+    def test_list__query_count(self):
+        """Listing classes makes the same number of queries for any number of
+        classes."""
+        user = self.admin_school_teacher_user
+        klass = user.teacher.classes.first()
+        assert klass
+
+        self.client.login_as(user)
+
+        def list_classes():
+            with CaptureQueriesContext(connection) as captured:
+                response = self.client.get(self.reverse_action("list"))
+
+            json_models = response.json()["data"]  # type: ignore[attr-defined]
+            return len(json_models), len(captured.captured_queries)
+
+        class_count, query_count = list_classes()
+
+        for index in range(3):
+            klass.pk = None
+            klass.access_code = f"QC{index:03}"
+            klass.save()
+
+        assert list_classes() == (class_count + 3, query_count)
+
+    def test_list__cached(self):
+        """
+        Listing classes again is served from the cache until a class changes.
+        """
+        user = self.admin_school_teacher_user
+        klass = user.teacher.classes.first()
+        assert klass
+
+        self.client.login_as(user)
+
+        def list_classes():
+            with CaptureQueriesContext(connection) as captured:
+                response = self.client.get(self.reverse_action("list"))
+
+            return response, [
+                query["sql"]
+                for query in captured.captured_queries
+                if query["sql"].startswith('SELECT "common_class"."id"')
+            ]
+
+        _, class_queries = list_classes()
+        assert class_queries
+
+        _, class_queries = list_classes()
+        assert not class_queries
+
+        klass.name = "Cached Class"
+        klass.save()
+
+        response, class_queries = list_classes()
+        assert class_queries
+        json_models = response.json()["data"]  # type: ignore[attr-defined]
+        assert "Cached Class" in [
+            json_model["name"] for json_model in json_models
+        ]
+
+    def test_list__cached__bulk_update(self):
+        """Bulk updating classes invalidates the cached list."""
+        user = self.admin_school_teacher_user
+        klass = user.teacher.classes.first()
+        assert klass
+
+        self.client.login_as(user)
+
+        def list_class_names():
+            response = self.client.get(self.reverse_action("list"))
+            json_models = response.json()["data"]  # type: ignore[attr-defined]
+            return [json_model["name"] for json_model in json_models]
+
+        assert "Bulk Updated Class" not in list_class_names()
+
+        ModelListSerializer(
+            child=ClassSerializer(), context={"view": ClassViewSet()}
+        ).update([klass], [{"name": "Bulk Updated Class"}])
+
+        assert "Bulk Updated Class" in list_class_names()
+
+    def test_retrieve__cached__permissions(self):
+        """A cached class is only retrieved if the requester may still
+        retrieve it."""
+        user = self.admin_school_teacher_user
+        klass = user.teacher.classes.first()
+        assert klass
+
+        other_teacher = SchoolTeacherUser.objects.create_user(
+            first_name="Other",
+            last_name="Teacher",
+            email="teacher@other-school.com",
+            password="Password1",
+            school=School.objects.create(name="Other School"),
+        ).teacher
+
+        self.client.login_as(user)
+        self.client.get(self.reverse_action("detail", model=klass))
+
+        # Move the class to another school without bumping its generation.
+        Class.objects.filter(pk=klass.pk).update(teacher=other_teacher)
+
+        self.client.get(
+            self.reverse_action("detail", model=klass),
+            status_code_assertion=status.HTTP_404_NOT_FOUND,
+        )
+
     def test_list___id(self):
         """Can successfully list classes in a school, excluding some by ID."""
         user = self.admin_school_teacher_user
@@ -99,7 +343,8 @@ class TestClassViewSet(ModelViewSetTestCase[RequestUser, Class]):
 
     def test_list__id_or_name(self):
         """
-        Can successfully list classes in a school, filtered by their ID or name.
+        Can successfully list classes in a school, filtered by the start of
+        their ID or their name.
         """
         user = self.admin_school_teacher_user
         assert user
@@ -113,7 +358,7 @@ class TestClassViewSet(ModelViewSetTestCase[RequestUser, Class]):
         self.client.login_as(user)
         self.client.list(
             models=user.teacher.classes.filter(
-                access_code__icontains=partial_access_code
+                access_code__istartswith=partial_access_code
             ),
             filters={"id_or_name": partial_access_code},
         )
@@ -122,6 +367,20 @@ class TestClassViewSet(ModelViewSetTestCase[RequestUser, Class]):
             filters={"id_or_name": partial_name},
         )
 
+    def test_list__id_or_name__index(self):
+        """Classes' IDs and names are searched with indexes."""
+        with connection.cursor() as cursor:
+            # Force Postgres to use an index, as the table is tiny.
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+        request = self.client.request_factory.get(data={"id_or_name": "AB"})
+        plan = ClassFilterSet(
+            request.GET, queryset=Class.objects.all(), request=request
+        ).qs.explain()
+
+        assert "common_class_access_code_upper_btree" in plan, plan
+        assert "common_class_name_upper_gin" in plan, plan
+
     def test_list__teacher(self):
         """Can successfully list classes assigned to a teacher."""
         user = self.admin_school_teacher_user
@@ -132,4 +391,6 @@ class TestClassViewSet(ModelViewSetTestCase[RequestUser, Class]):
         self.client.list(
             models=classes,
             filters={"teacher": str(user.teacher.id)},
+            # Also get the teacher to filter by.
+            max_query_count=self.max_query_counts["list"] + 1,
         )
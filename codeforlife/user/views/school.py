@@ -3,9 +3,11 @@
 Created on 24/01/2024 at 13:38:15(+00:00).
 """
 
+import typing as t
+
 from ...permissions import OR, AllowNone
 from ...views import ModelViewSet
-from ..models import School, User
+from ..models import Class, School, Student, Teacher, User
 from ..permissions import IsIndependent, IsStudent, IsTeacher
 from ..serializers import SchoolSerializer
 
@@ -16,6 +18,8 @@ class SchoolViewSet(ModelViewSet[User, School]):
     model_class = School
     http_method_names = ["get"]
     serializer_class = SchoolSerializer
+    response_cache_timeout = 60
+    response_cache_models = (Class, Student, Teacher)
 
     def get_permissions(self):
         # No one is allowed to list schools.
@@ -43,5 +47,17 @@ class SchoolViewSet(ModelViewSet[User, School]):
                 id=user.student.class_field.teacher.school_id
             )
 
-        user = self.request.school_teacher_user
-        return School.objects.filter(id=user.teacher.school_id)
+        return School.objects.filter(id=t.cast(Teacher, user.teacher).school_id)
+
+    # pylint: disable-next=missing-function-docstring
+    def get_response_cache_scope(self):
+        user = self.request.auth_user
+        if user.student:
+            # Scope by class, which doesn't need the class's teacher to be
+            # loaded, as a student's school is that of their class.
+            return "class:" + str(
+                user.student.pending_class_request_id
+                or user.student.class_field_id
+            )
+
+        return f"school:{t.cast(Teacher, user.teacher).school_id}"
@@ -23,6 +23,13 @@ class TestSchoolViewSet(ModelViewSetTestCase[RequestUser, School]):
     basename = "school"
     model_view_set_class = SchoolViewSet
     fixtures = ["school_1", "independent"]
+    # Authenticating the requester and saving their session takes 13 queries.
+    max_query_counts = {
+        # Get the school (1) and check the session's auth factors for each
+        # permission (5).
+        "retrieve": 13
+        + 6,
+    }
 
     # test: get permissions
 
@@ -82,6 +89,46 @@ class TestSchoolViewSet(ModelViewSetTestCase[RequestUser, School]):
             request=self.client.request_factory.get(user=user),
         )
 
+    # test: get response cache scope
+
+    def test_get_response_cache_scope__student(self):
+        """A student's scope is their class, without making any queries once
+        they're authenticated."""
+        user = StudentUser.objects.first()
+        assert user
+        view = SchoolViewSet(request=self.client.request_factory.get(user=user))
+
+        with self.assertNumQueries(0):
+            scope = view.get_response_cache_scope()
+
+        assert scope == f"class:{user.student.class_field_id}"
+
+    def test_get_response_cache_scope__independent(self):
+        """An independent's scope is the class they're requesting to join."""
+        user = IndependentUser.objects.filter(
+            new_student__pending_class_request__isnull=False
+        ).first()
+        assert user
+        view = SchoolViewSet(request=self.client.request_factory.get(user=user))
+
+        with self.assertNumQueries(0):
+            scope = view.get_response_cache_scope()
+
+        assert scope == f"class:{user.student.pending_class_request_id}"
+
+    def test_get_response_cache_scope__teacher(self):
+        """A teacher's scope is their school, without making any queries once
+        they're authenticated."""
+        user = SchoolTeacherUser.objects.first()
+        assert user
+        assert user.student is None and user.teacher
+        view = SchoolViewSet(request=self.client.request_factory.get(user=user))
+
+        with self.assertNumQueries(0):
+            scope = view.get_response_cache_scope()
+
+        assert scope == f"school:{user.teacher.school_id}"
+
     # test: actions
 
     def test_retrieve(self):
@@ -3,12 +3,23 @@
 Created on 19/01/2024 at 17:15:56(+00:00).
 """
 
+import json
+import random
+import string
 import typing as t
+from unittest.mock import patch
+from urllib.parse import urlencode
 
+from django.core.cache import cache
+from django.db import connection
 from django.db.models import Q
 from django.db.models.query import QuerySet
+from django.test.utils import CaptureQueriesContext
 
+from ...pagination import KeysetPagination, LimitOffsetPagination
 from ...tests import ModelViewSetTestCase
+from ...types import JsonDict
+from ..filters import UserFilterSet
 from ..models import (
     AdminSchoolTeacherUser,
     Class,
@@ -20,6 +31,7 @@ from ..models import (
     StudentUser,
     User,
 )
+from ..serializers import UserSerializer
 from ..views import UserViewSet
 
 RequestUser = User
@@ -30,6 +42,15 @@ class TestUserViewSet(ModelViewSetTestCase[RequestUser, User]):
     basename = "user"
     model_view_set_class = UserViewSet
     fixtures = ["non_school_teacher", "school_1", "independent"]
+    # Authenticating the requester and saving their session takes 13 queries.
+    max_query_counts = {
+        # Get the teacher's school (1), then count the users and get their page
+        # with their related models (2).
+        "list": 13 + 3,
+        # Get the teacher's school (1) and the user with their related models
+        # (1).
+        "retrieve": 13 + 2,
+    }
 
     def setUp(self):
         self.admin_school_teacher_user = AdminSchoolTeacherUser.objects.get(
@@ -124,6 +145,34 @@ class TestUserViewSet(ModelViewSetTestCase[RequestUser, User]):
             request=self.client.request_factory.get(user=user),
         )
 
+    def test_get_queryset__teacher__union(self):
+        """
+        School-teacher-users' targets are selected by a UNION of one query per
+        group of users, instead of ORing the joins of the user table.
+        """
+        user = AdminSchoolTeacherUser.objects.first()
+        assert user
+
+        queryset = self.model_view_set_class(
+            request=self.client.request_factory.get(user=user)
+        ).get_queryset()
+
+        def get_plans(plan: JsonDict) -> t.Iterator[JsonDict]:
+            yield plan
+            for sub_plan in t.cast(t.List[JsonDict], plan.get("Plans", [])):
+                yield from get_plans(sub_plan)
+
+        plans = list(
+            get_plans(json.loads(queryset.explain(format="json"))[0]["Plan"])
+        )
+
+        appends = [plan for plan in plans if plan["Node Type"] == "Append"]
+        assert len(appends) == 1
+        assert len(t.cast(t.List[JsonDict], appends[0]["Plans"])) == 3
+        assert not any(
+            " OR " in str(plan.get("Filter", "")) for plan in plans
+        ), "Users should not be filtered by an OR of their joins."
+
     # test: actions
 
     def test_list(self):
@@ -140,6 +189,222 @@ class TestUserViewSet(ModelViewSetTestCase[RequestUser, User]):
         self.client.login_as(user, password="abc123")
         self.client.list(models=users)
 
+    def test_list__no_n_plus_one_queries(self):
+        """Listing users doesn't lazily load their relations one by one."""
+        user = AdminSchoolTeacherUser.objects.first()
+        assert user
+
+        self.client.login_as(user, password="abc123")
+        with self.assert_no_n_plus_one_queries():
+            self.client.get(self.reverse_action("list"))
+
+    def test_list__over_query_budget(self):
+        """Exceeding the query budget fails and reports the captured SQL."""
+        user = AdminSchoolTeacherUser.objects.first()
+        assert user
+
+        self.client.login_as(user, password="abc123")
+        with self.assertRaises(AssertionError) as context:
+            self.client.list(models=[], max_query_count=1)
+
+        message = str(context.exception)
+        assert message.startswith('Action "list" made')
+        assert 'SELECT COUNT(*) AS "__count" FROM "auth_user"' in message
+
+    def test_list__query_count(self):
+        """Listing users makes the same number of queries for any number of
+        users, as the related models are loaded with the users."""
+        user = AdminSchoolTeacherUser.objects.first()
+        assert user
+
+        self.client.login_as(user, password="abc123")
+
+        query_counts: t.List[int] = []
+        for limit in [1, 2, 1000]:
+            with CaptureQueriesContext(connection) as captured:
+                response = self.client.get(
+                    self.reverse_action("list") + f"?limit={limit}"
+                )
+
+            json_models = response.json()["data"]  # type: ignore[attr-defined]
+            assert len(json_models) == min(limit, response.json()["count"])
+            query_counts.append(len(captured.captured_queries))
+
+        assert len(set(query_counts)) == 1
+
+    def test_list__fields(self):
+        """Can successfully list a sparse fieldset of users."""
+        user = AdminSchoolTeacherUser.objects.first()
+        assert user
+
+        self.client.login_as(user, password="abc123")
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get(
+                self.reverse_action("list") + "?fields=id,first_name"
+            )
+
+        json_models = response.json()["data"]  # type: ignore[attr-defined]
+        assert json_models
+        for json_model in json_models:
+            assert set(json_model.keys()) == {"id", "first_name"}
+
+        assert any(
+            query["sql"].startswith(
+                'SELECT "auth_user"."id", "auth_user"."first_name" FROM'
+            )
+            for query in captured.captured_queries
+        )
+
+    def test_list__expand(self):
+        """Can successfully list users with only the expanded nested
+        serializers."""
+        user = AdminSchoolTeacherUser.objects.first()
+        assert user
+
+        self.client.login_as(user, password="abc123")
+        response = self.client.get(
+            self.reverse_action("list") + "?expand=student"
+        )
+
+        field_names = set(UserSerializer.Meta.fields) - {"teacher"}
+        json_models = response.json()["data"]  # type: ignore[attr-defined]
+        assert json_models
+        for json_model in json_models:
+            assert set(json_model.keys()) == field_names
+
+    def test_list__count__false(self):
+        """Can successfully list users without counting them."""
+        user = AdminSchoolTeacherUser.objects.first()
+        assert user
+
+        self.client.login_as(user, password="abc123")
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get(
+                self.reverse_action("list") + "?count=false"
+            )
+
+        assert response.json()["count"] is None  # type: ignore[attr-defined]
+        assert all(
+            "COUNT(" not in query["sql"] for query in captured.captured_queries
+        )
+
+    def test_list__count__cached(self):
+        """Can successfully list users with a cached count."""
+        user = AdminSchoolTeacherUser.objects.first()
+        assert user
+
+        self.client.login_as(user, password="abc123")
+        cache.clear()
+
+        def list_users():
+            with CaptureQueriesContext(connection) as captured:
+                response = self.client.get(self.reverse_action("list"))
+
+            count_queries = [
+                query["sql"]
+                for query in captured.captured_queries
+                if "COUNT(" in query["sql"]
+            ]
+            return (
+                response.json()["count"],  # type: ignore[attr-defined]
+                count_queries,
+            )
+
+        with patch.object(UserViewSet, "count_strategy", "cached", create=True):
+            count, count_queries = list_users()
+            assert count
+            assert len(count_queries) == 1
+
+            cached_count, count_queries = list_users()
+            assert cached_count == count
+            assert not count_queries
+
+    def test_list__count__estimate(self):
+        """Can successfully list users with an estimated count, which falls
+        back to an exact count below the threshold."""
+        user = AdminSchoolTeacherUser.objects.first()
+        assert user
+
+        self.client.login_as(user, password="abc123")
+
+        def list_users():
+            with CaptureQueriesContext(connection) as captured:
+                response = self.client.get(self.reverse_action("list"))
+
+            return (
+                response.json()["count"],  # type: ignore[attr-defined]
+                [query["sql"] for query in captured.captured_queries],
+            )
+
+        with patch.object(
+            UserViewSet, "count_strategy", "estimate", create=True
+        ):
+            count, queries = list_users()
+            assert count
+            assert any(query.startswith("EXPLAIN") for query in queries)
+            assert any("COUNT(" in query for query in queries)
+
+            with patch.object(
+                LimitOffsetPagination, "count_estimate_threshold", 0
+            ):
+                estimate, queries = list_users()
+
+        assert isinstance(estimate, int)
+        assert any(query.startswith("EXPLAIN") for query in queries)
+        assert all("COUNT(" not in query for query in queries)
+
+    def test_list__keyset_pagination(self):
+        """
+        Can successfully list users page by page by keyset, without counting
+        the users or skipping to an offset.
+        """
+        user = AdminSchoolTeacherUser.objects.first()
+        assert user
+
+        users = [
+            *list(user.teacher.school_teacher_users),
+            *list(user.teacher.student_users),
+        ]
+        users.sort(key=lambda user: user.pk)
+        assert len(users) > 2
+
+        self.client.login_as(user, password="abc123")
+
+        json_models: t.List[JsonDict] = []
+        cursor: t.Optional[str] = None
+        with patch.object(
+            UserViewSet, "pagination_class", KeysetPagination
+        ), CaptureQueriesContext(connection) as captured:
+            while True:
+                query = {"limit": "2"}
+                if cursor is not None:
+                    query["cursor"] = cursor
+
+                response = self.client.get(
+                    self.reverse_action("list") + f"?{urlencode(query)}"
+                )
+                response_json = response.json()  # type: ignore[attr-defined]
+                json_models.extend(response_json["data"])
+                cursor = response_json["next"]
+                if cursor is None:
+                    break
+
+        assert len(users) == len(json_models)
+        for model, json_model in zip(users, json_models):
+            self.assert_serialized_model_equals_json_model(
+                model, json_model, action="list", request_method="get"
+            )
+
+        keyset_queries = [
+            query["sql"]
+            for query in captured.captured_queries
+            if '"auth_user"."id" > ' in query["sql"]
+        ]
+        assert keyset_queries
+        for query in keyset_queries:
+            assert "OFFSET" not in query
+            assert "COUNT(" not in query
+
     def test_list__students_in_class(self):
         """Can successfully list student-users in a class."""
         user = self.admin_school_teacher_user
@@ -164,7 +429,7 @@ class TestUserViewSet(ModelViewSetTestCase[RequestUser, User]):
     def test_list__type__teacher(self):
         """Can successfully list only teacher-users."""
         user = self.admin_school_teacher_user
-        school_teacher_users = user.teacher.school_teacher_users.all()
+        school_teacher_users = user.teacher.school_teacher_users.order_by("pk")
         assert school_teacher_users.exists()
 
         self.client.login_as(user)
@@ -176,7 +441,7 @@ class TestUserViewSet(ModelViewSetTestCase[RequestUser, User]):
     def test_list__type__student(self):
         """Can successfully list only student-users."""
         user = self.admin_school_teacher_user
-        student_users = user.teacher.student_users.all()
+        student_users = user.teacher.student_users.order_by("pk")
         assert student_users.exists()
 
         self.client.login_as(user)
@@ -188,7 +453,7 @@ class TestUserViewSet(ModelViewSetTestCase[RequestUser, User]):
     def test_list__type__indy(self):
         """Can successfully list only independent-users."""
         user = self.admin_school_teacher_user
-        indy_users = user.teacher.indy_users.all()
+        indy_users = user.teacher.indy_users.order_by("pk")
         assert indy_users.exists()
 
         self.client.login_as(user)
@@ -239,6 +504,108 @@ class TestUserViewSet(ModelViewSetTestCase[RequestUser, User]):
             filters={"name": f"{first_name} {last_name}"},
         )
 
+    def test_list__name_similar(self):
+        """Can successfully list all users with a similar name, ordered by how
+        similar their names are."""
+        user = AdminSchoolTeacherUser.objects.first()
+        assert user
+
+        self.client.login_as(user, password="abc123")
+        self.client.list(
+            models=[
+                User.objects.get(first_name="Carlton", last_name="Joseph"),
+                User.objects.get(first_name="Tajmae", last_name="Joseph"),
+            ],
+            filters={"name_similar": "Carlten Josef"},
+        )
+
+    def test_name__trigram_index(self):
+        """Users' names are searched with the trigram indexes."""
+        with connection.cursor() as cursor:
+            # Force Postgres to use an index, as the table is tiny.
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+        for name in ["name", "name_similar"]:
+            request = self.client.request_factory.get(data={name: "John Doe"})
+            plan = UserFilterSet(
+                request.GET, queryset=User.objects.all(), request=request
+            ).qs.explain()
+
+            assert "auth_user_first_name_upper_trgm" in plan, plan
+            assert "auth_user_last_name_upper_trgm" in plan, plan
+
+    def test_name__trigram_index__benchmark(self):
+        """On a realistic number of users, Postgres chooses the trigram
+        indexes to search users' names, and estimates it's cheaper than the
+        previous substring search, which scanned the user table."""
+        rand = random.Random(0)
+
+        def random_name():
+            return "".join(rand.choices(string.ascii_letters, k=10))
+
+        User.objects.bulk_create(
+            [
+                User(
+                    username=f"benchmark{i}",
+                    first_name=random_name(),
+                    last_name=random_name(),
+                )
+                for i in range(10000)
+            ]
+        )
+
+        with connection.cursor() as cursor:
+            # Move the new names from the indexes' pending lists into the
+            # indexes, as autovacuum would.
+            cursor.execute(
+                "SELECT gin_clean_pending_list(%s::regclass),"
+                " gin_clean_pending_list(%s::regclass)",
+                [
+                    "auth_user_first_name_upper_trgm",
+                    "auth_user_last_name_upper_trgm",
+                ],
+            )
+            # The table is small enough to be sampled fully, so the estimates
+            # are the same on every run.
+            cursor.execute('ANALYZE "auth_user"')
+
+        user = User.objects.get(username="benchmark0")
+        values = {
+            "name": f"{user.first_name[2:8]} {user.last_name[2:8]}",
+            "name_similar": f"{user.first_name[:9]} {user.last_name[1:]}",
+        }
+
+        def get_plan(name: str):
+            request = self.client.request_factory.get(data={name: values[name]})
+            queryset = UserFilterSet(
+                request.GET, queryset=User.objects.all(), request=request
+            ).qs
+            assert user in queryset
+
+            plan = queryset.explain(format="json")
+            return json.dumps(json.loads(plan)), json.loads(plan)[0]["Plan"]
+
+        plans = {name: get_plan(name) for name in ["name", "name_similar"]}
+        for plan, _ in plans.values():
+            assert "auth_user_first_name_upper_trgm" in plan, plan
+            assert "auth_user_last_name_upper_trgm" in plan, plan
+
+        # Search as before the indexes were added. Dropping them is rolled
+        # back with the test's transaction.
+        with connection.cursor() as cursor:
+            cursor.execute('DROP INDEX "auth_user_first_name_upper_trgm"')
+            cursor.execute('DROP INDEX "auth_user_last_name_upper_trgm"')
+
+        scan_plan, scan = get_plan("name")
+        assert '"Seq Scan"' in scan_plan, scan_plan
+
+        for name, (plan, index) in plans.items():
+            assert index["Total Cost"] < scan["Total Cost"], (
+                f"Searching by {name} with the indexes is estimated to cost"
+                f" {index['Total Cost']}, and scanning the user table"
+                f" {scan['Total Cost']}:\n{plan}\n{scan_plan}"
+            )
+
     def test_retrieve(self):
         """Can successfully retrieve users."""
         user = AdminSchoolTeacherUser.objects.first()
@@ -4,7 +4,10 @@ Created on 24/01/2024 at 13:07:38(+00:00).
 """
 
 from .api import APIView, BaseAPIView
+from .async_api import AsyncAPIView, BaseAsyncAPIView
+from .async_model import AsyncModelViewSet
 from .base_login import BaseLoginView
+from .batch import BatchView
 from .csrf import CsrfCookieView
 from .decorators import action, cron_job
 from .health_check import HealthCheckView
@@ -0,0 +1,122 @@
+"""
+© Ocado Group
+Created on 19/10/2026 at 12:10:45(+01:00).
+"""
+
+import typing as t
+
+from asgiref.sync import (
+    iscoroutinefunction,
+    markcoroutinefunction,
+    sync_to_async,
+)
+from django.db import connections, transaction
+
+from ..request import BaseRequest, Request
+from .api import APIView, BaseAPIView
+
+# pylint: disable=duplicate-code
+if t.TYPE_CHECKING:
+    from ..user.models import User
+
+    RequestUser = t.TypeVar("RequestUser", bound=User)
+else:
+    RequestUser = t.TypeVar("RequestUser")
+
+AnyBaseRequest = t.TypeVar("AnyBaseRequest", bound=BaseRequest)
+
+# pylint: enable=duplicate-code
+
+
+class BaseAsyncAPIView(BaseAPIView[AnyBaseRequest], t.Generic[AnyBaseRequest]):
+    """Base API view whose requests are dispatched on the event loop.
+
+    Async handlers (e.g. "async def get") are awaited on the event loop, so
+    I/O-bound handlers can run concurrently. Sync handlers are run in a thread
+    with sync_to_async, within a transaction if the database has
+    ATOMIC_REQUESTS set. The request is initialized (authentication,
+    permissions and throttles), exceptions are handled and the response is
+    finalized in a thread, as they may query the database or render the
+    response.
+
+    As Django doesn't support ATOMIC_REQUESTS for async views, async handlers
+    that write to the database should open their own transactions.
+    """
+
+    view_is_async = True
+
+    @classmethod
+    def as_view(cls, *args, **initkwargs):
+        view = super().as_view(*args, **initkwargs)
+
+        # View sets don't use Django's as_view, which marks async views.
+        markcoroutinefunction(view)
+
+        for alias in connections:
+            view = transaction.non_atomic_requests(using=alias)(view)
+
+        return view
+
+    # pylint: disable-next=unused-argument
+    def handler_is_atomic(self, request: AnyBaseRequest):
+        """Whether a sync handler should be run within a transaction.
+
+        Args:
+            request: The request being handled.
+
+        Returns:
+            A flag designating whether the handler should be atomic.
+        """
+        return bool(connections["default"].settings_dict["ATOMIC_REQUESTS"])
+
+    # pylint: disable-next=invalid-overridden-method
+    async def dispatch(  # type: ignore[override]
+        self, request, *args, **kwargs
+    ):
+        # pylint: disable=attribute-defined-outside-init
+        self.args = args
+        self.kwargs = kwargs
+        request = await sync_to_async(self.initialize_request)(
+            request, *args, **kwargs
+        )
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            # Get the appropriate handler method
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(
+                    self, request.method.lower(), self.http_method_not_allowed
+                )
+            else:
+                handler = self.http_method_not_allowed
+
+            if iscoroutinefunction(handler):
+                response = await handler(request, *args, **kwargs)
+            else:
+                if self.handler_is_atomic(request):
+                    handler = transaction.atomic(handler)
+
+                response = await sync_to_async(handler)(
+                    request, *args, **kwargs
+                )
+
+        # pylint: disable-next=broad-exception-caught
+        except Exception as exc:
+            response = await sync_to_async(self.handle_exception)(exc)
+
+        self.response = await sync_to_async(self.finalize_response)(
+            request, response, *args, **kwargs
+        )
+        return self.response
+
+
+# pylint: disable-next=missing-class-docstring
+class AsyncAPIView(
+    BaseAsyncAPIView[Request[RequestUser]],
+    APIView[RequestUser],
+    t.Generic[RequestUser],
+):
+    pass
@@ -0,0 +1,156 @@
+"""
+© Ocado Group
+Created on 19/10/2026 at 12:31:02(+01:00).
+"""
+
+import typing as t
+
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ValidationError
+from django.db.models import Model
+from django.http import Http404
+from rest_framework.response import Response
+
+from ..request import Request
+from .async_api import BaseAsyncAPIView
+from .model import ModelViewSet
+
+AnyModel = t.TypeVar("AnyModel", bound=Model)
+
+# pylint: disable=duplicate-code
+if t.TYPE_CHECKING:  # pragma: no cover
+    from ..user.models import User
+
+    RequestUser = t.TypeVar("RequestUser", bound=User)
+else:
+    RequestUser = t.TypeVar("RequestUser")
+
+# pylint: enable=duplicate-code
+
+
+# pylint: disable-next=too-many-ancestors
+class AsyncModelViewSet(
+    BaseAsyncAPIView[Request[RequestUser]],
+    ModelViewSet[RequestUser, AnyModel],
+    t.Generic[RequestUser, AnyModel],
+):
+    """Model view set whose list and retrieve actions use the async ORM.
+
+    The other actions are sync and are run in a thread, within a transaction.
+    The view set's queryset and serializer methods are sync, as they may
+    lazily query the database, and are called in a thread.
+    """
+
+    def handler_is_atomic(self, request):
+        # The bulk action opens its own transactions if destroys are chunked.
+        if self.action == "bulk" and self.bulk_destroy_chunk_size is not None:
+            return False
+
+        return super().handler_is_atomic(request)
+
+    async def aget_filtered_queryset(self):
+        """Get the filtered queryset in a thread.
+
+        Returns:
+            The filtered queryset, which is not evaluated.
+        """
+        return await sync_to_async(
+            lambda: self.filter_queryset(self.get_queryset())
+        )()
+
+    async def aget_object(self) -> AnyModel:
+        """Get the model the view is displaying with the async ORM.
+
+        Returns:
+            The model.
+        """
+        queryset = await self.aget_filtered_queryset()
+
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        assert lookup_url_kwarg in self.kwargs
+
+        try:
+            model = await queryset.aget(
+                **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+            )
+        except (
+            queryset.model.DoesNotExist,
+            TypeError,
+            ValueError,
+            ValidationError,
+        ) as ex:
+            raise Http404 from ex
+
+        await sync_to_async(self.check_object_permissions)(self.request, model)
+
+        return model
+
+    async def apaginate_queryset(self, queryset):
+        """Paginate a queryset with the async ORM, if the paginator supports
+        it. Else, the queryset is paginated in a thread.
+
+        Args:
+            queryset: The queryset to paginate.
+
+        Returns:
+            The models in the page or None if the request isn't paginated.
+        """
+        paginator = self.paginator
+        if paginator is None:
+            return None
+
+        apaginate_queryset = getattr(paginator, "apaginate_queryset", None)
+        if apaginate_queryset is None:
+            return await sync_to_async(paginator.paginate_queryset)(
+                queryset, self.request, view=self
+            )
+
+        return await apaginate_queryset(queryset, self.request, view=self)
+
+    async def aserialize(self, *args, **kwargs):
+        """Serialize data in a thread, as serializers may lazily query the
+        database.
+
+        Returns:
+            The serialized data.
+        """
+        return await sync_to_async(
+            lambda: self.get_serializer(*args, **kwargs).data
+        )()
+
+    # pylint: disable-next=missing-function-docstring,invalid-overridden-method
+    async def list(  # type: ignore[override]
+        self, request: Request[RequestUser], *args, **kwargs
+    ):
+        # Conditional and cached responses are resolved in a thread.
+        if (
+            self.last_modified_field is not None
+            or self.response_cache_timeout is not None
+        ):
+            return await sync_to_async(super().list)(request, *args, **kwargs)
+
+        queryset = await self.aget_filtered_queryset()
+
+        page = await self.apaginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(
+                await self.aserialize(page, many=True)
+            )
+
+        models = [model async for model in queryset]
+        return Response(await self.aserialize(models, many=True))
+
+    # pylint: disable-next=missing-function-docstring,invalid-overridden-method
+    async def retrieve(  # type: ignore[override]
+        self, request: Request[RequestUser], *args, **kwargs
+    ):
+        # Conditional and cached responses are resolved in a thread.
+        if (
+            self.last_modified_field is not None
+            or self.response_cache_timeout is not None
+        ):
+            return await sync_to_async(super().retrieve)(
+                request, *args, **kwargs
+            )
+
+        return Response(await self.aserialize(await self.aget_object()))
@@ -0,0 +1,149 @@
+"""
+© Ocado Group
+Created on 19/10/2026 at 22:05:18(+01:00).
+"""
+
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import AsyncClient, override_settings
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework.routers import DefaultRouter
+
+from ..tests import APITestCase
+from ..urls import get_urlpatterns
+from ..user.models import AdminSchoolTeacherUser, School, User
+from ..user.serializers import SchoolSerializer
+from .async_model import AsyncModelViewSet
+
+
+# pylint: disable-next=missing-class-docstring,too-many-ancestors
+class AsyncSchoolViewSet(AsyncModelViewSet[User, School]):
+    request_user_class = User
+    model_class = School
+    http_method_names = ["get"]
+    serializer_class = SchoolSerializer
+
+    # pylint: disable-next=missing-function-docstring
+    def get_queryset(self):
+        return School.objects.order_by("pk")
+
+    @action(detail=False)
+    # pylint: disable-next=missing-function-docstring
+    def names(self, request, *args, **kwargs):
+        return Response(
+            list(self.get_queryset().values_list("name", flat=True))
+        )
+
+
+router = DefaultRouter()
+router.register("async-schools", AsyncSchoolViewSet, basename="async-school")
+
+urlpatterns = get_urlpatterns(router.urls)
+
+
+@override_settings(ROOT_URLCONF=__name__)
+# pylint: disable-next=missing-class-docstring,too-many-ancestors
+class TestAsyncModelViewSet(APITestCase[User]):
+    request_user_class = User
+    fixtures = ["school_1"]
+
+    def setUp(self):
+        user = AdminSchoolTeacherUser.objects.get(
+            email="admin.teacher@school1.com"
+        )
+        self.client.login_as(user)
+
+        # Share the logged-in session with the async client.
+        self.async_client.cookies = self.client.cookies
+
+        self.schools = list(School.objects.order_by("pk"))
+        assert self.schools
+
+        # DRF marks the request's transaction for rollback when handling an
+        # exception. Async views aren't run in one, so it would otherwise mark
+        # the test's transaction.
+        set_rollback_patcher = patch("rest_framework.views.set_rollback")
+        set_rollback_patcher.start()
+        self.addCleanup(set_rollback_patcher.stop)
+
+    def assert_schools(self, data, schools):
+        """Assert the serialized schools are the expected schools."""
+        assert [school["id"] for school in data] == [
+            school.pk for school in schools
+        ]
+
+    async def test_list(self):
+        """Can list models with the async ORM and paginator."""
+        response = await self.async_client.get("/async-schools/?limit=1")
+
+        assert response.status_code == status.HTTP_200_OK
+        response_json = response.json()
+        assert response_json["count"] == len(self.schools)
+        self.assert_schools(response_json["data"], self.schools[:1])
+
+    async def test_retrieve(self):
+        """Can retrieve a model with the async ORM."""
+        school = self.schools[0]
+
+        response = await self.async_client.get(f"/async-schools/{school.pk}/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["id"] == school.pk
+
+    async def test_retrieve__not_modified(self):
+        """A conditional request for an unchanged model is answered with a
+        304."""
+        path = f"/async-schools/{self.schools[0].pk}/"
+
+        response = await self.async_client.get(path)
+        etag = response["ETag"]
+
+        response = await self.async_client.get(
+            path, headers={"if-none-match": etag}
+        )
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response["ETag"] == etag
+
+    async def test_retrieve__not_found(self):
+        """Exceptions raised by async handlers are handled."""
+        response = await self.async_client.get("/async-schools/0/")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    async def test_list__unauthenticated(self):
+        """Exceptions raised while initializing the request are handled."""
+        response = await AsyncClient().get("/async-schools/")
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    async def test_list__cached(self):
+        """Cached responses fall back to the sync list in a thread."""
+        await cache.aclear()
+
+        with patch.object(
+            AsyncSchoolViewSet, "response_cache_timeout", 60
+        ), patch.object(
+            AsyncSchoolViewSet,
+            "get_queryset",
+            side_effect=AsyncSchoolViewSet.get_queryset,
+            autospec=True,
+        ) as get_queryset:
+            response = await self.async_client.get("/async-schools/")
+            assert response.status_code == status.HTTP_200_OK
+            get_queryset.assert_called()
+            get_queryset.reset_mock()
+
+            cached_response = await self.async_client.get("/async-schools/")
+
+        assert cached_response.json() == response.json()
+        get_queryset.assert_not_called()
+
+    async def test_sync_action(self):
+        """Sync actions are run in a thread."""
+        response = await self.async_client.get("/async-schools/names/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == [school.name for school in self.schools]
@@ -3,16 +3,17 @@
 Created on 07/11/2024 at 14:58:38(+00:00).
 """
 
-import json
 import typing as t
 from urllib.parse import quote_plus
 
+import orjson
 from django.conf import settings
 from django.contrib.auth import login
 from django.contrib.auth.views import LoginView
 from django.http import JsonResponse
 from rest_framework import status
 
+from ..encoders import dumps
 from ..forms import BaseLoginForm
 from ..models import AbstractBaseUser
 from ..request import BaseHttpRequest
@@ -38,7 +39,7 @@ class BaseLoginView(
 
     def get_form_kwargs(self):
         form_kwargs = super().get_form_kwargs()
-        form_kwargs["data"] = json.loads(self.request.body)
+        form_kwargs["data"] = orjson.loads(self.request.body)
 
         return form_kwargs
 
@@ -77,13 +78,7 @@ class BaseLoginView(
         response = JsonResponse(session_metadata)
         response.set_cookie(
             key=settings.SESSION_METADATA_COOKIE_NAME,
-            value=quote_plus(
-                json.dumps(
-                    session_metadata,
-                    separators=(",", ":"),
-                    indent=None,
-                )
-            ),
+            value=quote_plus(dumps(session_metadata).decode()),
             max_age=(  # Expires when the session cookie expires.
                 None
                 if settings.SESSION_EXPIRE_AT_BROWSER_CLOSE
@@ -0,0 +1,187 @@
+"""
+© Ocado Group
+Created on 19/10/2026 at 13:20:11(+01:00).
+"""
+
+import json
+import typing as t
+from urllib.parse import urlsplit
+
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.http import Http404, HttpRequest, HttpResponse, QueryDict
+from django.urls import ResolverMatch, resolve
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.serializers import ValidationError
+from rest_framework.views import APIView
+
+from ..permissions import IsAuthenticated
+from ..types import JsonDict
+
+
+class BatchView(APIView):
+    """A view to make many read requests in one round trip.
+
+    The request's body is a list of sub-requests, each with the path (and
+    query) of the view to get. For example:
+
+    POST /batch/
+    [{"path": "/users/?limit=10"}, {"path": "/classes/"}]
+
+    Each sub-request is handled by its view, after the batch's request has been
+    authenticated, and shares the batch's session and user. Each view still
+    checks its own permissions and throttles. The response's body is a list of
+    the sub-responses, in the same order as the sub-requests:
+
+    [{"status": 200, "data": {...}}, {"status": 200, "data": {...}}]
+    """
+
+    http_method_names = ["post"]
+    permission_classes = [IsAuthenticated]
+    # The max number of sub-requests per batch.
+    max_requests = 10
+
+    # Headers that would change the sub-responses.
+    excluded_headers = {
+        "CONTENT_LENGTH",
+        "CONTENT_TYPE",
+        "HTTP_IF_MATCH",
+        "HTTP_IF_MODIFIED_SINCE",
+        "HTTP_IF_NONE_MATCH",
+        "HTTP_IF_UNMODIFIED_SINCE",
+    }
+
+    def get_paths(self, request: Request) -> t.List[str]:
+        """Get the paths of the sub-requests from the request's body.
+
+        Args:
+            request: The batch's request.
+
+        Returns:
+            The paths of the sub-requests.
+        """
+        data = request.data
+        if not isinstance(data, list):
+            raise ValidationError(
+                "Expected a list of sub-requests.", code="not_a_list"
+            )
+        if len(data) == 0:
+            raise ValidationError(
+                "Nothing to request.", code="nothing_to_request"
+            )
+        if len(data) > self.max_requests:
+            raise ValidationError(
+                f"Can't make more than {self.max_requests} requests.",
+                code="too_many_requests",
+            )
+
+        paths: t.List[str] = []
+        for sub_request in data:
+            if not (
+                isinstance(sub_request, dict)
+                and isinstance(sub_request.get("path"), str)
+                and sub_request["path"].startswith("/")
+            ):
+                raise ValidationError(
+                    "Each sub-request must have an absolute path.",
+                    code="invalid_sub_request",
+                )
+            if sub_request.get("method", "GET").upper() != "GET":
+                raise ValidationError(
+                    "Only GET sub-requests are allowed.",
+                    code="method_not_allowed",
+                )
+
+            paths.append(sub_request["path"])
+
+        return paths
+
+    def make_sub_request(self, request: Request, path: str):
+        """Make a GET request which shares the batch's request context.
+
+        Args:
+            request: The batch's request.
+            path: The path (and query) of the sub-request.
+
+        Returns:
+            The sub-request.
+        """
+        # pylint: disable-next=protected-access
+        http_request: HttpRequest = request._request
+        url = urlsplit(path)
+
+        sub_request = HttpRequest()
+        sub_request.method = "GET"
+        sub_request.path = sub_request.path_info = url.path
+        sub_request.META = {
+            key: value
+            for key, value in http_request.META.items()
+            if key not in self.excluded_headers
+        }
+        sub_request.META.update(
+            {
+                "REQUEST_METHOD": "GET",
+                "PATH_INFO": url.path,
+                "QUERY_STRING": url.query,
+            }
+        )
+        sub_request.GET = QueryDict(url.query)
+        sub_request.COOKIES = http_request.COOKIES
+
+        # Share the already loaded session and user.
+        for attr in ["session", "user", "urlconf"]:
+            if hasattr(http_request, attr):
+                setattr(sub_request, attr, getattr(http_request, attr))
+
+        return sub_request
+
+    def get_sub_response(self, sub_request: HttpRequest) -> JsonDict:
+        """Get the response of a sub-request from its view.
+
+        Args:
+            sub_request: The sub-request.
+
+        Returns:
+            The status and data of the sub-response.
+        """
+        try:
+            match: ResolverMatch = resolve(
+                sub_request.path_info, getattr(sub_request, "urlconf", None)
+            )
+        except Http404:
+            return {"status": status.HTTP_404_NOT_FOUND, "data": None}
+
+        view_class = getattr(
+            match.func, "cls", getattr(match.func, "view_class", None)
+        )
+        if isinstance(view_class, type) and issubclass(view_class, BatchView):
+            return {
+                "status": status.HTTP_400_BAD_REQUEST,
+                "data": {"detail": "Batch requests can't be nested."},
+            }
+
+        sub_request.resolver_match = match
+        view = match.func
+        if iscoroutinefunction(view):
+            view = async_to_sync(view)
+
+        response: HttpResponse = view(sub_request, *match.args, **match.kwargs)
+
+        if isinstance(response, Response):
+            data = response.data
+        else:
+            data = None
+            if response.get("Content-Type", "").startswith("application/json"):
+                data = json.loads(response.content)
+
+        return {"status": response.status_code, "data": data}
+
+    def post(self, request: Request):
+        """Make each sub-request and return their responses."""
+        return Response(
+            [
+                self.get_sub_response(self.make_sub_request(request, path))
+                for path in self.get_paths(request)
+            ]
+        )
@@ -0,0 +1,68 @@
+"""
+© Ocado Group
+Created on 19/10/2026 at 13:52:40(+01:00).
+"""
+
+from django.test import override_settings
+from rest_framework import status
+
+from ..tests import APITestCase
+from ..urls import get_urlpatterns
+from ..user.models import AdminSchoolTeacherUser, User
+
+urlpatterns = get_urlpatterns([])
+
+
+@override_settings(ROOT_URLCONF=__name__)
+# pylint: disable-next=missing-class-docstring,too-many-ancestors
+class TestBatchView(APITestCase[User]):
+    request_user_class = User
+    fixtures = ["school_1"]
+
+    def setUp(self):
+        self.admin_school_teacher_user = AdminSchoolTeacherUser.objects.get(
+            email="admin.teacher@school1.com"
+        )
+        self.client.login_as(self.admin_school_teacher_user)
+
+    def test_post(self):
+        """Each sub-request is handled by its view."""
+        klass = self.admin_school_teacher_user.teacher.classes.first()
+        assert klass
+
+        response = self.client.post(
+            "/batch/",
+            data=[
+                {"path": "/users/?limit=1"},
+                {"path": f"/classes/{klass.access_code}/"},
+                {"path": "/classes/ZZ999/"},
+                {"path": "/does-not-exist/"},
+                {"path": "/batch/"},
+            ],
+            status_code_assertion=status.HTTP_200_OK,
+        )
+
+        users, klass_data, no_class, no_view, batch = response.json()
+        assert users["status"] == status.HTTP_200_OK
+        assert len(users["data"]["data"]) == 1
+        assert klass_data["status"] == status.HTTP_200_OK
+        assert klass_data["data"]["id"] == klass.access_code
+        assert no_class["status"] == status.HTTP_404_NOT_FOUND
+        assert no_view["status"] == status.HTTP_404_NOT_FOUND
+        assert batch["status"] == status.HTTP_400_BAD_REQUEST
+
+    def test_post__too_many_requests(self):
+        """Can't make more than the max number of sub-requests."""
+        self.client.post(
+            "/batch/",
+            data=[{"path": "/users/"}] * 11,
+            status_code_assertion=status.HTTP_400_BAD_REQUEST,
+        )
+
+    def test_post__method_not_allowed(self):
+        """Only GET sub-requests are allowed."""
+        self.client.post(
+            "/batch/",
+            data=[{"method": "DELETE", "path": "/users/"}],
+            status_code_assertion=status.HTTP_400_BAD_REQUEST,
+        )
@@ -18,6 +18,7 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from .. import mail
 from ..permissions import AllowAny
 
 HealthStatus = t.Literal[
@@ -75,6 +76,7 @@ class HealthCheckView(APIView):
             return HealthCheck(
                 health_status="healthy",
                 additional_info="All healthy.",
+                details=self.get_mail_health_details(),
             )
         # pylint: disable-next=broad-exception-caught
         except Exception as ex:
@@ -83,6 +85,29 @@ class HealthCheckView(APIView):
                 additional_info=str(ex),
             )
 
+    def get_mail_health_details(self):
+        """Get the state of Dotdigital's circuit breaker in each region that
+        has been called.
+
+        An open circuit doesn't make the service unhealthy, as mail is sent
+        through the outbox once the circuit closes.
+        """
+        return [
+            HealthCheck.Detail(
+                name=f"mail:{region}",
+                description=(
+                    f"The circuit breaker of Dotdigital's {region} region is"
+                    f" {circuit_breaker.state}."
+                ),
+                health=(
+                    "healthy"
+                    if circuit_breaker.state == "closed"
+                    else "unhealthy"
+                ),
+            )
+            for region, circuit_breaker in mail.get_circuit_breakers().items()
+        ]
+
     def get(self, request: Request):
         """Return a health check for the current service."""
         health_check = self.get_health_check(request)
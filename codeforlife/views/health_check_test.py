@@ -0,0 +1,50 @@
+"""
+© Ocado Group
+Created on 19/10/2026 at 20:24:13(+01:00).
+"""
+
+from unittest.mock import patch
+
+from django.test import override_settings
+
+from .. import mail
+from ..tests import TestCase
+from ..urls import get_urlpatterns
+
+urlpatterns = get_urlpatterns([])
+
+
+@override_settings(ROOT_URLCONF=__name__)
+# pylint: disable-next=missing-class-docstring
+class TestHealthCheckView(TestCase):
+    def setUp(self):
+        mail.reset_circuit_breakers()
+        self.addCleanup(mail.reset_circuit_breakers)
+
+    def test_get__mail_circuit_breaker(self):
+        """The state of each region's circuit breaker is a health detail, but
+        an open circuit doesn't make the service unhealthy."""
+        mail.get_circuit_breaker("r1")
+        with patch.object(
+            mail.get_circuit_breaker("r2"), "_opened_at", 0
+        ), patch.object(mail.CircuitBreaker, "open_duration", float("inf")):
+            response = self.client.get("/health-check/")
+
+        assert response.status_code == 200
+        assert response.json()["healthStatus"] == "healthy"
+        assert response.json()["details"] == [
+            {
+                "name": "mail:r1",
+                "description": (
+                    "The circuit breaker of Dotdigital's r1 region is closed."
+                ),
+                "health": "healthy",
+            },
+            {
+                "name": "mail:r2",
+                "description": (
+                    "The circuit breaker of Dotdigital's r2 region is open."
+                ),
+                "health": "unhealthy",
+            },
+        ]
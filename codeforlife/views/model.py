@@ -3,11 +3,18 @@
 Created on 24/01/2024 at 13:08:23(+00:00).
 """
 
+import logging
 import typing as t
 from functools import cached_property
+from hashlib import md5
 
-from django.db.models import Model
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Max, Model
 from django.db.models.query import QuerySet
+from django.http import HttpResponseBase
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.serializers import ListSerializer
@@ -15,6 +22,7 @@ from rest_framework.viewsets import ModelViewSet as DrfModelViewSet
 
 from ..permissions import Permission
 from ..request import BaseRequest, Request
+from ..response_cache import get_generations
 from ..types import KwArgs
 from .api import APIView, BaseAPIView
 from .decorators import action
@@ -67,6 +75,29 @@ class BaseModelViewSet(
 
     REQUIRED_ATTRS: t.Set[str] = {"request_class", "model_class"}
 
+    # The actions whose responses have an ETag and which answer conditional
+    # requests (If-None-Match, If-Modified-Since) with a 304.
+    conditional_actions: t.Set[str] = {"list", "retrieve"}
+    # The name of the model's field holding when it was last modified. If set,
+    # the ETag and Last-Modified are derived from an aggregate query. Else, if
+    # the responses are cached, the ETag is derived from the response's cache
+    # key. Either way, a conditional request is answered before serializing
+    # any models. Else, the ETag is a hash of the response's content.
+    last_modified_field: t.Optional[str] = None
+    _conditional_headers: t.Optional[t.Tuple[str, t.Optional[int]]] = None
+
+    # How many seconds to cache the responses of list and retrieve for. If
+    # None, the responses are not cached. A retrieve still gets the model, to
+    # check the requester's permissions, before using a cached response. The
+    # default cache must be shared by all of the service's processes, see
+    # codeforlife.response_cache.
+    response_cache_timeout: t.Optional[int] = None
+    # The other models the responses depend on. Saving or deleting one of
+    # these, or one of this view set's models, invalidates the responses. See
+    # codeforlife.response_cache for the changes which don't.
+    response_cache_models: t.Tuple[t.Type[Model], ...] = ()
+    _response_cache_key: t.Optional[str] = None
+
     @cached_property
     def lookup_field_name(self):
         """The name of the lookup field."""
@@ -115,6 +146,264 @@ class BaseModelViewSet(
 
         return serializer
 
+    def get_model_serializer(self):
+        """Get an instance of the serializer to inspect its fields.
+
+        Returns:
+            The serializer or None if it's not a model serializer.
+        """
+        # pylint: disable-next=import-outside-toplevel
+        from ..serializers import BaseModelSerializer
+
+        serializer = self.get_serializer_class()(
+            context=self.get_serializer_context()
+        )
+
+        return (
+            serializer if isinstance(serializer, BaseModelSerializer) else None
+        )
+
+    def only_serializer_fields(self, queryset: QuerySet[AnyModel]):
+        """Only load the columns the serializer needs.
+
+        If the serializer's fields can't be mapped to the model's columns, or
+        if the models are being destroyed, all the columns are loaded.
+
+        Args:
+            queryset: The queryset to prune.
+
+        Returns:
+            The pruned queryset.
+        """
+        if self.request.method == "DELETE":
+            return queryset
+
+        serializer = self.get_model_serializer()
+        if serializer is None:
+            return queryset
+
+        names = serializer.get_model_field_names()
+        if names is None:
+            return queryset
+
+        if "__" not in self.lookup_field:
+            names.add(self.lookup_field)
+
+        return queryset.only(*names)
+
+    def load_serializer_relations(self, queryset: QuerySet[AnyModel]):
+        """Select and prefetch the related models the serializer traverses, so
+        each serialized model doesn't lazily load its relations one by one.
+
+        Args:
+            queryset: The queryset to load the related models with.
+
+        Returns:
+            The queryset loading the related models.
+        """
+        serializer = self.get_model_serializer()
+        if serializer is None:
+            return queryset
+
+        select_related, prefetch_related = serializer.get_related_names()
+        if select_related:
+            queryset = queryset.select_related(*sorted(select_related))
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*sorted(prefetch_related))
+
+        return queryset
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+
+        if self.action in ("list", "retrieve"):
+            queryset = self.load_serializer_relations(queryset)
+
+            # Prune the columns not in a sparse fieldset.
+            serializer = self.get_model_serializer()
+            if (
+                serializer is not None
+                and serializer.get_sparse_field_names() is not None
+            ):
+                queryset = self.only_serializer_fields(queryset)
+
+        return queryset
+
+    def get_conditional_queryset(self):
+        """Get the queryset whose models the response depends on.
+
+        Returns:
+            The filtered queryset, narrowed to one model if retrieving.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.action == "retrieve":
+            lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+            queryset = queryset.filter(
+                **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+            )
+
+        return queryset
+
+    def get_conditional_headers(
+        self,
+    ) -> t.Optional[t.Tuple[str, t.Optional[int]]]:
+        """Get the ETag and Last-Modified of the response without serializing
+        the models it depends on.
+
+        If last_modified_field is set, they're derived from an aggregate of the
+        models. Else, if the responses are cached, the ETag is derived from the
+        response's cache key, which changes whenever the models it depends on
+        change, and there's no Last-Modified.
+
+        Returns:
+            The ETag and the last-modified timestamp, or None if they can't be
+            derived without serializing the models.
+        """
+        if (
+            self.action not in self.conditional_actions
+            or self.request.method not in ("GET", "HEAD")
+        ):
+            return None
+
+        if self.last_modified_field is None:
+            if self.response_cache_timeout is None:
+                return None
+
+            # Reused by the response cache, so the key is only got once.
+            key = self._response_cache_key = self.get_response_cache_key()
+            digest = md5(key.encode(), usedforsecurity=False).hexdigest()
+
+            return f'W/"{digest}"', None
+
+        aggregate = self.get_conditional_queryset().aggregate(
+            count=Count("pk"),
+            last_modified=Max(self.last_modified_field),
+        )
+        if aggregate["last_modified"] is None:
+            return None
+
+        # The response also depends on who requested which page.
+        digest = md5(
+            ":".join(
+                [
+                    str(self.request.user.pk),
+                    self.request.get_full_path(),
+                    str(aggregate["count"]),
+                    aggregate["last_modified"].isoformat(),
+                ]
+            ).encode(),
+            usedforsecurity=False,
+        ).hexdigest()
+
+        return f'W/"{digest}"', int(aggregate["last_modified"].timestamp())
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+
+        if (
+            self.action not in self.conditional_actions
+            or request.method not in ("GET", "HEAD")
+            or response.status_code != status.HTTP_200_OK
+        ):
+            return response
+
+        headers = self._conditional_headers
+        if headers is None:
+            if not isinstance(response, Response):
+                return response
+
+            response.render()
+            digest = md5(response.content, usedforsecurity=False).hexdigest()
+            etag, last_modified = f'W/"{digest}"', None
+        else:
+            etag, last_modified = headers
+
+        response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified)
+
+        return get_conditional_response(
+            request,
+            etag=etag,
+            last_modified=last_modified,
+            response=response,
+        )
+
+    def get_response_cache_scope(self):
+        """Get the scope of the data the response depends on. Requesters in the
+        same scope share cached responses.
+
+        Returns:
+            The scope, which is the requesting user by default.
+        """
+        return f"user:{self.request.user.pk}"
+
+    def get_response_cache_key(self):
+        """Get the key of the response in the cache.
+
+        Returns:
+            The key, made of the view set, action, scope, path (including the
+            query string) and the current generations of the models.
+        """
+        view_set_class = type(self)
+        generations = get_generations(
+            (self.model_class, *self.response_cache_models)
+        )
+
+        return ":".join(
+            [
+                "response_cache",
+                f"{view_set_class.__module__}.{view_set_class.__qualname__}",
+                t.cast(str, self.action),
+                self.get_response_cache_scope(),
+                md5(
+                    self.request.get_full_path().encode(),
+                    usedforsecurity=False,
+                ).hexdigest(),
+                *(str(generation) for generation in generations),
+            ]
+        )
+
+    def _get_cached_response(
+        self,
+        get_response: t.Callable[..., Response],
+        request: AnyBaseRequest,
+        *args,
+        **kwargs,
+    ):
+        if self.response_cache_timeout is None or request.method not in (
+            "GET",
+            "HEAD",
+        ):
+            return get_response(request, *args, **kwargs)
+
+        key = self._response_cache_key or self.get_response_cache_key()
+        data = cache.get(key)
+        if data is not None:
+            return Response(data)
+
+        response = get_response(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            cache.set(key, response.data, timeout=self.response_cache_timeout)
+
+        return response
+
+    def _get_not_modified_response(self) -> t.Optional[HttpResponseBase]:
+        headers = self._conditional_headers = self.get_conditional_headers()
+        if headers is None:
+            return None
+
+        etag, last_modified = headers
+        response = get_conditional_response(
+            self.request, etag=etag, last_modified=last_modified
+        )
+        if response is not None:
+            response["ETag"] = etag
+            if last_modified is not None:
+                response["Last-Modified"] = http_date(last_modified)
+
+        return response
+
     # pylint: disable=useless-parent-delegation
 
     def destroy(  # type: ignore[override] # pragma: no cover
@@ -127,15 +416,35 @@ class BaseModelViewSet(
     ):
         return super().create(request, *args, **kwargs)
 
+    # pylint: enable=useless-parent-delegation
+
     def list(  # type: ignore[override] # pragma: no cover
         self, request: AnyBaseRequest, *args, **kwargs
     ):
-        return super().list(request, *args, **kwargs)
+        response = self._get_not_modified_response()
+        if response is not None:
+            return response
+
+        return self._get_cached_response(super().list, request, *args, **kwargs)
 
     def retrieve(  # type: ignore[override] # pragma: no cover
         self, request: AnyBaseRequest, *args, **kwargs
     ):
-        return super().retrieve(request, *args, **kwargs)
+        # Get the model first, so a not-modified or cached response is only
+        # returned if the requester may still retrieve the model.
+        instance = self.get_object()
+
+        response = self._get_not_modified_response()
+        if response is not None:
+            return response
+
+        # pylint: disable-next=unused-argument
+        def get_response(*args, **kwargs):
+            return Response(self.get_serializer(instance).data)
+
+        return self._get_cached_response(get_response, request, *args, **kwargs)
+
+    # pylint: disable=useless-parent-delegation
 
     def update(  # type: ignore[override] # pragma: no cover
         self, request: AnyBaseRequest, *args, **kwargs
@@ -168,6 +477,31 @@ class ModelViewSet(
         "model_class",
     }
 
+    # The max number of models to delete per transaction in a bulk destroy. If
+    # None, all models are deleted in one statement within the request's
+    # transaction. If set, the bulk action is excluded from the request's
+    # transaction so the locks of each chunk are released once it's committed.
+    bulk_destroy_chunk_size: t.Optional[int] = None
+
+    # Whether the bulk actions only load the columns the serializer reads or
+    # writes. Off by default, as any other column read while updating the
+    # models (e.g. by a model's save or a custom update) is then loaded with one
+    # query per model.
+    bulk_only_serializer_fields = False
+
+    @classmethod
+    def as_view(cls, actions=None, **initkwargs):
+        view = super().as_view(actions, **initkwargs)
+
+        # Each chunk of a bulk destroy is committed in its own transaction.
+        if (
+            cls.bulk_destroy_chunk_size is not None
+            and "bulk" in (actions or {}).values()
+        ):
+            view = transaction.non_atomic_requests(view)
+
+        return view
+
     def get_bulk_queryset(self, lookup_values: t.Collection):
         """Get the queryset for a bulk action.
 
@@ -177,9 +511,13 @@ class ModelViewSet(
         Returns:
             A queryset containing the matching models.
         """
-        return self.get_queryset().filter(
+        queryset = self.get_queryset().filter(
             **{f"{self.lookup_field}__in": lookup_values}
         )
+        if self.bulk_only_serializer_fields:
+            queryset = self.only_serializer_fields(queryset)
+
+        return queryset
 
     def bulk_create(self, request: Request[RequestUser]):
         """Bulk create many instances of a model.
@@ -272,10 +610,55 @@ class ModelViewSet(
     def perform_bulk_destroy(self, queryset: QuerySet[AnyModel]):
         """Bulk destroy many instances of a model.
 
+        If a chunk size is set, the models are deleted in chunks of primary keys
+        and each chunk is locked and committed in its own transaction. Each
+        chunk is still deleted via Django's collector, which issues raw deletes
+        (without loading the models into memory) wherever no signals or
+        cascades need them. NOTE: if a chunk fails, the previous chunks remain
+        deleted.
+
         Args:
             queryset: A queryset of the models to delete.
         """
-        queryset.delete()
+        chunk_size = self.bulk_destroy_chunk_size
+        if chunk_size is None:
+            queryset.delete()
+            return
+
+        pks = list(queryset.order_by("pk").values_list("pk", flat=True))
+
+        destroyed = 0
+        for index in range(0, len(pks), chunk_size):
+            chunk = pks[index : index + chunk_size]
+            with transaction.atomic():
+                # Lock the chunk's models in order of their primary keys, so
+                # concurrent bulk destroys don't deadlock. NOTE: Filter the
+                # original queryset again so models that have left its scope
+                # since the primary keys were read are skipped.
+                locked = list(
+                    queryset.filter(pk__in=chunk)
+                    .order_by("pk")
+                    .select_for_update(of=("self",))
+                    .values_list("pk", flat=True)
+                )
+                _, deleted = queryset.filter(pk__in=locked).delete()
+
+            destroyed += deleted.get(self.model_class._meta.label, 0)
+            self.bulk_destroy_progress(destroyed, total=len(pks))
+
+    def bulk_destroy_progress(self, destroyed: int, total: int):
+        """Report the progress of a chunked bulk destroy.
+
+        Args:
+            destroyed: The number of models destroyed so far.
+            total: The total number of models to destroy.
+        """
+        logging.info(
+            "Bulk destroyed %d/%d %s.",
+            destroyed,
+            total,
+            self.model_class._meta.verbose_name_plural,
+        )
 
     @action(detail=False, methods=["post", "patch", "delete"])
     def bulk(self, request: Request[RequestUser]):
@@ -287,11 +670,19 @@ class ModelViewSet(
         Returns:
             A HTTP response.
         """
-        return {
+        method = t.cast(str, request.method)
+        handler = {
             "POST": self.bulk_create,
             "PATCH": self.bulk_partial_update,
             "DELETE": self.bulk_destroy,
-        }[t.cast(str, request.method)](request)
+        }[method]
+
+        # Bulk creates and updates remain atomic if the bulk action is not.
+        if self.bulk_destroy_chunk_size is not None and method != "DELETE":
+            with transaction.atomic():
+                return handler(request)
+
+        return handler(request)
 
     @staticmethod
     def _update_action(
@@ -0,0 +1,168 @@
+"""
+© Ocado Group
+Created on 19/10/2026 at 23:12:46(+01:00).
+"""
+
+from datetime import timedelta
+from unittest.mock import call, patch
+
+from common.models import DynamicElement  # type: ignore[import-untyped]
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connection
+from django.db.models import QuerySet
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.utils.http import http_date
+from rest_framework import status
+
+from ..serializers import ModelSerializer
+from ..tests import APIRequestFactory, TestCase
+from ..tests.dynamic_element import DynamicElementViewSet
+from ..user.models import Class, User
+from .model import ModelViewSet
+
+# pylint: disable=missing-class-docstring,too-many-ancestors,too-few-public-methods
+
+
+class ClassSerializer(ModelSerializer[User, Class]):
+    class Meta:
+        model = Class
+        fields = ["id", "name"]
+
+
+class LastModifiedClassViewSet(ModelViewSet[User, Class]):
+    request_user_class = User
+    model_class = Class
+    serializer_class = ClassSerializer
+    last_modified_field = "creation_time"
+
+    # pylint: disable-next=missing-function-docstring
+    def get_queryset(self):
+        return Class.objects.all()
+
+
+# pylint: enable=missing-class-docstring,too-many-ancestors,too-few-public-methods
+
+
+# pylint: disable-next=missing-class-docstring
+class TestModelViewSet(TestCase):
+    def setUp(self):
+        self.elements = [
+            DynamicElement.objects.create(name=f"element {index}")
+            for index in range(5)
+        ]
+        self.queryset = DynamicElement.objects.filter(
+            pk__in=[element.pk for element in self.elements]
+        )
+
+    def test_as_view__bulk_destroy_chunk_size(self):
+        """Only the bulk action of a view set which chunks bulk destroys is
+        excluded from the request's transaction."""
+
+        def is_atomic(viewset_class, actions):
+            view = viewset_class.as_view(actions)
+            non_atomic_requests = getattr(view, "_non_atomic_requests", set())
+            return DEFAULT_DB_ALIAS not in non_atomic_requests
+
+        assert not is_atomic(DynamicElementViewSet, {"delete": "bulk"})
+        assert is_atomic(DynamicElementViewSet, {"get": "list"})
+        with patch.object(
+            DynamicElementViewSet, "bulk_destroy_chunk_size", None
+        ):
+            assert is_atomic(DynamicElementViewSet, {"delete": "bulk"})
+
+    def test_get_bulk_queryset(self):
+        """Bulk querysets only load the serializer's columns if opted in."""
+        request = APIRequestFactory(User).patch()
+        view = DynamicElementViewSet(request=request, format_kwarg=None)
+        lookup_values = [element.pk for element in self.elements]
+
+        queryset = view.get_bulk_queryset(lookup_values)
+        assert not queryset.query.deferred_loading[0]
+
+        with patch.object(
+            DynamicElementViewSet, "bulk_only_serializer_fields", True
+        ):
+            queryset = view.get_bulk_queryset(lookup_values)
+        deferred_loading = queryset.query.deferred_loading
+        assert deferred_loading == ({"id", "name", "active", "text"}, False)
+        assert list(queryset.order_by("pk")) == self.elements
+
+    def test_perform_bulk_destroy(self):
+        """Models are locked and destroyed in chunks and the progress is
+        reported after each chunk."""
+        view = DynamicElementViewSet()
+
+        with patch.object(
+            view, "bulk_destroy_progress"
+        ) as progress, CaptureQueriesContext(connection) as captured:
+            view.perform_bulk_destroy(self.queryset)
+
+        lock_queries = [
+            query
+            for query in captured.captured_queries
+            if query["sql"].endswith('FOR UPDATE OF "common_dynamicelement"')
+        ]
+        assert len(lock_queries) == 3
+        assert progress.call_args_list == [
+            call(2, total=5),
+            call(4, total=5),
+            call(5, total=5),
+        ]
+        assert not self.queryset.exists()
+
+    def test_perform_bulk_destroy__chunk_failed(self):
+        """The chunks destroyed before a chunk fails remain destroyed."""
+        view = DynamicElementViewSet()
+        delete = QuerySet.delete
+        deleted_querysets = []
+
+        def delete_first_chunk(queryset):
+            if deleted_querysets:
+                raise DatabaseError("Injected.")
+
+            deleted_querysets.append(queryset)
+            return delete(queryset)
+
+        with patch.object(
+            QuerySet, "delete", autospec=True, side_effect=delete_first_chunk
+        ), patch.object(view, "bulk_destroy_progress") as progress:
+            with self.assertRaises(DatabaseError):
+                view.perform_bulk_destroy(self.queryset)
+
+        progress.assert_called_once_with(2, total=5)
+        assert list(self.queryset.order_by("pk")) == self.elements[2:]
+
+    def test_get_conditional_headers__last_modified_field(self):
+        """The ETag and Last-Modified are derived from an aggregate of the
+        models, and change when a model is modified."""
+        Class.objects.update(creation_time=timezone.now() - timedelta(days=1))
+        request = APIRequestFactory(User).get()
+
+        def get_view():
+            return LastModifiedClassViewSet(
+                request=request, format_kwarg=None, action="list", kwargs={}
+            )
+
+        with self.assertNumQueries(1):
+            etag, last_modified = get_view().get_conditional_headers()
+        assert etag.startswith('W/"')
+        last_modified_class = Class.objects.order_by("-creation_time").first()
+        assert last_modified_class
+        assert last_modified == int(
+            last_modified_class.creation_time.timestamp()
+        )
+
+        request.META["HTTP_IF_NONE_MATCH"] = etag
+        # pylint: disable-next=protected-access
+        response = get_view()._get_not_modified_response()
+        assert response
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response["ETag"] == etag
+        assert response["Last-Modified"] == http_date(last_modified)
+
+        last_modified_class.creation_time = timezone.now()
+        last_modified_class.save()
+
+        # pylint: disable-next=protected-access
+        assert get_view()._get_not_modified_response() is None
+        assert get_view().get_conditional_headers() != (etag, last_modified)